@@ -1,10 +1,48 @@
 """ComputerBuilder implementation with fluent interface."""
 
-from typing import Optional, Self
+from types import MappingProxyType
+from typing import Any, Mapping, Optional, Self
 
 from .computer import Computer
 from .components import CPU, RAM, GPU, Motherboard, PowerSupply
 
+# Preset specs: positional with_* arguments per component, shared read-only
+_BUDGET_GAMING = MappingProxyType({
+    "cpu": ("Intel Core i5-12400F", 6, 2.5, "LGA1700", 65),
+    "motherboard": ("MSI B660M PRO-VDH", "LGA1700", "DDR4", 128, 2),
+    "ram": (16, 3200, "DDR4", 2),
+    "gpu": ("RTX 3060", 12, 170, "PCIe 4.0 x16"),
+    "power_supply": ("Corsair CV650", 650, "80+ Bronze", False),
+    "name": "Budget Gaming PC",
+})
+
+_HIGH_END_GAMING = MappingProxyType({
+    "cpu": ("Intel Core i7-13700K", 16, 3.4, "LGA1700", 125),
+    "motherboard": ("ASUS ROG Strix Z790-E", "LGA1700", "DDR5", 128, 4),
+    "ram": (32, 5600, "DDR5", 2),
+    "gpu": ("RTX 4080", 16, 320, "PCIe 4.0 x16"),
+    "power_supply": ("Corsair RM850x", 850, "80+ Gold", True),
+    "name": "High-End Gaming PC",
+})
+
+_DEVELOPMENT_WORKSTATION = MappingProxyType({
+    "cpu": ("Intel Core i9-13900K", 24, 3.0, "LGA1700", 125),
+    "motherboard": ("ASUS ProArt Z790-CREATOR", "LGA1700", "DDR5", 128, 4),
+    "ram": (64, 5600, "DDR5", 4),
+    "gpu": ("RTX 4070", 12, 200, "PCIe 4.0 x16"),
+    "power_supply": ("Seasonic Focus GX-750", 750, "80+ Gold", True),
+    "name": "Development Workstation",
+})
+
+_CONTENT_CREATION = MappingProxyType({
+    "cpu": ("AMD Ryzen 9 7950X", 16, 4.5, "AM5", 170),
+    "motherboard": ("ASUS ROG Crosshair X670E Hero", "AM5", "DDR5", 128, 4),
+    "ram": (128, 5600, "DDR5", 4),
+    "gpu": ("RTX 4090", 24, 450, "PCIe 4.0 x16"),
+    "power_supply": ("Corsair AX1000", 1000, "80+ Titanium", True),
+    "name": "Content Creation Workstation",
+})
+
 
 class ComputerBuilder:
     """Builder for constructing Computer objects with fluent interface."""
@@ -17,6 +55,12 @@ class ComputerBuilder:
         self._gpu: Optional[GPU] = None
         self._power_supply: Optional[PowerSupply] = None
         self._name: Optional[str] = None
+        # Display values kept in step by the with_* methods, read through a
+        # live read-only view instead of being rebuilt on every query
+        self._config: dict[str, Optional[str]] = dict.fromkeys(
+            ("cpu", "motherboard", "ram", "gpu", "power_supply", "name")
+        )
+        self._config_view = MappingProxyType(self._config)
     
     def with_cpu(
         self, 
@@ -28,6 +72,7 @@ class ComputerBuilder:
     ) -> Self:
         """Add CPU component to the build."""
         self._cpu = CPU(model=model, cores=cores, frequency=frequency, socket=socket, tdp=tdp)
+        self._config["cpu"] = model
         return self
     
     def with_motherboard(
@@ -46,11 +91,13 @@ class ComputerBuilder:
             max_ram=max_ram, 
             pcie_slots=pcie_slots
         )
+        self._config["motherboard"] = model
         return self
     
     def with_ram(self, capacity: int, speed: int, type: str, modules: int = 1) -> Self:
         """Add RAM component to the build."""
         self._ram = RAM(capacity=capacity, speed=speed, type=type, modules=modules)
+        self._config["ram"] = f"{capacity}GB {type}"
         return self
     
     def with_gpu(self, model: str, vram: int, power_consumption: int, interface: str) -> Self:
@@ -61,6 +108,7 @@ class ComputerBuilder:
             power_consumption=power_consumption, 
             interface=interface
         )
+        self._config["gpu"] = model
         return self
     
     def with_power_supply(
@@ -77,11 +125,13 @@ class ComputerBuilder:
             efficiency=efficiency, 
             modular=modular
         )
+        self._config["power_supply"] = f"{model} ({wattage}W)"
         return self
     
     def with_name(self, name: str) -> Self:
         """Set the computer name."""
         self._name = name
+        self._config["name"] = name
         return self
     
     def build(self) -> Computer:
@@ -119,18 +169,26 @@ class ComputerBuilder:
         self._gpu = None
         self._power_supply = None
         self._name = None
+        self._config.update(dict.fromkeys(self._config))
         return self
     
-    def get_current_configuration(self) -> dict[str, Optional[str]]:
-        """Get the current build configuration as a dictionary."""
-        return {
-            "cpu": self._cpu.model if self._cpu else None,
-            "motherboard": self._motherboard.model if self._motherboard else None,
-            "ram": f"{self._ram.capacity}GB {self._ram.type}" if self._ram else None,
-            "gpu": self._gpu.model if self._gpu else None,
-            "power_supply": f"{self._power_supply.model} ({self._power_supply.wattage}W)" if self._power_supply else None,
-            "name": self._name
-        }
+    def _apply_preset(self, preset: Mapping[str, Any]) -> Self:
+        """Configure every component from a preset spec."""
+        return (self
+                .with_cpu(*preset["cpu"])
+                .with_motherboard(*preset["motherboard"])
+                .with_ram(*preset["ram"])
+                .with_gpu(*preset["gpu"])
+                .with_power_supply(*preset["power_supply"])
+                .with_name(preset["name"]))
+    
+    def get_current_configuration(self) -> Mapping[str, Optional[str]]:
+        """Get a live read-only view of the current build configuration.
+        
+        The view reflects later with_* and reset() calls; copy it with dict()
+        to keep a point-in-time configuration.
+        """
+        return self._config_view
 
 
 class GamingComputerBuilder(ComputerBuilder):
@@ -138,23 +196,11 @@ class GamingComputerBuilder(ComputerBuilder):
     
     def budget_gaming(self) -> Self:
         """Configure a budget gaming computer."""
-        return (self
-                .with_cpu("Intel Core i5-12400F", 6, 2.5, "LGA1700", 65)
-                .with_motherboard("MSI B660M PRO-VDH", "LGA1700", "DDR4", 128, 2)
-                .with_ram(16, 3200, "DDR4", 2)
-                .with_gpu("RTX 3060", 12, 170, "PCIe 4.0 x16")
-                .with_power_supply("Corsair CV650", 650, "80+ Bronze", False)
-                .with_name("Budget Gaming PC"))
+        return self._apply_preset(_BUDGET_GAMING)
     
     def high_end_gaming(self) -> Self:
         """Configure a high-end gaming computer."""
-        return (self
-                .with_cpu("Intel Core i7-13700K", 16, 3.4, "LGA1700", 125)
-                .with_motherboard("ASUS ROG Strix Z790-E", "LGA1700", "DDR5", 128, 4)
-                .with_ram(32, 5600, "DDR5", 2)
-                .with_gpu("RTX 4080", 16, 320, "PCIe 4.0 x16")
-                .with_power_supply("Corsair RM850x", 850, "80+ Gold", True)
-                .with_name("High-End Gaming PC"))
+        return self._apply_preset(_HIGH_END_GAMING)
 
 
 class WorkstationBuilder(ComputerBuilder):
@@ -162,20 +208,8 @@ class WorkstationBuilder(ComputerBuilder):
     
     def development_workstation(self) -> Self:
         """Configure a development workstation."""
-        return (self
-                .with_cpu("Intel Core i9-13900K", 24, 3.0, "LGA1700", 125)
-                .with_motherboard("ASUS ProArt Z790-CREATOR", "LGA1700", "DDR5", 128, 4)
-                .with_ram(64, 5600, "DDR5", 4)
-                .with_gpu("RTX 4070", 12, 200, "PCIe 4.0 x16")
-                .with_power_supply("Seasonic Focus GX-750", 750, "80+ Gold", True)
-                .with_name("Development Workstation"))
+        return self._apply_preset(_DEVELOPMENT_WORKSTATION)
     
     def content_creation(self) -> Self:
         """Configure a content creation workstation."""
-        return (self
-                .with_cpu("AMD Ryzen 9 7950X", 16, 4.5, "AM5", 170)
-                .with_motherboard("ASUS ROG Crosshair X670E Hero", "AM5", "DDR5", 128, 4)
-                .with_ram(128, 5600, "DDR5", 4)
-                .with_gpu("RTX 4090", 24, 450, "PCIe 4.0 x16")
-                .with_power_supply("Corsair AX1000", 1000, "80+ Titanium", True)
-                .with_name("Content Creation Workstation"))
\ No newline at end of file
+        return self._apply_preset(_CONTENT_CREATION)
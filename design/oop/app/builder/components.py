@@ -1,10 +1,13 @@
-"""Computer components for the Builder pattern."""
+"""Computer components for the Builder pattern.
+
+Components are immutable value objects, validated once on construction.
+"""
 
 from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CPU:
     """Represents a CPU component."""
     
@@ -24,7 +27,7 @@ class CPU:
             raise ValueError("CPU TDP must be positive")
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RAM:
     """Represents a RAM component."""
     
@@ -43,7 +46,7 @@ class RAM:
             raise ValueError("Number of RAM modules must be positive")
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class GPU:
     """Represents a GPU component."""
     
@@ -60,7 +63,7 @@ class GPU:
             raise ValueError("GPU power consumption must be positive")
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Motherboard:
     """Represents a motherboard component."""
     
@@ -78,7 +81,7 @@ class Motherboard:
             raise ValueError("PCIe slots cannot be negative")
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PowerSupply:
     """Represents a power supply component."""
     
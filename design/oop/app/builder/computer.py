@@ -1,14 +1,14 @@
 """Computer class for the Builder pattern."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
 
 from .components import CPU, RAM, GPU, Motherboard, PowerSupply
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Computer:
-    """Represents a complete computer configuration."""
+    """Represents a complete, validated computer configuration."""
     
     cpu: CPU
     motherboard: Motherboard
@@ -16,56 +16,79 @@ class Computer:
     power_supply: PowerSupply
     gpu: Optional[GPU] = None
     name: Optional[str] = None
+    # Components are frozen, so the power draw is summed once on construction
+    _total_power: int = field(init=False, repr=False, compare=False)
+    # Built on first request; a slot rather than cached_property, which
+    # needs an instance __dict__
+    _summary: Optional[str] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self) -> None:
-        """Validate the complete computer configuration."""
+        """Compute the power draw and validate the complete computer configuration."""
+        total_power = self.cpu.tdp
+        if self.gpu:
+            total_power += self.gpu.power_consumption
+        object.__setattr__(self, '_total_power', total_power)
         self._validate_compatibility()
     
     def _validate_compatibility(self) -> None:
-        """Validate component compatibility."""
-        # CPU and motherboard socket compatibility
-        if self.cpu.socket != self.motherboard.socket:
-            raise ValueError(
-                f"CPU socket {self.cpu.socket} incompatible with "
-                f"motherboard socket {self.motherboard.socket}"
-            )
+        """Validate component compatibility, reporting every mismatch at once."""
+        cpu, motherboard, ram, power_supply = self.cpu, self.motherboard, self.ram, self.power_supply
+        errors = []
         
-        # RAM and motherboard compatibility
-        if self.ram.type != self.motherboard.ram_type:
-            raise ValueError(
-                f"RAM type {self.ram.type} incompatible with "
-                f"motherboard RAM type {self.motherboard.ram_type}"
-            )
+        # Socket and RAM type compatibility: one tuple compare on the common
+        # matching path, per-field checks only to word the error
+        if (cpu.socket, ram.type) != (motherboard.socket, motherboard.ram_type):
+            if cpu.socket != motherboard.socket:
+                errors.append(
+                    f"CPU socket {cpu.socket} incompatible with "
+                    f"motherboard socket {motherboard.socket}"
+                )
+            if ram.type != motherboard.ram_type:
+                errors.append(
+                    f"RAM type {ram.type} incompatible with "
+                    f"motherboard RAM type {motherboard.ram_type}"
+                )
         
         # RAM capacity check
-        if self.ram.capacity > self.motherboard.max_ram:
-            raise ValueError(
-                f"RAM capacity {self.ram.capacity}GB exceeds "
-                f"motherboard maximum {self.motherboard.max_ram}GB"
+        if ram.capacity > motherboard.max_ram:
+            errors.append(
+                f"RAM capacity {ram.capacity}GB exceeds "
+                f"motherboard maximum {motherboard.max_ram}GB"
             )
         
-        # Power supply capacity check
-        total_power = self.cpu.tdp
-        if self.gpu:
-            total_power += self.gpu.power_consumption
-        
-        # Add some headroom (20%) for other components and efficiency
-        required_power = int(total_power * 1.2)
-        if self.power_supply.wattage < required_power:
-            raise ValueError(
-                f"Power supply {self.power_supply.wattage}W insufficient for "
+        # Power supply capacity check, with some headroom (20%) for other
+        # components and efficiency
+        required_power = int(self._total_power * 1.2)
+        if power_supply.wattage < required_power:
+            errors.append(
+                f"Power supply {power_supply.wattage}W insufficient for "
                 f"system requiring ~{required_power}W"
             )
+        
+        if errors:
+            raise ValueError("; ".join(errors))
     
     def get_total_power_consumption(self) -> int:
-        """Calculate estimated total power consumption."""
-        total = self.cpu.tdp
-        if self.gpu:
-            total += self.gpu.power_consumption
-        return total
+        """Get the estimated total power consumption."""
+        return self._total_power
+    
+    @property
+    def summary(self) -> str:
+        """Get a formatted summary of the computer configuration, built once."""
+        if self._summary is None:
+            object.__setattr__(self, '_summary', self._format_summary())
+        return self._summary
     
     def get_summary(self) -> str:
         """Get a formatted summary of the computer configuration."""
+        return self.summary
+    
+    def __str__(self) -> str:
+        """Return the cached summary, so logging a computer formats it only once."""
+        return self.summary
+    
+    def _format_summary(self) -> str:
+        """Format the summary lines for the configuration, joined once."""
         summary = []
         if self.name:
             summary.append(f"Computer: {self.name}")
@@ -80,6 +103,6 @@ class Computer:
         if self.gpu:
             summary.append(f"GPU: {self.gpu.model} ({self.gpu.vram}GB VRAM)")
         
-        summary.append(f"Estimated Power: {self.get_total_power_consumption()}W")
+        summary.append(f"Estimated Power: {self._total_power}W")
         
         return "\n".join(summary)
\ No newline at end of file
@@ -120,19 +120,19 @@ def demonstrate_configuration_tracking() -> None:
     builder = ComputerBuilder()
     
     logger.info("Initial configuration:")
-    logger.info(builder.get_current_configuration())
+    logger.info(dict(builder.get_current_configuration()))
     
     builder.with_cpu("Intel i7-13700K", 16, 3.4, "LGA1700", 125)
     logger.info("After adding CPU:")
-    logger.info(builder.get_current_configuration())
+    logger.info(dict(builder.get_current_configuration()))
     
     builder.with_motherboard("ASUS Z790", "LGA1700", "DDR5", 128, 3)
     logger.info("After adding motherboard:")
-    logger.info(builder.get_current_configuration())
+    logger.info(dict(builder.get_current_configuration()))
     
     builder.with_ram(32, 5600, "DDR5", 2)
     logger.info("After adding RAM:")
-    logger.info(builder.get_current_configuration())
+    logger.info(dict(builder.get_current_configuration()))
 
 
 def main() -> None:
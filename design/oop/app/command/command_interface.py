@@ -10,6 +10,9 @@ class Command(ABC):
     to support reversible operations.
     """
     
+    # No per-instance state here, so slotted subclasses stay dict-free
+    __slots__ = ()
+    
     @abstractmethod
     def execute(self) -> None:
         """Execute the command operation."""
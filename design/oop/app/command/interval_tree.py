@@ -0,0 +1,282 @@
+"""Interval tree holding the TextEditor formatting segments.
+
+Segments are kept in an AVL tree ordered by ``(start_pos, end_pos)``. Every
+node is augmented with the largest ``end_pos`` in its subtree, so overlap
+queries prune whole subtrees, and with a lazy offset, so shifting every
+segment after an edit point touches O(log n) nodes instead of all of them.
+"""
+
+from typing import Generic, Iterator, List, Optional, Protocol, TypeVar
+
+
+class Interval(Protocol):
+    """Anything with mutable half-open ``[start_pos, end_pos)`` bounds."""
+
+    start_pos: int
+    end_pos: int
+
+
+I = TypeVar('I', bound=Interval)
+
+
+class _Node(Generic[I]):
+    """Tree node; ``lazy`` is a shift still owed to both child subtrees."""
+
+    __slots__ = ('item', 'left', 'right', 'height', 'max_end', 'lazy')
+
+    def __init__(self, item: I) -> None:
+        self.item = item
+        self.left: Optional[_Node[I]] = None
+        self.right: Optional[_Node[I]] = None
+        self.height = 1
+        self.max_end = item.end_pos
+        self.lazy = 0
+
+
+def _height(node: Optional[_Node]) -> int:
+    return node.height if node is not None else 0
+
+
+def _apply(node: Optional[_Node], delta: int) -> None:
+    """Shift a whole subtree: the root now, its descendants lazily."""
+    if node is not None:
+        node.item.start_pos += delta
+        node.item.end_pos += delta
+        node.max_end += delta
+        node.lazy += delta
+
+
+def _push(node: _Node) -> None:
+    """Hand a node's pending shift down to its children."""
+    if node.lazy:
+        _apply(node.left, node.lazy)
+        _apply(node.right, node.lazy)
+        node.lazy = 0
+
+
+def _update(node: _Node) -> None:
+    """Recompute height and max_end from the (already pushed) children."""
+    left, right = node.left, node.right
+    node.height = 1 + max(_height(left), _height(right))
+    max_end = node.item.end_pos
+    if left is not None and left.max_end > max_end:
+        max_end = left.max_end
+    if right is not None and right.max_end > max_end:
+        max_end = right.max_end
+    node.max_end = max_end
+
+
+def _rotate_right(node: _Node) -> _Node:
+    pivot = node.left
+    _push(pivot)
+    node.left = pivot.right
+    pivot.right = node
+    _update(node)
+    _update(pivot)
+    return pivot
+
+
+def _rotate_left(node: _Node) -> _Node:
+    pivot = node.right
+    _push(pivot)
+    node.right = pivot.left
+    pivot.left = node
+    _update(node)
+    _update(pivot)
+    return pivot
+
+
+def _rebalance(node: _Node) -> _Node:
+    """Restore the AVL invariant at a pushed node whose children are balanced."""
+    _update(node)
+    balance = _height(node.left) - _height(node.right)
+    if balance > 1:
+        _push(node.left)
+        if _height(node.left.left) < _height(node.left.right):
+            node.left = _rotate_left(node.left)
+        return _rotate_right(node)
+    if balance < -1:
+        _push(node.right)
+        if _height(node.right.right) < _height(node.right.left):
+            node.right = _rotate_right(node.right)
+        return _rotate_left(node)
+    return node
+
+
+def _key(item: Interval) -> tuple[int, int]:
+    return item.start_pos, item.end_pos
+
+
+def _insert(node: Optional[_Node[I]], item: I) -> _Node[I]:
+    if node is None:
+        return _Node(item)
+    _push(node)
+    if _key(item) < _key(node.item):
+        node.left = _insert(node.left, item)
+    else:
+        node.right = _insert(node.right, item)
+    return _rebalance(node)
+
+
+def _pop_min(node: _Node[I]) -> tuple[Optional[_Node[I]], I]:
+    """Detach the leftmost item; returns the new subtree root and the item."""
+    _push(node)
+    if node.left is None:
+        return node.right, node.item
+    node.left, item = _pop_min(node.left)
+    return _rebalance(node), item
+
+
+def _remove(node: Optional[_Node[I]], item: I) -> tuple[Optional[_Node[I]], bool]:
+    """Remove ``item`` by identity; returns the new subtree root and whether it was found."""
+    if node is None:
+        return None, False
+    _push(node)
+
+    if node.item is item:
+        if node.left is None:
+            return node.right, True
+        if node.right is None:
+            return node.left, True
+        node.right, node.item = _pop_min(node.right)
+        return _rebalance(node), True
+
+    key, node_key = _key(item), _key(node.item)
+    found = False
+    if key <= node_key:
+        node.left, found = _remove(node.left, item)
+    # Equal keys may sit on either side of the node
+    if not found and key >= node_key:
+        node.right, found = _remove(node.right, item)
+    return (_rebalance(node) if found else node), found
+
+
+def _collect_overlapping(node: Optional[_Node[I]], start: int, end: int, found: List[I]) -> None:
+    # No segment in this subtree ends after start
+    if node is None or node.max_end <= start:
+        return
+    _push(node)
+    _collect_overlapping(node.left, start, end, found)
+    item = node.item
+    if item.start_pos < end:
+        if item.end_pos > start:
+            found.append(item)
+        # Right subtree starts no earlier than this node, so only visit it
+        # while this node still starts before end
+        _collect_overlapping(node.right, start, end, found)
+
+
+def _shift_from(node: Optional[_Node], position: int, delta: int) -> None:
+    if node is None:
+        return
+    _push(node)
+    if node.item.start_pos >= position:
+        # This node and its whole right subtree start at or after position
+        node.item.start_pos += delta
+        node.item.end_pos += delta
+        _apply(node.right, delta)
+        _shift_from(node.left, position, delta)
+    else:
+        _shift_from(node.right, position, delta)
+    _update(node)
+
+
+class IntervalTree(Generic[I]):
+    """AVL interval tree of mutable intervals ordered by position.
+
+    Items are stored by reference and their bounds are updated in place by
+    shift_from(). Shifts reach deeper items lazily, so bounds are only
+    guaranteed current on items returned by the tree after the shift.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty tree."""
+        self._root: Optional[_Node[I]] = None
+        self._size = 0
+
+    def __len__(self) -> int:
+        """Return the number of stored intervals."""
+        return self._size
+
+    def __iter__(self) -> Iterator[I]:
+        """Iterate over the intervals in ``(start_pos, end_pos)`` order."""
+        stack: List[_Node[I]] = []
+        node = self._root
+        while stack or node is not None:
+            while node is not None:
+                _push(node)
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.item
+            node = node.right
+
+    @property
+    def height(self) -> int:
+        """Get the height of the tree (0 when empty)."""
+        return _height(self._root)
+
+    def add(self, item: I) -> None:
+        """Insert an interval.
+
+        Args:
+            item: Interval to store
+        """
+        self._root = _insert(self._root, item)
+        self._size += 1
+
+    def remove(self, item: I) -> None:
+        """Remove an interval previously added (matched by identity).
+
+        The search is guided by the item's bounds, so they must be current:
+        take the item from the tree (iteration, first() or overlapping())
+        after the last shift_from() before removing it.
+
+        Args:
+            item: Interval to remove
+
+        Raises:
+            KeyError: If the interval is not in the tree
+        """
+        self._root, found = _remove(self._root, item)
+        if not found:
+            raise KeyError(item)
+        self._size -= 1
+
+    def first(self) -> Optional[I]:
+        """Return the interval with the smallest bounds, or None if empty."""
+        node = self._root
+        if node is None:
+            return None
+        while True:
+            _push(node)
+            if node.left is None:
+                return node.item
+            node = node.left
+
+    def overlapping(self, start: int, end: int) -> List[I]:
+        """Return intervals with ``start_pos < end`` and ``end_pos > start``.
+
+        Args:
+            start: Query range start
+            end: Query range end
+
+        Returns:
+            Matching intervals in position order
+        """
+        found: List[I] = []
+        _collect_overlapping(self._root, start, end, found)
+        return found
+
+    def shift_from(self, position: int, delta: int) -> None:
+        """Shift every interval starting at or after position by delta.
+
+        The caller must ensure the shift keeps those intervals ordered
+        after the ones starting before position.
+
+        Args:
+            position: First start position to shift
+            delta: Amount added to both bounds
+        """
+        if delta:
+            _shift_from(self._root, position, delta)
@@ -139,15 +139,16 @@ class TextEditorInvoker:
         self._redo_stack.clear()
         self._logger.info("Cleared command history")
     
-    def get_history_summary(self) -> dict[str, list[str]]:
+    def get_history_summary(self) -> dict[str, tuple[str, ...]]:
         """Get a summary of the command history.
         
         Returns:
-            Dictionary with 'undo' and 'redo' keys containing command descriptions
+            Dictionary with 'undo' and 'redo' keys containing immutable tuples
+            of command descriptions, most recent first
         """
         return {
-            'undo': [cmd.get_description() for cmd in reversed(self._undo_stack)],
-            'redo': [cmd.get_description() for cmd in reversed(self._redo_stack)]
+            'undo': tuple(cmd.get_description() for cmd in reversed(self._undo_stack)),
+            'redo': tuple(cmd.get_description() for cmd in reversed(self._redo_stack))
         }
     
     def execute_multiple_commands(self, commands: list[Command]) -> None:
@@ -0,0 +1,220 @@
+"""Rope data structure backing the TextEditor content.
+
+A rope stores text as a balanced binary tree of short string leaves, so an
+insert or delete touches O(log n) nodes instead of copying the whole buffer.
+Nodes are immutable and shared between versions: every edit returns a new
+Rope and leaves the old one intact.
+"""
+
+from typing import Iterator, Optional, Union
+
+# Leaves are split to at most this many characters
+LEAF_SIZE = 1024
+
+
+class _Leaf:
+    """Tree leaf holding a run of at most LEAF_SIZE characters."""
+
+    __slots__ = ('text', 'length')
+
+    height = 0
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.length = len(text)
+
+
+class _Node:
+    """Internal tree node; length is the total length of both subtrees."""
+
+    __slots__ = ('left', 'right', 'length', 'height')
+
+    def __init__(self, left: '_Tree', right: '_Tree') -> None:
+        self.left = left
+        self.right = right
+        self.length = left.length + right.length
+        self.height = 1 + max(left.height, right.height)
+
+
+_Tree = Union[_Leaf, _Node]
+
+
+def _build(text: str, start: int, end: int) -> _Tree:
+    """Build a perfectly balanced tree over ``text[start:end]``."""
+    if end - start <= LEAF_SIZE:
+        return _Leaf(text[start:end])
+    # Split on a leaf boundary so every leaf but the last is full
+    leaves = -(-(end - start) // LEAF_SIZE)
+    mid = start + (leaves // 2) * LEAF_SIZE
+    return _Node(_build(text, start, mid), _build(text, mid, end))
+
+
+def _make(left: _Tree, right: _Tree) -> _Tree:
+    """Join two trees of similar height, merging small neighbouring leaves."""
+    if (type(left) is _Leaf and type(right) is _Leaf
+            and left.length + right.length <= LEAF_SIZE):
+        return _Leaf(left.text + right.text)
+    return _Node(left, right)
+
+
+def _balance(left: _Tree, right: _Tree) -> _Tree:
+    """Join two trees whose heights differ by at most two, rotating if needed."""
+    if left.height > right.height + 1:
+        if left.left.height >= left.right.height:
+            return _make(left.left, _make(left.right, right))
+        pivot = left.right
+        return _make(_make(left.left, pivot.left), _make(pivot.right, right))
+    if right.height > left.height + 1:
+        if right.right.height >= right.left.height:
+            return _make(_make(left, right.left), right.right)
+        pivot = right.left
+        return _make(_make(left, pivot.left), _make(pivot.right, right.right))
+    return _make(left, right)
+
+
+def _join(left: Optional[_Tree], right: Optional[_Tree]) -> Optional[_Tree]:
+    """Concatenate two trees, keeping the result AVL-balanced."""
+    if left is None or left.length == 0:
+        return right
+    if right is None or right.length == 0:
+        return left
+
+    # Descend the taller tree's inner spine until the heights meet; each
+    # level's result grows by at most one, so one rotation restores balance
+    if left.height > right.height + 1:
+        return _balance(left.left, _join(left.right, right))
+    if right.height > left.height + 1:
+        return _balance(_join(left, right.left), right.right)
+    return _make(left, right)
+
+
+def _split(tree: Optional[_Tree], index: int) -> tuple[Optional[_Tree], Optional[_Tree]]:
+    """Split a tree into the first ``index`` characters and the rest."""
+    if tree is None:
+        return None, None
+    if index <= 0:
+        return None, tree
+    if index >= tree.length:
+        return tree, None
+    if type(tree) is _Leaf:
+        return _Leaf(tree.text[:index]), _Leaf(tree.text[index:])
+
+    left_length = tree.left.length
+    if index <= left_length:
+        head, tail = _split(tree.left, index)
+        return head, _join(tail, tree.right)
+    head, tail = _split(tree.right, index - left_length)
+    return _join(tree.left, head), tail
+
+
+def _leaves(tree: Optional[_Tree]) -> Iterator[str]:
+    """Yield the leaf texts of a tree from left to right."""
+    stack = [tree] if tree is not None else []
+    while stack:
+        node = stack.pop()
+        if type(node) is _Leaf:
+            yield node.text
+        else:
+            stack.append(node.right)
+            stack.append(node.left)
+
+
+class Rope:
+    """Immutable text sequence with O(log n) insert, delete and split.
+
+    The full string is built on first str() and cached, since a Rope never
+    changes after construction.
+    """
+
+    __slots__ = ('_root', '_text')
+
+    def __init__(self, text: str = "") -> None:
+        """Create a rope holding text.
+
+        Args:
+            text: Initial content
+        """
+        self._root: Optional[_Tree] = _build(text, 0, len(text)) if text else None
+        self._text: Optional[str] = text
+
+    @classmethod
+    def _from_root(cls, root: Optional[_Tree]) -> 'Rope':
+        """Wrap an existing tree without copying it."""
+        rope = cls.__new__(cls)
+        rope._root = root
+        rope._text = None if root is not None else ""
+        return rope
+
+    def __len__(self) -> int:
+        """Return the number of characters in the rope."""
+        return self._root.length if self._root is not None else 0
+
+    def __str__(self) -> str:
+        """Return the rope's content as a single string."""
+        if self._text is None:
+            self._text = "".join(_leaves(self._root))
+        return self._text
+
+    @property
+    def height(self) -> int:
+        """Get the height of the underlying tree (0 for a single leaf)."""
+        return self._root.height if self._root is not None else 0
+
+    def insert(self, position: int, text: str) -> 'Rope':
+        """Return a new rope with text inserted at position.
+
+        Args:
+            position: Index to insert at (0 <= position <= len(self))
+            text: Text to insert
+
+        Returns:
+            Rope with the inserted text
+        """
+        if not text:
+            return self
+        head, tail = _split(self._root, position)
+        # Large inserts are spliced in as a balanced subtree, small ones as a leaf
+        return Rope._from_root(_join(_join(head, _build(text, 0, len(text))), tail))
+
+    def delete(self, start: int, length: int) -> 'Rope':
+        """Return a new rope with ``length`` characters removed from start.
+
+        Args:
+            start: Index of the first character to remove
+            length: Number of characters to remove
+
+        Returns:
+            Rope without the removed range
+        """
+        if length <= 0:
+            return self
+        head, rest = _split(self._root, start)
+        _, tail = _split(rest, length)
+        return Rope._from_root(_join(head, tail))
+
+    def substring(self, start: int, end: int) -> str:
+        """Return the characters in ``[start, end)`` without building the full string.
+
+        Args:
+            start: Index of the first character
+            end: Index one past the last character
+
+        Returns:
+            The requested slice of the content
+        """
+        if self._text is not None:
+            return self._text[start:end]
+
+        pieces = []
+        stack = [(self._root, 0)] if self._root is not None and start < end else []
+        while stack:
+            node, offset = stack.pop()
+            # Skip subtrees entirely outside the requested range
+            if offset >= end or offset + node.length <= start:
+                continue
+            if type(node) is _Leaf:
+                pieces.append(node.text[max(start - offset, 0):end - offset])
+            else:
+                stack.append((node.right, offset + node.left.length))
+                stack.append((node.left, offset))
+        return "".join(pieces)
@@ -1,8 +1,13 @@
 """TextEditor receiver class that performs the actual text operations."""
 
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from enum import Enum
+from difflib import SequenceMatcher
+from typing import Iterable, Optional
+
+from .interval_tree import IntervalTree
+from .rope import Rope
 
 
 class TextFormat(Enum):
@@ -13,10 +18,14 @@ class TextFormat(Enum):
     NORMAL = "normal"
 
 
-@dataclass
+@dataclass(slots=True)
 class TextSegment:
-    """Represents a segment of text with its formatting."""
-    text: str
+    """Represents a segment of text with its formatting.
+    
+    Slotted, since editors hold one per formatted range and the interval
+    tree updates their positions in place. The covered text is not copied
+    into the segment; read it with TextEditor.segment_text().
+    """
     start_pos: int
     end_pos: int
     format_type: TextFormat = TextFormat.NORMAL
@@ -29,21 +38,45 @@ class TextEditor:
     and provides methods for text manipulation operations.
     """
     
+    __slots__ = ('_rope', '_segment_tree', '_version', '_cached_segments', '_cached_str', '_logger')
+    
     def __init__(self) -> None:
         """Initialize an empty text editor."""
-        self._content: str = ""
-        self._formatted_segments: list[TextSegment] = []
+        # Rope keeps inserts and deletes O(log n) on large documents
+        self._rope = Rope()
+        # Segments are indexed by position for O(log n + k) overlap queries
+        # and lazily shifted after edits
+        self._segment_tree: IntervalTree[TextSegment] = IntervalTree()
+        # Bumped on every edit; query results are cached until the next one
+        self._version = 0
+        self._cached_segments: Optional[tuple[TextSegment, ...]] = None
+        self._cached_str: Optional[str] = None
         self._logger = logging.getLogger(__name__)
     
     @property
     def content(self) -> str:
         """Get the current text content."""
-        return self._content
+        return str(self._rope)
     
     @property
     def length(self) -> int:
         """Get the current length of text content."""
-        return len(self._content)
+        return len(self._rope)
+    
+    @property
+    def version(self) -> int:
+        """Get the edit generation, incremented whenever content or formatting changes."""
+        return self._version
+    
+    @property
+    def segment_count(self) -> int:
+        """Get the number of formatting segments without copying them."""
+        return len(self._segment_tree)
+    
+    @property
+    def first_segment(self) -> Optional[TextSegment]:
+        """Get the first formatting segment, or None if there is none."""
+        return self._segment_tree.first()
     
     def insert_text(self, position: int, text: str) -> None:
         """Insert text at the specified position.
@@ -55,11 +88,12 @@ class TextEditor:
         Raises:
             ValueError: If position is out of bounds
         """
-        if position < 0 or position > len(self._content):
-            raise ValueError(f"Position {position} is out of bounds for content length {len(self._content)}")
+        if position < 0 or position > len(self._rope):
+            raise ValueError(f"Position {position} is out of bounds for content length {len(self._rope)}")
         
-        self._content = self._content[:position] + text + self._content[position:]
-        self._update_segment_positions_after_insert(position, len(text))
+        self._rope = self._rope.insert(position, text)
+        self._apply_edit_opcodes([('insert', position, position, position, position + len(text))])
+        self._mark_edited()
         self._logger.info(f"Inserted '{text}' at position {position}")
     
     def delete_text(self, start_position: int, length: int) -> str:
@@ -75,16 +109,17 @@ class TextEditor:
         Raises:
             ValueError: If position or length is out of bounds
         """
-        if start_position < 0 or start_position >= len(self._content):
+        if start_position < 0 or start_position >= len(self._rope):
             raise ValueError(f"Start position {start_position} is out of bounds")
         
         end_position = start_position + length
-        if end_position > len(self._content):
+        if end_position > len(self._rope):
             raise ValueError(f"Delete length {length} exceeds content bounds")
         
-        deleted_text = self._content[start_position:end_position]
-        self._content = self._content[:start_position] + self._content[end_position:]
-        self._update_segment_positions_after_delete(start_position, length)
+        deleted_text = self._rope.substring(start_position, end_position)
+        self._rope = self._rope.delete(start_position, length)
+        self._apply_edit_opcodes([('delete', start_position, end_position, start_position, start_position)])
+        self._mark_edited()
         self._logger.info(f"Deleted '{deleted_text}' from position {start_position}")
         
         return deleted_text
@@ -103,11 +138,11 @@ class TextEditor:
         Raises:
             ValueError: If position or length is out of bounds
         """
-        if start_position < 0 or start_position >= len(self._content):
+        if start_position < 0 or start_position >= len(self._rope):
             raise ValueError(f"Start position {start_position} is out of bounds")
         
         end_position = start_position + length
-        if end_position > len(self._content):
+        if end_position > len(self._rope):
             raise ValueError(f"Format length {length} exceeds content bounds")
         
         # Remove existing formatting in this range and store for undo
@@ -115,19 +150,54 @@ class TextEditor:
         
         # Add new formatting
         new_segment = TextSegment(
-            text=self._content[start_position:end_position],
             start_pos=start_position,
             end_pos=end_position,
             format_type=format_type
         )
-        self._formatted_segments.append(new_segment)
+        self._segment_tree.add(new_segment)
+        self._mark_edited()
         self._logger.info(f"Applied {format_type.value} formatting to position {start_position}-{end_position}")
         
         return old_segments
     
-    def get_formatted_segments(self) -> list[TextSegment]:
-        """Get all current formatting segments."""
-        return self._formatted_segments.copy()
+    def replace_content(self, new_content: str) -> None:
+        """Replace the whole content, carrying formatting over unchanged text.
+        
+        The old and new content are diffed once and the resulting opcodes
+        rebase the formatting segments in a single pass, rather than replaying
+        each individual edit.
+        
+        Args:
+            new_content: The text to replace the content with
+        """
+        old_content = self.content
+        opcodes = SequenceMatcher(None, old_content, new_content, autojunk=False).get_opcodes()
+        self._rope = Rope(new_content)
+        self._apply_edit_opcodes(opcodes)
+        self._mark_edited()
+        self._logger.info(f"Replaced content with {len(new_content)} characters")
+    
+    def get_formatted_segments(self) -> tuple[TextSegment, ...]:
+        """Get all current formatting segments, ordered by position.
+        
+        The tuple is cached until the next edit. Positions are current as of
+        this call; fetch the segments again after further edits rather than
+        holding on to them.
+        """
+        if self._cached_segments is None:
+            self._cached_segments = tuple(self._segment_tree)
+        return self._cached_segments
+    
+    def segment_text(self, segment: TextSegment) -> str:
+        """Get the text currently covered by a formatting segment.
+        
+        Args:
+            segment: Segment returned by this editor
+            
+        Returns:
+            The content between the segment's start and end positions
+        """
+        return self._rope.substring(segment.start_pos, segment.end_pos)
     
     def restore_formatting(self, segments: list[TextSegment]) -> None:
         """Restore previous formatting segments.
@@ -139,76 +209,131 @@ class TextEditor:
             # Remove any conflicting formatting first
             self._remove_formatting_in_range(segment.start_pos, segment.end_pos)
             # Add the restored segment
-            self._formatted_segments.append(segment)
+            self._segment_tree.add(segment)
         
+        self._mark_edited()
         self._logger.info(f"Restored {len(segments)} formatting segments")
     
+    def snapshot(self) -> tuple[str, tuple[TextSegment, ...]]:
+        """Capture the content and formatting for a later restore().
+        
+        Segments are copied because edits shift their positions in place.
+        
+        Returns:
+            Tuple of the content and copies of the formatting segments
+        """
+        return self.content, tuple(replace(segment) for segment in self._segment_tree)
+    
+    def restore(self, snapshot: tuple[str, tuple[TextSegment, ...]]) -> None:
+        """Replace the content and formatting with a snapshot's.
+        
+        Args:
+            snapshot: Value previously returned by snapshot()
+        """
+        content, segments = snapshot
+        self._rope = Rope(content)
+        self._segment_tree = IntervalTree()
+        for segment in segments:
+            self._segment_tree.add(replace(segment))
+        self._mark_edited()
+    
+    def _mark_edited(self) -> None:
+        """Advance the edit version and drop cached query results."""
+        self._version += 1
+        self._cached_segments = None
+        self._cached_str = None
+    
+    def _apply_edit_opcodes(self, opcodes: Iterable[tuple[str, int, int, int, int]]) -> None:
+        """Rebase formatting segments over difflib-style ``(tag, i1, i2, j1, j2)`` opcodes.
+        
+        Opcodes are applied right to left, so the old-content positions of
+        the ones still pending stay valid as the segments shift.
+        """
+        for tag, i1, i2, j1, j2 in sorted(opcodes, key=lambda op: op[1], reverse=True):
+            if tag in ('delete', 'replace'):
+                self._update_segment_positions_after_delete(i1, i2 - i1)
+            if tag in ('insert', 'replace'):
+                self._update_segment_positions_after_insert(i1, j2 - j1)
+    
     def _update_segment_positions_after_insert(self, insert_position: int, insert_length: int) -> None:
         """Update formatting segment positions after text insertion."""
-        for segment in self._formatted_segments:
-            if segment.start_pos >= insert_position:
-                segment.start_pos += insert_length
-                segment.end_pos += insert_length
-            elif segment.end_pos > insert_position:
-                segment.end_pos += insert_length
+        if not insert_length:
+            return
+        tree = self._segment_tree
+        # Segments spanning the insert point grow; they are re-added after the
+        # shift since their end changes
+        spanning = tree.overlapping(insert_position, insert_position)
+        for segment in spanning:
+            tree.remove(segment)
+            segment.end_pos += insert_length
+        
+        # Segments starting at or after the insert point move right
+        tree.shift_from(insert_position, insert_length)
+        for segment in spanning:
+            tree.add(segment)
     
     def _update_segment_positions_after_delete(self, delete_position: int, delete_length: int) -> None:
         """Update formatting segment positions after text deletion."""
-        segments_to_remove = []
+        tree = self._segment_tree
+        delete_end = delete_position + delete_length
         
-        for segment in self._formatted_segments:
-            delete_end = delete_position + delete_length
-            
-            if segment.end_pos <= delete_position:
-                # Segment is before deletion, no change needed
+        # Segments before the deletion are untouched; only those overlapping
+        # it need individual attention
+        surviving = []
+        for segment in tree.overlapping(delete_position, delete_end):
+            tree.remove(segment)
+            if segment.start_pos >= delete_position and segment.end_pos <= delete_end:
+                # Segment is completely within deletion, drop it
                 continue
-            elif segment.start_pos >= delete_end:
-                # Segment is after deletion, shift positions
-                segment.start_pos -= delete_length
-                segment.end_pos -= delete_length
-            elif segment.start_pos >= delete_position and segment.end_pos <= delete_end:
-                # Segment is completely within deletion, remove it
-                segments_to_remove.append(segment)
+            # Segment partially overlaps with deletion, adjust accordingly
+            if segment.start_pos < delete_position:
+                segment.end_pos = max(segment.start_pos, segment.end_pos - delete_length)
             else:
-                # Segment partially overlaps with deletion, adjust accordingly
-                if segment.start_pos < delete_position:
-                    segment.end_pos = max(segment.start_pos, segment.end_pos - delete_length)
-                else:
-                    segment.start_pos = delete_position
-                    segment.end_pos -= delete_length
+                segment.start_pos = delete_position
+                segment.end_pos -= delete_length
+            surviving.append(segment)
         
-        for segment in segments_to_remove:
-            self._formatted_segments.remove(segment)
+        # Segments after the deletion shift left
+        tree.shift_from(delete_end, -delete_length)
+        for segment in surviving:
+            tree.add(segment)
     
     def _remove_formatting_in_range(self, start_pos: int, end_pos: int) -> list[TextSegment]:
-        """Remove formatting segments in the specified range and return them."""
-        old_segments = []
-        segments_to_remove = []
+        """Clear formatting in the specified range and return the affected segments.
         
-        for segment in self._formatted_segments:
-            if (segment.start_pos < end_pos and segment.end_pos > start_pos):
-                old_segments.append(TextSegment(
-                    text=segment.text,
-                    start_pos=segment.start_pos,
-                    end_pos=segment.end_pos,
-                    format_type=segment.format_type
-                ))
-                segments_to_remove.append(segment)
+        Segments reaching past the range are clipped to the part outside it,
+        rather than losing their formatting there too. The returned copies
+        keep the original, unclipped bounds for undo.
+        """
+        tree = self._segment_tree
+        old_segments = []
         
-        for segment in segments_to_remove:
-            self._formatted_segments.remove(segment)
+        for segment in tree.overlapping(start_pos, end_pos):
+            tree.remove(segment)
+            old_segments.append(replace(segment))
+            if segment.end_pos > end_pos:
+                tree.add(TextSegment(end_pos, segment.end_pos, segment.format_type))
+            if segment.start_pos < start_pos:
+                segment.end_pos = start_pos
+                tree.add(segment)
         
+        # FormatTextCommand.undo() calls this directly, so it invalidates too
+        if old_segments:
+            self._mark_edited()
         return old_segments
     
     def __str__(self) -> str:
         """Return a string representation of the editor content."""
-        if not self._content:
+        if self._cached_str is not None:
+            return self._cached_str
+        if not self._rope:
             return "[Empty]"
         
-        result = f"Content: '{self._content}'"
-        if self._formatted_segments:
-            result += f"\nFormatting: {len(self._formatted_segments)} segments"
-            for segment in self._formatted_segments:
+        result = f"Content: '{self.content}'"
+        if self._segment_tree:
+            result += f"\nFormatting: {len(self._segment_tree)} segments"
+            for segment in self._segment_tree:
                 result += f"\n  - {segment.format_type.value}: pos {segment.start_pos}-{segment.end_pos}"
         
+        self._cached_str = result
         return result
\ No newline at end of file
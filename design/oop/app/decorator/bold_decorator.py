@@ -3,7 +3,6 @@ Bold text decorator implementation.
 """
 
 from .text_decorator import TextDecorator
-from .text_component import TextComponent
 
 
 class BoldDecorator(TextDecorator):
@@ -14,20 +13,4 @@ class BoldDecorator(TextDecorator):
     bold formatting.
     """
     
-    def __init__(self, component: TextComponent) -> None:
-        """
-        Initialize the bold decorator.
-        
-        Args:
-            component: The TextComponent to decorate with bold formatting.
-        """
-        super().__init__(component)
-    
-    def render(self) -> str:
-        """
-        Render the text with bold formatting.
-        
-        Returns:
-            str: The text wrapped with bold tags.
-        """
-        return f"<b>{self._component.render()}</b>"
\ No newline at end of file
+    tag = "b"
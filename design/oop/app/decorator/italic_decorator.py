@@ -3,7 +3,6 @@ Italic text decorator implementation.
 """
 
 from .text_decorator import TextDecorator
-from .text_component import TextComponent
 
 
 class ItalicDecorator(TextDecorator):
@@ -14,20 +13,4 @@ class ItalicDecorator(TextDecorator):
     italic formatting.
     """
     
-    def __init__(self, component: TextComponent) -> None:
-        """
-        Initialize the italic decorator.
-        
-        Args:
-            component: The TextComponent to decorate with italic formatting.
-        """
-        super().__init__(component)
-    
-    def render(self) -> str:
-        """
-        Render the text with italic formatting.
-        
-        Returns:
-            str: The text wrapped with italic tags.
-        """
-        return f"<i>{self._component.render()}</i>"
\ No newline at end of file
+    tag = "i"
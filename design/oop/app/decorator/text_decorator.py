@@ -3,6 +3,7 @@ Abstract base class for text decorators.
 """
 
 from abc import abstractmethod
+
 from .text_component import TextComponent
 
 
@@ -12,6 +13,7 @@ class TextDecorator(TextComponent):
     
     This class implements the Decorator pattern by wrapping a TextComponent
     and delegating calls to it while potentially adding additional functionality.
+    Concrete decorators only name the tag they wrap the text in.
     """
     
     def __init__(self, component: TextComponent) -> None:
@@ -23,15 +25,40 @@ class TextDecorator(TextComponent):
         """
         self._component = component
     
+    @property
     @abstractmethod
+    def tag(self) -> str:
+        """
+        HTML-like tag name, e.g. "b" renders as <b>...</b>.
+        
+        Concrete decorators override this with a plain class attribute.
+        
+        Returns:
+            str: The tag name.
+        """
+        pass
+    
     def render(self) -> str:
         """
         Render the decorated text.
         
+        Walks the chain of tag decorators iteratively and joins all tags
+        around the innermost render once, instead of re-copying the text
+        at every level of nesting.
+        
         Returns:
             str: The formatted text string.
         """
-        pass
+        opens = []
+        closes = []
+        node: TextComponent = self
+        # Decorators overriding render() are rendered by their own method
+        while isinstance(node, TextDecorator) and type(node).render is TextDecorator.render:
+            opens.append(f"<{node.tag}>")
+            closes.append(f"</{node.tag}>")
+            node = node._component
+        closes.reverse()
+        return "".join(opens) + node.render() + "".join(closes)
     
     def get_content(self) -> str:
         """
@@ -40,4 +67,4 @@ class TextDecorator(TextComponent):
         Returns:
             str: The plain text content.
         """
-        return self._component.get_content()
\ No newline at end of file
+        return self._component.get_content()
@@ -3,7 +3,6 @@ Underline text decorator implementation.
 """
 
 from .text_decorator import TextDecorator
-from .text_component import TextComponent
 
 
 class UnderlineDecorator(TextDecorator):
@@ -14,20 +13,4 @@ class UnderlineDecorator(TextDecorator):
     underlined formatting.
     """
     
-    def __init__(self, component: TextComponent) -> None:
-        """
-        Initialize the underline decorator.
-        
-        Args:
-            component: The TextComponent to decorate with underline formatting.
-        """
-        super().__init__(component)
-    
-    def render(self) -> str:
-        """
-        Render the text with underline formatting.
-        
-        Returns:
-            str: The text wrapped with underline tags.
-        """
-        return f"<u>{self._component.render()}</u>"
\ No newline at end of file
+    tag = "u"
@@ -161,8 +161,12 @@ def run_basic_demo() -> None:
               f"Trades={len(trader.trade_history)}")
 
 
-def run_threaded_demo() -> None:
-    """Run a demonstration with multiple threads simulating concurrent operations."""
+def run_threaded_demo(demo_duration: int = 15) -> None:
+    """Run a demonstration with multiple threads simulating concurrent operations.
+    
+    Args:
+        demo_duration: Seconds the worker threads run for
+    """
     print("\n" + "="*60)
     print("THREADED OBSERVER PATTERN DEMONSTRATION")
     print("="*60)
@@ -205,7 +209,6 @@ def run_threaded_demo() -> None:
     
     # Create and start worker threads
     threads = []
-    demo_duration = 15  # Run for 15 seconds
     
     # Price update workers (2 threads)
     for i in range(2):
@@ -256,13 +259,13 @@ def run_threaded_demo() -> None:
     print(f"Observers: {', '.join(market.get_observer_names())}")
     
     for trader in traders:
-        if trader in market._observers:  # Only show stats for attached traders
+        if market.has_observer(trader):  # Only show stats for attached traders
             portfolio_value = trader.get_portfolio_value(market_prices)
             print(f"{trader.name}: Portfolio Value=${portfolio_value:.2f}, "
                   f"Trades={len(trader.trade_history)}")
     
     for analyst in analysts:
-        if analyst in market._observers:  # Only show stats for attached analysts
+        if market.has_observer(analyst):  # Only show stats for attached analysts
             tracked_stocks = len(analyst.stocks_tracked)
             print(f"{analyst.name} ({analyst.specialization}): Tracking {tracked_stocks} stocks")
 
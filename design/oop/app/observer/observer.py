@@ -1,7 +1,7 @@
 """Observer abstract base class for the Observer pattern."""
 
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Mapping
 
 
 class Observer(ABC):
@@ -12,13 +12,12 @@ class Observer(ABC):
     """
 
     @abstractmethod
-    def update(self, subject: Any, *args, **kwargs) -> None:
+    def update(self, subject: Any, event: Mapping[str, Any]) -> None:
         """Update method called when the subject notifies observers.
         
         Args:
             subject: The subject that triggered the notification
-            *args: Variable positional arguments with update data
-            **kwargs: Variable keyword arguments with update data
+            event: Update data shared by all observers; must not be mutated
         """
         pass
 
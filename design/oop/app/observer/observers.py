@@ -3,12 +3,17 @@
 import logging
 import threading
 from decimal import Decimal
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Mapping, Optional
 from datetime import datetime
 
 from .observer import Observer
 
 
+def _as_decimal(value: Any) -> Decimal:
+    """Convert a float market price to Decimal for exact cash arithmetic."""
+    return Decimal(str(value)) if isinstance(value, float) else value
+
+
 class Trader(Observer):
     """Trader observer that makes trading decisions based on price changes.
     
@@ -40,32 +45,31 @@ class Trader(Observer):
         """Return the trader's name."""
         return self._name
     
-    def update(self, subject: Any, *args, **kwargs) -> None:
+    def update(self, subject: Any, event: Mapping[str, Any]) -> None:
         """Handle stock market updates.
         
         Args:
             subject: The stock market that sent the update
-            *args: Variable arguments
-            **kwargs: Keyword arguments containing update information
+            event: Mapping containing update information
         """
-        event_type = kwargs.get("event_type")
+        event_type = event.get("event_type")
         
         if event_type == "price_change":
-            self._handle_price_change(**kwargs)
+            self._handle_price_change(event)
         elif event_type == "market_opened":
-            self._handle_market_open(**kwargs)
+            self._handle_market_open(event)
         elif event_type == "market_closed":
-            self._handle_market_close(**kwargs)
+            self._handle_market_close(event)
         else:
             self._logger.debug(f"Received unknown event type: {event_type}")
     
-    def _handle_price_change(self, **kwargs) -> None:
+    def _handle_price_change(self, event: Mapping[str, Any]) -> None:
         """Handle stock price change notifications."""
-        symbol = kwargs.get("symbol")
-        new_price = kwargs.get("new_price")
-        previous_price = kwargs.get("previous_price")
-        price_change_percent = kwargs.get("price_change_percent")
-        volume = kwargs.get("volume")
+        symbol = event.get("symbol")
+        new_price = event.get("new_price")
+        previous_price = event.get("previous_price")
+        price_change_percent = event.get("price_change_percent")
+        volume = event.get("volume")
         
         if not all([symbol, new_price, previous_price, price_change_percent]):
             self._logger.warning("Incomplete price change data received")
@@ -76,6 +80,8 @@ class Trader(Observer):
             f"({price_change_percent:+.2f}%, volume: {volume})"
         )
         
+        new_price = _as_decimal(new_price)
+        
         with self._lock:
             # Make trading decision based on price change
             if price_change_percent <= self._buy_threshold_percent:
@@ -153,11 +159,11 @@ class Trader(Observer):
         
         self._logger.info(f"SOLD {shares} shares of {symbol} at ${price} (total: ${revenue})")
     
-    def _handle_market_open(self, **kwargs) -> None:
+    def _handle_market_open(self, event: Mapping[str, Any]) -> None:
         """Handle market open notification."""
         self._logger.info("Market opened - ready for trading")
     
-    def _handle_market_close(self, **kwargs) -> None:
+    def _handle_market_close(self, event: Mapping[str, Any]) -> None:
         """Handle market close notification."""
         self._logger.info("Market closed - trading suspended")
         self._log_portfolio_summary()
@@ -183,7 +189,7 @@ class Trader(Observer):
         """
         with self._lock:
             stock_value = sum(
-                shares * market_prices.get(symbol, Decimal("0"))
+                shares * _as_decimal(market_prices.get(symbol, Decimal("0")))
                 for symbol, shares in self._portfolio.items()
             )
             return self._cash + stock_value
@@ -236,34 +242,33 @@ class Analyst(Observer):
         """Return the analyst's name."""
         return self._name
     
-    def update(self, subject: Any, *args, **kwargs) -> None:
+    def update(self, subject: Any, event: Mapping[str, Any]) -> None:
         """Handle stock market updates.
         
         Args:
             subject: The stock market that sent the update
-            *args: Variable arguments
-            **kwargs: Keyword arguments containing update information
+            event: Mapping containing update information
         """
-        event_type = kwargs.get("event_type")
+        event_type = event.get("event_type")
         
         if event_type == "price_change":
-            self._analyze_price_change(**kwargs)
+            self._analyze_price_change(event)
         elif event_type == "market_opened":
-            self._track_market_event("MARKET_OPENED", **kwargs)
+            self._track_market_event("MARKET_OPENED", event)
         elif event_type == "market_closed":
-            self._track_market_event("MARKET_CLOSED", **kwargs)
+            self._track_market_event("MARKET_CLOSED", event)
             self._generate_daily_report()
         else:
             self._logger.debug(f"Received unknown event type: {event_type}")
     
-    def _analyze_price_change(self, **kwargs) -> None:
+    def _analyze_price_change(self, event: Mapping[str, Any]) -> None:
         """Analyze stock price changes and detect patterns."""
-        symbol = kwargs.get("symbol")
-        new_price = kwargs.get("new_price")
-        previous_price = kwargs.get("previous_price")
-        price_change_percent = kwargs.get("price_change_percent")
-        volume = kwargs.get("volume")
-        timestamp = kwargs.get("timestamp")
+        symbol = event.get("symbol")
+        new_price = event.get("new_price")
+        previous_price = event.get("previous_price")
+        price_change_percent = event.get("price_change_percent")
+        volume = event.get("volume")
+        timestamp = event.get("timestamp")
         
         if not all([symbol, new_price, previous_price, price_change_percent]):
             self._logger.warning("Incomplete price change data received")
@@ -316,17 +321,17 @@ class Analyst(Observer):
                         f"average change {avg_volatility:.2f}% over last {len(recent_changes)} updates"
                     )
     
-    def _track_market_event(self, event: str, **kwargs) -> None:
+    def _track_market_event(self, event_name: str, event: Mapping[str, Any]) -> None:
         """Track market events for analysis."""
         with self._lock:
             event_data = {
-                "event": event,
-                "timestamp": kwargs.get("timestamp", datetime.now()),
-                "stock_count": kwargs.get("stock_count", 0)
+                "event": event_name,
+                "timestamp": event.get("timestamp", datetime.now()),
+                "stock_count": event.get("stock_count", 0)
             }
             self._market_events.append(event_data)
             
-        self._logger.info(f"Market event tracked: {event}")
+        self._logger.info(f"Market event tracked: {event_name}")
     
     def _generate_daily_report(self) -> None:
         """Generate daily market analysis report."""
@@ -1,18 +1,50 @@
 """Stock market simulator implementing the Subject pattern."""
 
-import logging
-import threading
 import time
 from datetime import datetime
 from decimal import Decimal
-from typing import Dict, Optional
+from typing import Any, Dict, Optional, Union
 from .subject import Subject
+from .support import RLock, get_logger
+
+# Prices may be exact Decimals or plain floats; floats skip the Decimal
+# context machinery on every tick when exact cents are not required.
+Price = Union[Decimal, float]
+
+
+def _match_price_type(new_price: Price, current_price: Price) -> Price:
+    """Convert a new price to the numeric type of the stock's current price.
+    
+    Decimal and float cannot be subtracted from each other, so a stock keeps
+    the type it was listed with.
+    
+    Args:
+        new_price: Incoming price
+        current_price: Price the stock currently holds
+        
+    Returns:
+        new_price as a Decimal or float, matching current_price
+    """
+    if isinstance(current_price, Decimal):
+        if isinstance(new_price, float):
+            return Decimal(str(new_price))
+    elif isinstance(new_price, Decimal):
+        return float(new_price)
+    return new_price
 
 
 class Stock:
-    """Represents a stock with symbol, price, and metadata."""
+    """Represents a stock with symbol, price, and metadata.
+    
+    Arithmetic follows the numeric type the stock was listed with, so a
+    stock fed floats never touches Decimal; updates of the other type are
+    converted to it.
+    """
+    
+    # One instance per listed symbol; slots drop the per-instance __dict__
+    __slots__ = ("symbol", "price", "volume", "last_updated", "previous_price")
     
-    def __init__(self, symbol: str, price: Decimal, volume: int = 0) -> None:
+    def __init__(self, symbol: str, price: Price, volume: int = 0) -> None:
         """Initialize a stock.
         
         Args:
@@ -24,35 +56,39 @@ class Stock:
         self.price = price
         self.volume = volume
         self.last_updated = datetime.now()
-        self.previous_price: Optional[Decimal] = None
+        self.previous_price: Optional[Price] = None
     
-    def update_price(self, new_price: Decimal, volume: int = 0) -> bool:
+    def update_price(
+        self, new_price: Price, volume: int = 0, timestamp: Optional[datetime] = None
+    ) -> bool:
         """Update stock price and return True if price changed.
         
         Args:
             new_price: New stock price
             volume: Trading volume for this update
+            timestamp: Time of the update; defaults to now
             
         Returns:
             True if price changed, False otherwise
         """
+        new_price = _match_price_type(new_price, self.price)
         if new_price != self.price:
             self.previous_price = self.price
             self.price = new_price
             self.volume = volume
-            self.last_updated = datetime.now()
+            self.last_updated = timestamp or datetime.now()
             return True
         return False
     
     @property
-    def price_change(self) -> Optional[Decimal]:
+    def price_change(self) -> Optional[Price]:
         """Get the price change from previous price."""
         if self.previous_price is not None:
             return self.price - self.previous_price
         return None
     
     @property
-    def price_change_percent(self) -> Optional[Decimal]:
+    def price_change_percent(self) -> Optional[Price]:
         """Get the price change percentage."""
         if self.previous_price is not None and self.previous_price != 0:
             return ((self.price - self.previous_price) / self.previous_price) * 100
@@ -74,11 +110,11 @@ class StockMarket(Subject):
         """
         super().__init__(name)
         self._stocks: Dict[str, Stock] = {}
-        self._market_lock = threading.RLock()
-        self._logger = logging.getLogger(f"{__name__}.{self._name}")
+        self._market_lock = RLock()
+        self._logger = get_logger(f"{__name__}.{self._name}")
         self._is_market_open = False
         
-    def add_stock(self, symbol: str, initial_price: Decimal, volume: int = 0) -> None:
+    def add_stock(self, symbol: str, initial_price: Price, volume: int = 0) -> None:
         """Add a new stock to the market.
         
         Args:
@@ -94,7 +130,7 @@ class StockMarket(Subject):
                 raise ValueError(f"Stock {symbol} already exists in the market")
             
             self._stocks[symbol] = Stock(symbol, initial_price, volume)
-            self._logger.info(f"Added stock {symbol} with initial price ${initial_price}")
+            self._logger.info("Added stock %s with initial price $%s", symbol, initial_price)
     
     def remove_stock(self, symbol: str) -> None:
         """Remove a stock from the market.
@@ -110,15 +146,22 @@ class StockMarket(Subject):
                 raise KeyError(f"Stock {symbol} not found in the market")
             
             del self._stocks[symbol]
-            self._logger.info(f"Removed stock {symbol} from market")
+            self._logger.info("Removed stock %s from market", symbol)
     
-    def update_stock_price(self, symbol: str, new_price: Decimal, volume: int = 0) -> None:
+    def update_stock_price(
+        self,
+        symbol: str,
+        new_price: Price,
+        volume: int = 0,
+        timestamp: Optional[datetime] = None
+    ) -> None:
         """Update stock price and notify observers if price changed.
         
         Args:
             symbol: Stock symbol to update
             new_price: New price for the stock
             volume: Trading volume
+            timestamp: Time of the update; defaults to now
             
         Raises:
             KeyError: If stock doesn't exist
@@ -127,25 +170,83 @@ class StockMarket(Subject):
             if symbol not in self._stocks:
                 raise KeyError(f"Stock {symbol} not found in the market")
             
-            stock = self._stocks[symbol]
-            price_changed = stock.update_price(new_price, volume)
+            event = self._apply_price_update(symbol, new_price, volume, timestamp)
         
         # Notify outside the lock to prevent deadlocks
-        if price_changed:
-            self._logger.info(f"Stock {symbol} price updated: ${new_price} (volume: {volume})")
-            self.notify(
-                event_type="price_change",
-                stock=stock,
-                symbol=symbol,
-                new_price=new_price,
-                previous_price=stock.previous_price,
-                price_change=stock.price_change,
-                price_change_percent=stock.price_change_percent,
-                volume=volume,
-                timestamp=stock.last_updated
-            )
-    
-    def get_stock_price(self, symbol: str) -> Decimal:
+        if event is not None:
+            self._notify_price_change(event)
+    
+    def update_batch(self, updates: list[tuple[str, Price, int]]) -> None:
+        """Apply a burst of price updates sharing one timestamp and lock acquisition.
+        
+        Args:
+            updates: (symbol, new_price, volume) tuples applied in order
+            
+        Raises:
+            KeyError: If any stock doesn't exist; no update is applied
+        """
+        timestamp = datetime.now()
+        
+        with self._market_lock:
+            for symbol, _, _ in updates:
+                if symbol not in self._stocks:
+                    raise KeyError(f"Stock {symbol} not found in the market")
+            
+            events = [
+                self._apply_price_update(symbol, new_price, volume, timestamp)
+                for symbol, new_price, volume in updates
+            ]
+        
+        for event in events:
+            if event is not None:
+                self._notify_price_change(event)
+    
+    def _apply_price_update(
+        self,
+        symbol: str,
+        new_price: Price,
+        volume: int,
+        timestamp: Optional[datetime]
+    ) -> Optional[Dict[str, Any]]:
+        """Update a stock and snapshot its price-change event.
+        
+        Must be called with the market lock held, so a concurrent update
+        cannot change the stock between the update and the notification.
+        
+        Returns:
+            Notification event, or None if the price did not change
+        """
+        stock = self._stocks[symbol]
+        if not stock.update_price(new_price, volume, timestamp):
+            return None
+        
+        # The stock may have converted new_price to its own numeric type
+        new_price = stock.price
+        previous_price = stock.previous_price
+        price_change = new_price - previous_price
+        return {
+            "event_type": "price_change",
+            "stock": stock,
+            "symbol": symbol,
+            "new_price": new_price,
+            "previous_price": previous_price,
+            "price_change": price_change,
+            "price_change_percent": (
+                (price_change / previous_price) * 100 if previous_price else None
+            ),
+            "volume": volume,
+            "timestamp": stock.last_updated,
+        }
+    
+    def _notify_price_change(self, event: Dict[str, Any]) -> None:
+        """Log and broadcast a price-change event to observers."""
+        self._logger.info(
+            "Stock %s price updated: $%s (volume: %s)",
+            event["symbol"], event["new_price"], event["volume"]
+        )
+        self.notify(event)
+    
+    def get_stock_price(self, symbol: str) -> Price:
         """Get current price of a stock.
         
         Args:
@@ -157,10 +258,11 @@ class StockMarket(Subject):
         Raises:
             KeyError: If stock doesn't exist
         """
-        with self._market_lock:
-            if symbol not in self._stocks:
-                raise KeyError(f"Stock {symbol} not found in the market")
-            return self._stocks[symbol].price
+        # A single dict lookup is atomic under the GIL, so reads skip the lock
+        stock = self._stocks.get(symbol)
+        if stock is None:
+            raise KeyError(f"Stock {symbol} not found in the market")
+        return stock.price
     
     def get_stock_info(self, symbol: str) -> Stock:
         """Get complete stock information.
@@ -174,10 +276,10 @@ class StockMarket(Subject):
         Raises:
             KeyError: If stock doesn't exist
         """
-        with self._market_lock:
-            if symbol not in self._stocks:
-                raise KeyError(f"Stock {symbol} not found in the market")
-            return self._stocks[symbol]
+        stock = self._stocks.get(symbol)
+        if stock is None:
+            raise KeyError(f"Stock {symbol} not found in the market")
+        return stock
     
     def get_all_stocks(self) -> Dict[str, Stock]:
         """Get information for all stocks in the market.
@@ -185,8 +287,7 @@ class StockMarket(Subject):
         Returns:
             Dictionary of all stocks indexed by symbol
         """
-        with self._market_lock:
-            return self._stocks.copy()
+        return self._stocks.copy()
     
     def open_market(self) -> None:
         """Open the market for trading."""
@@ -194,11 +295,11 @@ class StockMarket(Subject):
             self._is_market_open = True
             self._logger.info("Market opened")
             
-        self.notify(
-            event_type="market_opened",
-            timestamp=datetime.now(),
-            stock_count=len(self._stocks)
-        )
+        self.notify({
+            "event_type": "market_opened",
+            "timestamp": datetime.now(),
+            "stock_count": len(self._stocks),
+        })
     
     def close_market(self) -> None:
         """Close the market."""
@@ -206,11 +307,11 @@ class StockMarket(Subject):
             self._is_market_open = False
             self._logger.info("Market closed")
             
-        self.notify(
-            event_type="market_closed",
-            timestamp=datetime.now(),
-            stock_count=len(self._stocks)
-        )
+        self.notify({
+            "event_type": "market_closed",
+            "timestamp": datetime.now(),
+            "stock_count": len(self._stocks),
+        })
     
     @property
     def is_market_open(self) -> bool:
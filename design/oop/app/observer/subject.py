@@ -1,16 +1,26 @@
 """Subject class for the Observer pattern with thread safety."""
 
 import logging
-import threading
-from typing import Any, Set
+import weakref
+from typing import Any, FrozenSet, Mapping
 from .observer import Observer
+from .support import RLock, get_logger
+
+# Per-type result of the Observer ABC check, so attach skips the ABC
+# machinery for observer classes it has already seen
+_observer_type_cache: "weakref.WeakKeyDictionary[type, bool]" = weakref.WeakKeyDictionary()
 
 
 class Subject:
     """Subject class that maintains a list of observers and notifies them of state changes.
     
-    This implementation is thread-safe using locks to handle concurrent access
-    to the observer list and notifications.
+    This implementation is thread-safe using a copy-on-write observer set:
+    attach/detach build a new frozenset under a write lock and swap it in as a
+    whole, so notify and the query methods read a consistent snapshot without
+    locking.
+    
+    Observers are held through weak references, so an observer that is no
+    longer referenced elsewhere is dropped automatically without a detach.
     """
 
     def __init__(self, name: str = "Subject") -> None:
@@ -19,10 +29,10 @@ class Subject:
         Args:
             name: Name identifier for the subject
         """
-        self._observers: Set[Observer] = set()
-        self._lock = threading.RLock()  # Reentrant lock for thread safety
+        self._observers: FrozenSet[weakref.ref] = frozenset()
+        self._write_lock = RLock()  # Serializes attach/detach only
         self._name = name
-        self._logger = logging.getLogger(f"{__name__}.{self._name}")
+        self._logger = get_logger(f"{__name__}.{self._name}")
 
     def attach(self, observer: Observer) -> None:
         """Attach an observer to the subject.
@@ -33,15 +43,25 @@ class Subject:
         Raises:
             TypeError: If observer doesn't implement Observer interface
         """
-        if not isinstance(observer, Observer):
+        observer_type = type(observer)
+        is_observer = _observer_type_cache.get(observer_type)
+        if is_observer is None:
+            is_observer = _observer_type_cache[observer_type] = isinstance(observer, Observer)
+        if not is_observer:
             raise TypeError(f"Observer must implement Observer interface, got {type(observer)}")
         
-        with self._lock:
-            if observer not in self._observers:
-                self._observers.add(observer)
-                self._logger.info(f"Observer '{observer.name}' attached to subject '{self._name}'")
-            else:
-                self._logger.debug(f"Observer '{observer.name}' already attached to subject '{self._name}'")
+        observer_ref = weakref.ref(observer, self._discard_dead_ref)
+        
+        with self._write_lock:
+            # One set operation; the length tells whether the observer was new
+            observers = self._observers | {observer_ref}
+            if len(observers) != len(self._observers):
+                self._observers = observers
+                self._logger.info("Observer '%s' attached to subject '%s'", observer.name, self._name)
+            elif self._logger.isEnabledFor(logging.DEBUG):
+                self._logger.debug(
+                    "Observer '%s' already attached to subject '%s'", observer.name, self._name
+                )
 
     def detach(self, observer: Observer) -> None:
         """Detach an observer from the subject.
@@ -49,42 +69,81 @@ class Subject:
         Args:
             observer: Observer to detach
         """
-        with self._lock:
-            if observer in self._observers:
-                self._observers.remove(observer)
-                self._logger.info(f"Observer '{observer.name}' detached from subject '{self._name}'")
-            else:
-                self._logger.debug(f"Observer '{observer.name}' not found in subject '{self._name}'")
+        observer_ref = weakref.ref(observer)
+        
+        with self._write_lock:
+            observers = self._observers - {observer_ref}
+            if len(observers) != len(self._observers):
+                self._observers = observers
+                self._logger.info("Observer '%s' detached from subject '%s'", observer.name, self._name)
+            elif self._logger.isEnabledFor(logging.DEBUG):
+                self._logger.debug("Observer '%s' not found in subject '%s'", observer.name, self._name)
 
-    def notify(self, *args, **kwargs) -> None:
+    def notify(self, event: Mapping[str, Any]) -> None:
         """Notify all attached observers of a state change.
         
+        The same event mapping is passed to every observer, so it is built
+        once per notification rather than unpacked per observer.
+        
         Args:
-            *args: Variable positional arguments to pass to observers
-            **kwargs: Variable keyword arguments to pass to observers
+            event: Update data to pass to observers
         """
-        with self._lock:
-            # Create a copy of observers to avoid modification during iteration
-            observers_copy = self._observers.copy()
-            observer_count = len(observers_copy)
+        # Fast path: an empty snapshot needs no weakref resolution or allocation
+        if not self._observers:
+            return
+        
+        # Hold strong references only for the duration of the notification
+        observers_copy = self._live_observers()
+        observer_count = len(observers_copy)
         
         if observer_count == 0:
-            self._logger.debug(f"No observers to notify for subject '{self._name}'")
+            self._logger.debug("No live observers to notify for subject '%s'", self._name)
             return
         
-        self._logger.info(f"Notifying {observer_count} observers for subject '{self._name}'")
+        self._logger.info("Notifying %d observers for subject '%s'", observer_count, self._name)
         
-        # Notify observers outside the lock to avoid deadlocks
         failed_notifications = []
         for observer in observers_copy:
             try:
-                observer.update(self, *args, **kwargs)
+                observer.update(self, event)
             except Exception as e:
                 failed_notifications.append((observer.name, str(e)))
-                self._logger.error(f"Failed to notify observer '{observer.name}': {e}")
+                self._logger.error("Failed to notify observer '%s': %s", observer.name, e)
         
         if failed_notifications:
-            self._logger.warning(f"Failed to notify {len(failed_notifications)} observers")
+            self._logger.warning("Failed to notify %d observers", len(failed_notifications))
+
+    def _live_observers(self) -> list[Observer]:
+        """Resolve the current observer snapshot to strong references.
+        
+        Returns:
+            List of attached observers that are still alive
+        """
+        # The observer set is immutable, so a single load is a safe snapshot
+        observers = (observer_ref() for observer_ref in self._observers)
+        return [observer for observer in observers if observer is not None]
+
+    def _discard_dead_ref(self, observer_ref: weakref.ref) -> None:
+        """Remove the reference of an observer that has been garbage collected.
+        
+        Args:
+            observer_ref: Dead weak reference passed by the weakref callback
+        """
+        with self._write_lock:
+            self._observers = self._observers - {observer_ref}
+        self._logger.debug("Dropped collected observer from subject '%s'", self._name)
+
+    def has_observer(self, observer: Observer) -> bool:
+        """Check whether an observer is currently attached.
+        
+        Args:
+            observer: Observer to look for
+            
+        Returns:
+            True if the observer is attached
+        """
+        # Live weak references compare equal when their referents are the same
+        return weakref.ref(observer) in self._observers
 
     def get_observer_count(self) -> int:
         """Get the current number of attached observers.
@@ -92,8 +151,7 @@ class Subject:
         Returns:
             Number of attached observers
         """
-        with self._lock:
-            return len(self._observers)
+        return len(self._live_observers())
 
     def get_observer_names(self) -> list[str]:
         """Get names of all attached observers.
@@ -101,8 +159,7 @@ class Subject:
         Returns:
             List of observer names
         """
-        with self._lock:
-            return [observer.name for observer in self._observers]
+        return [observer.name for observer in self._live_observers()]
 
     @property
     def name(self) -> str:
@@ -0,0 +1,32 @@
+"""Shared locking and logging helpers for the Observer pattern modules."""
+
+import logging
+
+# Prefer the C-implemented reentrant lock when it is available
+try:
+    from fastrlock.rlock import FastRLock as RLock
+    HAS_FASTRLOCK = True
+except ImportError:
+    from threading import RLock
+    HAS_FASTRLOCK = False
+
+# Loggers by full name; logging.getLogger takes the logging module lock
+_LOGGER_CACHE: dict[str, logging.Logger] = {}
+
+
+def get_logger(name: str) -> logging.Logger:
+    """Return the named logger, bypassing the logging lock for names seen before.
+    
+    Args:
+        name: Full dotted logger name
+        
+    Returns:
+        The logger registered under that name
+    """
+    logger = _LOGGER_CACHE.get(name)
+    if logger is None:
+        logger = _LOGGER_CACHE.setdefault(name, logging.getLogger(name))
+    return logger
+
+
+__all__ = ["HAS_FASTRLOCK", "RLock", "get_logger"]
@@ -5,12 +5,17 @@ This module implements a thread-safe Singleton pattern to ensure only one
 database connection manager instance exists across multiple threads.
 """
 
+import itertools
 import threading
 import logging
 import time
 from typing import Optional
 from datetime import datetime
 
+# Set once the shared stream handler is attached, so re-initialisation
+# does not have to inspect the logger's handler list
+_handler_installed = False
+
 
 class DatabaseConnectionManager:
     """
@@ -31,33 +36,44 @@ class DatabaseConnectionManager:
         Returns:
             DatabaseConnectionManager: The singleton instance
         """
-        if cls._instance is None:
+        instance = cls._instance
+        if instance is None:
             with cls._lock:
-                if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-        return cls._instance
+                instance = cls._instance
+                if instance is None:
+                    instance = cls._instance = super().__new__(cls)
+        return instance
     
     def __init__(self) -> None:
         """
         Initialize the database connection manager.
         
-        Only initializes once due to singleton pattern.
+        Only initializes once due to singleton pattern. After the first call
+        this returns on a plain attribute check without taking the lock.
         """
-        if not self._initialized:
-            with self._lock:
-                if not self._initialized:
-                    self._connection_count = 0
-                    self._active_connections: dict[int, str] = {}
-                    self._creation_time = datetime.now()
-                    self._thread_id = threading.get_ident()
-                    self._logger = self._setup_logger()
-                    
-                    self._logger.info(
-                        f"DatabaseConnectionManager singleton created at {self._creation_time} "
-                        f"by thread {self._thread_id}"
-                    )
-                    
-                    DatabaseConnectionManager._initialized = True
+        if DatabaseConnectionManager._initialized:
+            return
+        
+        with self._lock:
+            if DatabaseConnectionManager._initialized:
+                return
+            
+            # itertools.count and single-key dict operations are atomic under
+            # the GIL, so connection bookkeeping needs no lock.
+            self._next_connection_number = itertools.count(1).__next__
+            self._connections_per_thread: dict[int, int] = {}
+            self._active_connections: dict[int, str] = {}
+            self._creation_time = datetime.now()
+            self._thread_id = threading.get_ident()
+            self._logger = self._setup_logger()
+            
+            self._logger.info(
+                "DatabaseConnectionManager singleton created at %s by thread %s",
+                self._creation_time,
+                self._thread_id,
+            )
+            
+            DatabaseConnectionManager._initialized = True
     
     def _setup_logger(self) -> logging.Logger:
         """
@@ -66,10 +82,13 @@ class DatabaseConnectionManager:
         Returns:
             logging.Logger: Configured logger instance
         """
+        global _handler_installed
+        
         logger = logging.getLogger('DatabaseConnectionManager')
         logger.setLevel(logging.INFO)
         
-        if not logger.handlers:
+        if not _handler_installed:
+            _handler_installed = True
             handler = logging.StreamHandler()
             formatter = logging.Formatter(
                 '%(asctime)s - %(name)s - %(levelname)s - [Thread-%(thread)d] - %(message)s'
@@ -88,17 +107,21 @@ class DatabaseConnectionManager:
         """
         thread_id = threading.get_ident()
         
-        with self._lock:
-            self._connection_count += 1
-            connection_id = f"conn_{self._connection_count}"
-            self._active_connections[thread_id] = connection_id
-            
-            self._logger.info(
-                f"Connection {connection_id} created for thread {thread_id}. "
-                f"Total active connections: {len(self._active_connections)}"
-            )
-            
-            return connection_id
+        connection_id = f"conn_{self._next_connection_number()}"
+        self._active_connections[thread_id] = connection_id
+        # Only the owning thread ever writes its own counter entry
+        self._connections_per_thread[thread_id] = (
+            self._connections_per_thread.get(thread_id, 0) + 1
+        )
+        
+        self._logger.info(
+            "Connection %s created for thread %s. Total active connections: %d",
+            connection_id,
+            thread_id,
+            len(self._active_connections),
+        )
+        
+        return connection_id
     
     def close_connection(self) -> None:
         """
@@ -106,16 +129,17 @@ class DatabaseConnectionManager:
         """
         thread_id = threading.get_ident()
         
-        with self._lock:
-            if thread_id in self._active_connections:
-                connection_id = self._active_connections.pop(thread_id)
-                
-                self._logger.info(
-                    f"Connection {connection_id} closed for thread {thread_id}. "
-                    f"Remaining active connections: {len(self._active_connections)}"
-                )
-            else:
-                self._logger.warning(f"No active connection found for thread {thread_id}")
+        connection_id = self._active_connections.pop(thread_id, None)
+        
+        if connection_id is not None:
+            self._logger.info(
+                "Connection %s closed for thread %s. Remaining active connections: %d",
+                connection_id,
+                thread_id,
+                len(self._active_connections),
+            )
+        else:
+            self._logger.warning("No active connection found for thread %s", thread_id)
     
     def get_instance_info(self) -> dict[str, any]:
         """
@@ -128,7 +152,7 @@ class DatabaseConnectionManager:
             'creation_time': self._creation_time,
             'creator_thread_id': self._thread_id,
             'current_thread_id': threading.get_ident(),
-            'total_connections_created': self._connection_count,
+            'total_connections_created': sum(list(self._connections_per_thread.values())),
             'active_connections': len(self._active_connections),
             'active_connection_details': dict(self._active_connections),
             'instance_id': id(self)
@@ -142,15 +166,21 @@ class DatabaseConnectionManager:
             operation_name: Name of the operation being performed
             duration: Time to simulate the operation (in seconds)
         """
+        # The thread and connection lookups only feed the log lines, so skip
+        # them entirely when INFO is filtered out
+        if not self._logger.isEnabledFor(logging.INFO):
+            time.sleep(duration)
+            return
+        
         thread_id = threading.get_ident()
         connection_id = self._active_connections.get(thread_id, "No connection")
         
         self._logger.info(
-            f"Thread {thread_id} starting '{operation_name}' using {connection_id}"
+            "Thread %s starting '%s' using %s", thread_id, operation_name, connection_id
         )
         
         time.sleep(duration)
         
         self._logger.info(
-            f"Thread {thread_id} completed '{operation_name}' using {connection_id}"
+            "Thread %s completed '%s' using %s", thread_id, operation_name, connection_id
         )
\ No newline at end of file
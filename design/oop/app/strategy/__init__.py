@@ -9,6 +9,8 @@ from .sorting_strategy import SortingStrategy
 from .quicksort_strategy import QuickSortStrategy
 from .mergesort_strategy import MergeSortStrategy
 from .heapsort_strategy import HeapSortStrategy
+from .insertion_sort_strategy import InsertionSortStrategy
+from .bitonic_strategy import BitonicSortStrategy
 from .data_sorter import DataSorter
 
 __all__ = [
@@ -16,5 +18,7 @@ __all__ = [
     'QuickSortStrategy', 
     'MergeSortStrategy',
     'HeapSortStrategy',
+    'InsertionSortStrategy',
+    'BitonicSortStrategy',
     'DataSorter'
 ]
\ No newline at end of file
@@ -0,0 +1,165 @@
+"""
+Bitonic sort implementation using the Strategy pattern.
+
+Bitonic sort is a sorting network: the sequence of compare-exchange steps
+depends only on the input length, never on the values. That data-oblivious
+structure, with a fixed depth of O(log² n) stages, is what makes it suitable
+for SIMD and GPU backends.
+"""
+
+from typing import Any, ClassVar, List, TypeVar
+from .sorting_strategy import SortingStrategy, _numeric_buffer, _write_back
+
+# NumPy is optional: numeric lists run each network stage as vectorized ops
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+T = TypeVar('T')
+
+
+class _Padding:
+    """Sentinel that sorts after every real element."""
+    
+    def __lt__(self, other: Any) -> bool:
+        return False
+    
+    def __gt__(self, other: Any) -> bool:
+        return other is not self
+
+
+_PAD = _Padding()
+
+
+def _next_power_of_two(n: int) -> int:
+    """Return the smallest power of two that is at least n."""
+    return 1 << (n - 1).bit_length()
+
+
+def _bitonic_numpy(arr: "np.ndarray") -> "np.ndarray":
+    """
+    Run the bitonic network over a NumPy array, one vectorized op per stage.
+    
+    Args:
+        arr: Int64 or float64 array to sort
+        
+    Returns:
+        New sorted array of the same length
+    """
+    n = arr.shape[0]
+    size = _next_power_of_two(n)
+    # Pad with the dtype's largest value so padding ends up at the tail
+    pad_value = np.inf if arr.dtype.kind == 'f' else np.iinfo(arr.dtype).max
+    buf = np.full(size, pad_value, dtype=arr.dtype)
+    buf[:n] = arr
+    
+    idx = np.arange(size)
+    k = 2
+    while k <= size:
+        j = k // 2
+        while j > 0:
+            # Each pair (low, high) differs only in bit j
+            low = idx[(idx & j) == 0]
+            high = low | j
+            ascending = (low & k) == 0
+            low_values = buf[low]
+            high_values = buf[high]
+            swap = np.where(ascending, low_values > high_values, low_values < high_values)
+            buf[low[swap]] = high_values[swap]
+            buf[high[swap]] = low_values[swap]
+            j //= 2
+        k *= 2
+    
+    return buf[:n]
+
+
+def _bitonic_python(arr: List[Any]) -> None:
+    """
+    Run the bitonic network over a list padded to a power of two, in place.
+    
+    Args:
+        arr: List whose length is a power of two (modified in-place)
+    """
+    size = len(arr)
+    k = 2
+    while k <= size:
+        j = k // 2
+        while j > 0:
+            for low in range(size):
+                high = low ^ j
+                if high <= low:
+                    continue
+                low_value = arr[low]
+                high_value = arr[high]
+                if (low & k) == 0:
+                    if low_value > high_value:
+                        arr[low] = high_value
+                        arr[high] = low_value
+                elif high_value > low_value:
+                    arr[low] = high_value
+                    arr[high] = low_value
+            j //= 2
+        k *= 2
+
+
+class BitonicSortStrategy(SortingStrategy[T]):
+    """
+    Bitonic sorting network padded to the next power of two.
+    
+    Time Complexity:
+    - Best Case: O(n log² n) - the network performs the same steps for any input
+    - Average Case: O(n log² n)
+    - Worst Case: O(n log² n)
+    
+    Space Complexity: O(n) - padded working buffer
+    
+    Characteristics:
+    - Data-oblivious: compare-exchange order depends only on the length
+    - Fixed O(log² n) stage depth, each stage fully parallel
+    - Not stable (relative order of equal elements may change)
+    - Homogeneous int/float lists run each stage as a vectorized NumPy op
+      when available; this is the hook for future SIMD/GPU backends
+    """
+    
+    name: ClassVar[str] = "BitonicSort"
+    time_complexity_best: ClassVar[str] = "O(n log² n)"
+    time_complexity_average: ClassVar[str] = "O(n log² n)"
+    time_complexity_worst: ClassVar[str] = "O(n log² n)"
+    space_complexity: ClassVar[str] = "O(n)"
+    
+    def sort(self, data: List[T]) -> List[T]:
+        """
+        Sort data using the bitonic sorting network.
+        
+        Args:
+            data: List of comparable elements
+            
+        Returns:
+            New sorted list in ascending order
+        """
+        # Create a copy to avoid modifying the original list
+        result = list(data)
+        self._sort_inplace(result)
+        return result
+    
+    def _sort_inplace(self, arr: List[T]) -> None:
+        """
+        Sort arr in place using the bitonic sorting network.
+        
+        Args:
+            arr: List to sort (modified in-place)
+        """
+        n = len(arr)
+        if n <= 1:
+            return
+        
+        buffer = _numeric_buffer(arr)
+        if buffer is not None:
+            _write_back(arr, _bitonic_numpy(buffer).tolist())
+            return
+        
+        padded = list(arr) + [_PAD] * (_next_power_of_two(n) - n)
+        _bitonic_python(padded)
+        _write_back(arr, padded[:n])
@@ -7,14 +7,57 @@ algorithms that can be switched at runtime.
 
 import time
 import logging
-from typing import List, TypeVar, Optional, Dict, Any
+from array import array
+from collections import deque
+from typing import List, TypeVar, Optional, Dict, Any, Deque, MutableSequence, Tuple
 from .sorting_strategy import SortingStrategy
 from .quicksort_strategy import QuickSortStrategy
+from .mergesort_strategy import MergeSortStrategy
+from .heapsort_strategy import HeapSortStrategy
+from .insertion_sort_strategy import InsertionSortStrategy
 
 T = TypeVar('T')
 
 logger = logging.getLogger(__name__)
 
+# Inputs shorter than this are insertion sorted by sort_auto
+AUTO_SMALL_INPUT_SIZE = 32
+
+# Number of leading elements sort_auto inspects for existing order
+AUTO_SAMPLE_SIZE = 64
+
+
+def _longest_run_fraction(sample: List[Any]) -> float:
+    """
+    Measure how much of a sample is covered by its longest monotonic run.
+    
+    Args:
+        sample: Leading elements of the data to sort
+        
+    Returns:
+        Length of the longest non-decreasing or non-increasing run divided
+        by the sample length
+    """
+    longest = ascending = descending = 1
+    for previous, current in zip(sample, sample[1:]):
+        ascending = ascending + 1 if previous <= current else 1
+        descending = descending + 1 if current <= previous else 1
+        longest = max(longest, ascending, descending)
+    return longest / len(sample)
+
+
+# Working buffer types accepted by DataSorter
+BUFFER_TYPES = ('list', 'array')
+
+
+# Strategy constructors used by DataSorter.sort_auto
+_AUTO_STRATEGY_FACTORIES = {
+    'insertion': InsertionSortStrategy.instance,
+    'heap': HeapSortStrategy.instance,
+    'merge': MergeSortStrategy.instance,
+    'quick': lambda: QuickSortStrategy.instance(classical=True),
+}
+
 
 class DataSorter:
     """
@@ -25,23 +68,57 @@ class DataSorter:
     can be changed at runtime to adapt to different performance requirements.
     
     Example:
-        sorter = DataSorter(QuickSortStrategy())
+        sorter = DataSorter(QuickSortStrategy.instance())
         result = sorter.sort([3, 1, 4, 1, 5, 9, 2, 6])
         
         # Switch strategy at runtime
-        sorter.set_strategy(MergeSortStrategy())
+        sorter.set_strategy(MergeSortStrategy.instance())
         result = sorter.sort([3, 1, 4, 1, 5, 9, 2, 6])
     """
     
-    def __init__(self, strategy: Optional[SortingStrategy[T]] = None):
+    def __init__(
+        self,
+        strategy: Optional[SortingStrategy[T]] = None,
+        track_history: bool = False,
+        history_size: int = 1024,
+        cache_results: bool = False,
+        buffer_type: str = 'list'
+    ):
         """
         Initialize DataSorter with an optional sorting strategy.
         
         Args:
-            strategy: Initial sorting strategy to use. Defaults to QuickSort.
+            strategy: Initial sorting strategy to use. Defaults to QuickSortStrategy,
+                which runs the built-in TimSort unless classical=True.
+            track_history: Whether to time each sort and record it in the history
+            history_size: Maximum number of history entries kept when tracking
+            cache_results: Whether to reuse the last result when the same data
+                is sorted again with the same strategy. A lookup compares the
+                input with the cached snapshot by value (O(n), cheaper than an
+                O(n log n) re-sort) and each store copies both the input and
+                the result, so enable it only when identical data is re-sorted
+                often. Cache hits perform no sort and add no history entry.
+            buffer_type: 'list' to sort a list copy of the data, or 'array' to
+                sort integer data in a packed signed 64-bit ``array.array``
+                (8 bytes per element instead of a pointer plus an int object).
+                Data that does not fit falls back to a list.
+                
+        Raises:
+            ValueError: If buffer_type is not 'list' or 'array'
         """
-        self._strategy = strategy or QuickSortStrategy()
-        self._sort_history: List[Dict[str, Any]] = []
+        if buffer_type not in BUFFER_TYPES:
+            raise ValueError(f"buffer_type must be one of {BUFFER_TYPES}, got {buffer_type!r}")
+        
+        self._strategy = strategy or QuickSortStrategy.instance()
+        self._sort_history: Optional[Deque[Dict[str, Any]]] = (
+            deque(maxlen=history_size) if track_history else None
+        )
+        self._cache_results = cache_results
+        self._buffer_type = buffer_type
+        # Snapshot of the last input and its sorted result
+        self._result_cache: Optional[Tuple[List[T], List[T]]] = None
+        # Algorithm chosen by sort_auto, by (input length, memory budget)
+        self._auto_decisions: Dict[Tuple[int, Optional[str]], str] = {}
     
     def set_strategy(self, strategy: SortingStrategy[T]) -> None:
         """
@@ -52,6 +129,7 @@ class DataSorter:
         """
         logger.info(f"Switching sorting strategy from {self._strategy.name} to {strategy.name}")
         self._strategy = strategy
+        self._result_cache = None
     
     def get_strategy(self) -> SortingStrategy[T]:
         """
@@ -83,53 +161,196 @@ class DataSorter:
         
         logger.info(f"Sorting {len(data)} elements using {self._strategy.name}")
         
-        start_time = time.perf_counter()
-        result = self._strategy.sort(data)
-        end_time = time.perf_counter()
+        if self._cache_results:
+            cached = self._cached_result(data)
+            if cached is not None:
+                return cached
         
-        execution_time = end_time - start_time
+        if self._sort_history is None:
+            result = self._run_strategy(data)
+            self._store_result(data, result)
+            return result
         
-        # Record sorting operation for analysis
+        start_ns = time.perf_counter_ns()
+        result = self._run_strategy(data)
+        elapsed_ns = time.perf_counter_ns() - start_ns
+        self._store_result(data, result)
+        
+        # Record sorting operation for analysis; seconds/ms are derived on read
         sort_record = {
             'algorithm': self._strategy.name,
             'input_size': len(data),
-            'execution_time_seconds': execution_time,
-            'execution_time_ms': execution_time * 1000,
+            'execution_time_ns': elapsed_ns,
             'timestamp': time.time()
         }
         self._sort_history.append(sort_record)
         
-        logger.info(f"Sorting completed in {execution_time * 1000:.2f}ms using {self._strategy.name}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Sorting completed in %.2fms using %s", elapsed_ns / 1e6, self._strategy.name)
         
         return result
     
+    def _new_buffer(self, data: List[T]) -> MutableSequence[T]:
+        """
+        Copy data into the configured working buffer type.
+        
+        Args:
+            data: List about to be sorted
+            
+        Returns:
+            Signed 64-bit ``array.array`` in 'array' mode when every element
+            is an exact int that fits, otherwise a list copy of data
+        """
+        # array('q') would accept int subclasses (bool, IntEnum) and hand back
+        # plain ints, so only exact ints take the packed path
+        if self._buffer_type == 'array' and all(type(value) is int for value in data):
+            try:
+                return array('q', data)
+            except OverflowError:
+                # Oversized values keep the polymorphic list path
+                pass
+        return list(data)
+    
+    def _run_strategy(self, data: List[T]) -> List[T]:
+        """
+        Sort a copy of data with the current strategy.
+        
+        Args:
+            data: List to sort (left unmodified)
+            
+        Returns:
+            New sorted list
+        """
+        if self._buffer_type == 'list':
+            return self._strategy.sort(data)
+        
+        buffer = self._new_buffer(data)
+        self._strategy._sort_inplace(buffer)
+        return buffer if isinstance(buffer, list) else buffer.tolist()
+    
+    def _cached_result(self, data: List[T]) -> Optional[List[T]]:
+        """
+        Look up the cached result for data.
+        
+        Args:
+            data: List about to be sorted
+            
+        Returns:
+            Copy of the cached sorted list, or None if data differs from the
+            last cached input
+        """
+        if self._result_cache is None:
+            return None
+        
+        cached_input, cached_result = self._result_cache
+        # Compared by value so in-place edits to the caller's list miss the cache
+        if data != cached_input:
+            return None
+        
+        return cached_result.copy()
+    
+    def _store_result(self, data: List[T], result: List[T]) -> None:
+        """
+        Remember the sorted result for data when result caching is enabled.
+        
+        Args:
+            data: List that was sorted
+            result: Sorted list returned to the caller
+        """
+        if self._cache_results:
+            self._result_cache = (data.copy(), result.copy())
+    
+    def sort_auto(self, data: List[T], memory_budget: Optional[str] = None) -> List[T]:
+        """
+        Pick a strategy from the shape of the data, then sort with it.
+        
+        Dispatch rules, checked in order:
+        - fewer than 32 elements: insertion sort
+        - longest ascending/descending run covers over half of the first
+          64 elements: MergeSort
+        - memory_budget == 'tight': HeapSort (O(1) extra space)
+        - otherwise: classical 3-way QuickSort
+        
+        The decision is cached per (input length, memory_budget), so later
+        lists of the same length reuse it without rescanning. The chosen
+        strategy becomes the sorter's current strategy.
+        
+        Args:
+            data: List of comparable elements to sort
+            memory_budget: 'tight' to avoid strategies needing O(n) extra memory
+            
+        Returns:
+            New list with elements sorted in ascending order
+            
+        Raises:
+            ValueError: If data list is None
+        """
+        if data is None:
+            raise ValueError("Data cannot be None")
+        
+        strategy = self._choose_strategy(data, memory_budget)
+        if strategy is not self._strategy:
+            self.set_strategy(strategy)
+        return self.sort(data)
+    
+    def _choose_strategy(self, data: List[T], memory_budget: Optional[str]) -> SortingStrategy[T]:
+        """
+        Select the strategy sort_auto should use for data.
+        
+        Args:
+            data: List about to be sorted
+            memory_budget: 'tight' to avoid strategies needing O(n) extra memory
+            
+        Returns:
+            Shared strategy instance for the selected algorithm
+        """
+        decision_key = (len(data), memory_budget)
+        key = self._auto_decisions.get(decision_key)
+        if key is None:
+            if len(data) < AUTO_SMALL_INPUT_SIZE:
+                key = 'insertion'
+            elif _longest_run_fraction(data[:AUTO_SAMPLE_SIZE]) > 0.5:
+                key = 'merge'
+            elif memory_budget == 'tight':
+                key = 'heap'
+            else:
+                key = 'quick'
+            self._auto_decisions[decision_key] = key
+        
+        # Shared instances, so repeated calls don't re-switch
+        return _AUTO_STRATEGY_FACTORIES[key]()
+    
     def get_algorithm_info(self) -> Dict[str, str]:
         """
         Get detailed information about the current sorting algorithm.
         
         Returns:
-            Dictionary containing algorithm complexity information
-        """
-        return {
-            'name': self._strategy.name,
-            'time_complexity_best': self._strategy.time_complexity_best,
-            'time_complexity_average': self._strategy.time_complexity_average,
-            'time_complexity_worst': self._strategy.time_complexity_worst,
-            'space_complexity': self._strategy.space_complexity
-        }
+            Dictionary containing algorithm complexity information, copied
+            from the strategy's memoized mapping
+        """
+        return dict(self._strategy.algorithm_info)
     
     def get_sort_history(self) -> List[Dict[str, Any]]:
         """
-        Get history of all sorting operations performed.
+        Get history of the most recent sorting operations performed.
         
         Returns:
-            List of dictionaries containing sorting operation details
+            List of dictionaries containing sorting operation details,
+            empty when history tracking is disabled
         """
-        return self._sort_history.copy()
+        return [
+            {
+                **record,
+                'execution_time_seconds': record['execution_time_ns'] / 1e9,
+                'execution_time_ms': record['execution_time_ns'] / 1e6,
+            }
+            for record in self._sort_history or ()
+        ]
     
     def clear_history(self) -> None:
         """Clear the sorting operation history."""
-        self._sort_history.clear()
+        if self._sort_history is not None:
+            self._sort_history.clear()
         logger.info("Sort history cleared")
     
     def benchmark_current_strategy(self, data: List[T], runs: int = 5) -> Dict[str, Any]:
@@ -146,14 +367,27 @@ class DataSorter:
         if not data:
             return {'error': 'Empty data provided for benchmarking'}
         
-        execution_times = []
+        # Bind the hot callables once so the timed loop does no attribute lookups
+        perf_counter_ns = time.perf_counter_ns
+        sort_inplace = self._strategy._sort_inplace
+        raw_times_ns = []
         
+        # One buffer is refilled from data before each run, outside the timed
+        # region, so every run is a real sort of the original input
+        template = self._new_buffer(data)
+        buffer = template[:]
         for run in range(runs):
-            start_time = time.perf_counter()
-            self._strategy.sort(data)
-            end_time = time.perf_counter()
-            execution_times.append((end_time - start_time) * 1000)  # Convert to milliseconds
+            if run:
+                buffer[:] = template
+            start_ns = perf_counter_ns()
+            sort_inplace(buffer)
+            raw_times_ns.append(perf_counter_ns() - start_ns)
+        
+        # Only the final result is kept for reuse
+        if runs:
+            self._store_result(data, buffer if isinstance(buffer, list) else buffer.tolist())
         
+        execution_times = [t / 1e6 for t in raw_times_ns]  # Convert to milliseconds
         avg_time = sum(execution_times) / len(execution_times)
         min_time = min(execution_times)
         max_time = max(execution_times)
@@ -180,4 +414,4 @@ class DataSorter:
     def __repr__(self) -> str:
         """Detailed string representation of the DataSorter."""
         return (f"DataSorter(strategy={self._strategy.__class__.__name__}, "
-                f"history_entries={len(self._sort_history)})")
\ No newline at end of file
+                f"history_entries={len(self._sort_history or ())})")
\ No newline at end of file
@@ -8,6 +8,7 @@ algorithms, showing how different strategies can be swapped at runtime.
 
 import random
 import logging
+from typing import List
 from app.strategy import (
     DataSorter,
     QuickSortStrategy,
@@ -15,6 +16,15 @@ from app.strategy import (
     HeapSortStrategy
 )
 
+# NumPy is optional: it generates demo data in C instead of a Python loop
+try:
+    import numpy as np
+    _rng = np.random.default_rng(42)
+    HAS_NUMPY = True
+except ImportError:
+    _rng = random.Random(42)
+    HAS_NUMPY = False
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -22,6 +32,23 @@ logging.basicConfig(
 )
 
 
+def _random_ints(low: int, high: int, size: int) -> List[int]:
+    """
+    Generate random integers from the shared demo generator.
+    
+    Args:
+        low: Smallest possible value
+        high: Largest possible value (inclusive)
+        size: Number of values to generate
+        
+    Returns:
+        List of random integers
+    """
+    if HAS_NUMPY:
+        return _rng.integers(low, high + 1, size=size).tolist()
+    return [_rng.randint(low, high) for _ in range(size)]
+
+
 def demonstrate_basic_usage():
     """Demonstrate basic usage of the Strategy pattern."""
     print("="*70)
@@ -40,15 +67,15 @@ def demonstrate_basic_usage():
     
     # Sort with QuickSort
     result1 = sorter.sort(data)
-    print(f"QuickSort result: {result1}")
+    print(f"{sorter.get_strategy().name} result: {result1}")
     
     # Switch to MergeSort at runtime
-    sorter.set_strategy(MergeSortStrategy())
+    sorter.set_strategy(MergeSortStrategy.instance())
     result2 = sorter.sort(data)
     print(f"MergeSort result: {result2}")
     
     # Switch to HeapSort at runtime
-    sorter.set_strategy(HeapSortStrategy())
+    sorter.set_strategy(HeapSortStrategy.instance())
     result3 = sorter.sort(data)
     print(f"HeapSort result: {result3}")
     
@@ -62,9 +89,9 @@ def demonstrate_algorithm_info():
     print("="*70)
     
     strategies = [
-        QuickSortStrategy(),
-        MergeSortStrategy(), 
-        HeapSortStrategy()
+        QuickSortStrategy.instance(),
+        MergeSortStrategy.instance(), 
+        HeapSortStrategy.instance()
     ]
     
     for strategy in strategies:
@@ -92,17 +119,17 @@ def demonstrate_performance_benchmarking():
         print("-" * 40)
         
         # Generate random data
-        random.seed(42)
-        test_data = [random.randint(1, size * 10) for _ in range(size)]
+        test_data = _random_ints(1, size * 10, size)
         
         strategies = [
-            QuickSortStrategy(),
-            MergeSortStrategy(),
-            HeapSortStrategy()
+            QuickSortStrategy.instance(),
+            MergeSortStrategy.instance(),
+            HeapSortStrategy.instance()
         ]
         
         for strategy in strategies:
-            sorter = DataSorter(strategy)
+            # Integer-only data can be sorted in a packed array.array buffer
+            sorter = DataSorter(strategy, buffer_type='array')
             benchmark = sorter.benchmark_current_strategy(test_data, runs=5)
             
             print(f"  {strategy.name:12}: {benchmark['average_time_ms']:8.2f}ms avg "
@@ -116,7 +143,7 @@ def demonstrate_history_tracking():
     print("HISTORY TRACKING")
     print("="*70)
     
-    sorter = DataSorter()
+    sorter = DataSorter(track_history=True)
     data1 = [5, 2, 8, 1, 9]
     data2 = [10, 3, 7, 4, 6]
     
@@ -126,11 +153,11 @@ def demonstrate_history_tracking():
     sorter.sort(data1)
     
     # Switch to MergeSort and sort different data
-    sorter.set_strategy(MergeSortStrategy())
+    sorter.set_strategy(MergeSortStrategy.instance())
     sorter.sort(data2)
     
     # Switch to HeapSort and sort again
-    sorter.set_strategy(HeapSortStrategy())
+    sorter.set_strategy(HeapSortStrategy.instance())
     sorter.sort(data1)
     
     print("\\nSort History:")
@@ -156,21 +183,22 @@ def demonstrate_real_world_scenario():
     scenarios = [
         {
             'name': 'Small dataset (< 100 elements)',
-            'data': [random.randint(1, 100) for _ in range(50)],
+            'data': _random_ints(1, 100, 50),
             'recommended': 'QuickSort',
             'reason': 'Low overhead, good for small datasets'
         },
         {
             'name': 'Large random dataset',
-            'data': [random.randint(1, 10000) for _ in range(5000)],
+            'data': _random_ints(1, 10000, 5000),
             'recommended': 'QuickSort', 
             'reason': 'Best average performance for random data'
         },
         {
             'name': 'Memory-constrained environment',
-            'data': [random.randint(1, 1000) for _ in range(1000)],
+            'data': _random_ints(1, 1000, 1000),
             'recommended': 'HeapSort',
-            'reason': 'O(1) space complexity, in-place sorting'
+            'reason': 'O(1) space complexity, in-place sorting',
+            'memory_budget': 'tight'
         },
         {
             'name': 'Stability required (equal elements order preserved)',
@@ -186,16 +214,9 @@ def demonstrate_real_world_scenario():
         print(f"  Recommended: {scenario['recommended']}")
         print(f"  Reason: {scenario['reason']}")
         
-        # Set appropriate strategy
-        if scenario['recommended'] == 'QuickSort':
-            sorter.set_strategy(QuickSortStrategy())
-        elif scenario['recommended'] == 'MergeSort':
-            sorter.set_strategy(MergeSortStrategy())
-        elif scenario['recommended'] == 'HeapSort':
-            sorter.set_strategy(HeapSortStrategy())
-        
-        # Perform sorting and show results
-        result = sorter.sort(scenario['data'])
+        # Let the sorter pick a strategy from the data itself
+        result = sorter.sort_auto(scenario['data'], scenario.get('memory_budget'))
+        print(f"  Auto-selected: {sorter.get_strategy().name}")
         print(f"  Sorted successfully: {len(result)} elements")
         
         # Show partial result for readability
@@ -6,12 +6,69 @@ data structure. It builds a max heap from the input data, then repeatedly
 extracts the maximum element to create a sorted array.
 """
 
-from typing import List, TypeVar
-from .sorting_strategy import SortingStrategy
+from typing import ClassVar, List, Optional, TypeVar
+from .sorting_strategy import SortingStrategy, _numeric_buffer, _numpy_sort, _write_back
+
+# Numba is optional: numeric lists are sorted by a compiled kernel when available
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
 
 T = TypeVar('T')
 
 
+if HAS_NUMBA:
+    @njit(cache=True, boundscheck=False)
+    def _heapify_kernel(arr, n, i):
+        """Iterative sift-down of node i in a max heap of size n."""
+        while True:
+            largest = i
+            left = 2 * i + 1
+            right = left + 1
+            if left < n and arr[left] > arr[largest]:
+                largest = left
+            if right < n and arr[right] > arr[largest]:
+                largest = right
+            if largest == i:
+                return
+            arr[i], arr[largest] = arr[largest], arr[i]
+            i = largest
+
+    @njit(cache=True, boundscheck=False)
+    def _heapsort_kernel(arr):
+        """HeapSort over a NumPy buffer, in place."""
+        n = arr.shape[0]
+        for i in range(n // 2 - 1, -1, -1):
+            _heapify_kernel(arr, n, i)
+        for i in range(n - 1, 0, -1):
+            arr[0], arr[i] = arr[i], arr[0]
+            _heapify_kernel(arr, i, 0)
+
+
+def _numeric_fast_sort(data: List[T]) -> Optional[List[T]]:
+    """
+    Sort homogeneous int or float lists with the compiled kernel, or with
+    NumPy's own heapsort when Numba is unavailable.
+    
+    Args:
+        data: List to sort
+        
+    Returns:
+        New sorted list, or None if the fast path does not apply
+    """
+    if not HAS_NUMBA:
+        return _numpy_sort(data, 'heapsort')
+    
+    arr = _numeric_buffer(data)
+    if arr is None:
+        return None
+    
+    _heapsort_kernel(arr)
+    return arr.tolist()
+
+
 class HeapSortStrategy(SortingStrategy[T]):
     """
     HeapSort implementation with guaranteed O(n log n) performance.
@@ -29,8 +86,16 @@ class HeapSortStrategy(SortingStrategy[T]):
     - Guaranteed O(n log n) performance in all cases
     - Good for systems with memory constraints due to O(1) space complexity
     - Cache performance not as good as QuickSort due to non-sequential access
+    - Homogeneous int/float lists use a Numba-compiled kernel when available,
+      otherwise NumPy's C heapsort
     """
     
+    name: ClassVar[str] = "HeapSort"
+    time_complexity_best: ClassVar[str] = "O(n log n)"
+    time_complexity_average: ClassVar[str] = "O(n log n)"
+    time_complexity_worst: ClassVar[str] = "O(n log n)"
+    space_complexity: ClassVar[str] = "O(1)"
+    
     def sort(self, data: List[T]) -> List[T]:
         """
         Sort data using HeapSort algorithm.
@@ -41,14 +106,28 @@ class HeapSortStrategy(SortingStrategy[T]):
         Returns:
             New sorted list in ascending order
         """
-        if not data:
-            return []
-        
         # Create a copy to avoid modifying the original list
-        result = data.copy()
-        self._heapsort(result)
+        result = list(data)
+        self._sort_inplace(result)
         return result
     
+    def _sort_inplace(self, arr: List[T]) -> None:
+        """
+        Sort arr in place using HeapSort algorithm.
+        
+        Args:
+            arr: List to sort (modified in-place)
+        """
+        if len(arr) <= 1:
+            return
+        
+        fast_result = _numeric_fast_sort(arr)
+        if fast_result is not None:
+            _write_back(arr, fast_result)
+            return
+        
+        self._heapsort(arr)
+    
     def _heapsort(self, arr: List[T]) -> None:
         """
         HeapSort implementation.
@@ -69,7 +148,9 @@ class HeapSortStrategy(SortingStrategy[T]):
         # Extract elements from heap one by one
         for i in range(n - 1, 0, -1):
             # Move current root (maximum) to end
-            arr[0], arr[i] = arr[i], arr[0]
+            tmp = arr[0]
+            arr[0] = arr[i]
+            arr[i] = tmp
             
             # Call heapify on the reduced heap
             self._heapify(arr, i, 0)
@@ -79,48 +160,34 @@ class HeapSortStrategy(SortingStrategy[T]):
         Heapify a subtree rooted with node i.
         
         Maintains the max heap property by ensuring that the parent
-        node is larger than its children.
+        node is larger than its children. Sifts down iteratively so each
+        extraction costs no extra Python call frames, and moves larger
+        children up into a hole instead of swapping, writing the root's
+        value only once at its final position.
         
         Args:
             arr: Array representing the heap
             n: Size of heap
             i: Root index of subtree to heapify
         """
-        largest = i  # Initialize largest as root
-        left = 2 * i + 1  # Left child index
-        right = 2 * i + 2  # Right child index
-        
-        # Check if left child exists and is greater than root
-        if left < n and arr[left] > arr[largest]:
-            largest = left
-        
-        # Check if right child exists and is greater than current largest
-        if right < n and arr[right] > arr[largest]:
-            largest = right
-        
-        # If largest is not root, swap and continue heapifying
-        if largest != i:
-            arr[i], arr[largest] = arr[largest], arr[i]
+        root_value = arr[i]
+        while True:
+            largest = 2 * i + 1  # Left child index
+            if largest >= n:
+                break
             
-            # Recursively heapify the affected subtree
-            self._heapify(arr, n, largest)
-    
-    @property
-    def name(self) -> str:
-        return "HeapSort"
-    
-    @property
-    def time_complexity_best(self) -> str:
-        return "O(n log n)"
-    
-    @property
-    def time_complexity_average(self) -> str:
-        return "O(n log n)"
-    
-    @property
-    def time_complexity_worst(self) -> str:
-        return "O(n log n)"
-    
-    @property
-    def space_complexity(self) -> str:
-        return "O(1)"
\ No newline at end of file
+            # Pick the right child if it exists and is greater than the left
+            right = largest + 1
+            if right < n and arr[right] > arr[largest]:
+                largest = right
+            
+            # If the larger child beats the root value, move it up into the
+            # hole and continue down the affected subtree
+            child_value = arr[largest]
+            if child_value > root_value:
+                arr[i] = child_value
+                i = largest
+            else:
+                break
+        
+        arr[i] = root_value
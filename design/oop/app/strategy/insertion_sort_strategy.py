@@ -0,0 +1,60 @@
+"""
+Insertion sort implementation using the Strategy pattern.
+
+Insertion sort builds the sorted list one element at a time, shifting larger
+elements right to make room. Its low overhead makes it the fastest choice
+for very small inputs.
+"""
+
+from typing import ClassVar, List, TypeVar
+from .sorting_strategy import SortingStrategy, _insertion_sort
+
+T = TypeVar('T')
+
+
+class InsertionSortStrategy(SortingStrategy[T]):
+    """
+    Insertion sort implementation for small or nearly sorted inputs.
+    
+    Time Complexity:
+    - Best Case: O(n) - already sorted input needs no shifts
+    - Average Case: O(n²) - each element shifts past half the sorted prefix
+    - Worst Case: O(n²) - reverse sorted input
+    
+    Space Complexity: O(1) - sorts in-place
+    
+    Characteristics:
+    - Stable sorting (preserves relative order of equal elements)
+    - In-place sorting (modifies original array copy)
+    - Minimal overhead, so it wins on tiny inputs
+    """
+    
+    name: ClassVar[str] = "InsertionSort"
+    time_complexity_best: ClassVar[str] = "O(n)"
+    time_complexity_average: ClassVar[str] = "O(n²)"
+    time_complexity_worst: ClassVar[str] = "O(n²)"
+    space_complexity: ClassVar[str] = "O(1)"
+    
+    def sort(self, data: List[T]) -> List[T]:
+        """
+        Sort data using insertion sort.
+        
+        Args:
+            data: List of comparable elements
+            
+        Returns:
+            New sorted list in ascending order
+        """
+        # Create a copy to avoid modifying the original list
+        result = list(data)
+        self._sort_inplace(result)
+        return result
+    
+    def _sort_inplace(self, arr: List[T]) -> None:
+        """
+        Sort arr in place using insertion sort.
+        
+        Args:
+            arr: List to sort (modified in-place)
+        """
+        _insertion_sort(arr, 0, len(arr))
@@ -5,8 +5,14 @@ MergeSort is a stable, divide-and-conquer algorithm that divides the array
 into smaller subarrays, sorts them, and then merges them back together.
 """
 
-from typing import List, TypeVar
-from .sorting_strategy import SortingStrategy
+from typing import ClassVar, List, TypeVar
+from .sorting_strategy import (
+    INSERTION_SORT_THRESHOLD,
+    SortingStrategy,
+    _insertion_sort,
+    _numpy_sort,
+    _write_back,
+)
 
 T = TypeVar('T')
 
@@ -28,8 +34,15 @@ class MergeSortStrategy(SortingStrategy[T]):
     - Good for large datasets due to predictable O(n log n) guarantee
     - External sorting friendly (can work with data larger than memory)
     - Not in-place (requires additional memory)
+    - Homogeneous int/float lists use NumPy's C mergesort when available
     """
     
+    name: ClassVar[str] = "MergeSort"
+    time_complexity_best: ClassVar[str] = "O(n log n)"
+    time_complexity_average: ClassVar[str] = "O(n log n)"
+    time_complexity_worst: ClassVar[str] = "O(n log n)"
+    space_complexity: ClassVar[str] = "O(n)"
+    
     def sort(self, data: List[T]) -> List[T]:
         """
         Sort data using MergeSort algorithm.
@@ -40,88 +53,98 @@ class MergeSortStrategy(SortingStrategy[T]):
         Returns:
             New sorted list in ascending order
         """
-        if not data:
-            return []
-        
         # Create a copy to avoid modifying the original list
-        result = data.copy()
-        self._mergesort(result)
+        result = list(data)
+        self._sort_inplace(result)
         return result
     
-    def _mergesort(self, arr: List[T]) -> None:
+    def _sort_inplace(self, arr: List[T]) -> None:
         """
-        Recursive MergeSort implementation.
-        
-        Divides the array into two halves, recursively sorts them,
-        and then merges the sorted halves.
+        Sort arr in place using MergeSort algorithm.
         
         Args:
-            arr: Array to sort (modified in-place)
+            arr: List to sort (modified in-place)
         """
         if len(arr) <= 1:
             return
         
-        # Divide: find the middle point
-        mid = len(arr) // 2
-        left_half = arr[:mid]
-        right_half = arr[mid:]
-        
-        # Conquer: recursively sort both halves
-        self._mergesort(left_half)
-        self._mergesort(right_half)
+        # Homogeneous int/float lists go through NumPy's C mergesort
+        fast_result = _numpy_sort(arr, 'mergesort')
+        if fast_result is not None:
+            _write_back(arr, fast_result)
+            return
         
-        # Combine: merge the sorted halves
-        self._merge(arr, left_half, right_half)
+        self._mergesort(arr)
     
-    def _merge(self, arr: List[T], left: List[T], right: List[T]) -> None:
+    def _mergesort(self, arr: List[T]) -> None:
         """
-        Merge two sorted arrays into one sorted array.
+        Iterative bottom-up MergeSort implementation.
+        
+        Insertion-sorts fixed-size runs, then merges neighbouring runs of
+        doubling width, alternating between arr and a single scratch buffer
+        instead of recursing.
         
         Args:
-            arr: Target array to store merged result
-            left: Left sorted subarray
-            right: Right sorted subarray
+            arr: Array to sort (modified in-place)
         """
-        i = j = k = 0
+        n = len(arr)
+        width = INSERTION_SORT_THRESHOLD
         
-        # Merge elements from left and right while both have elements
-        while i < len(left) and j < len(right):
-            if left[i] <= right[j]:
-                arr[k] = left[i]
-                i += 1
-            else:
-                arr[k] = right[j]
-                j += 1
-            k += 1
+        # Small runs are cheaper to sort in place with insertion sort
+        for lo in range(0, n, width):
+            _insertion_sort(arr, lo, min(lo + width, n))
         
-        # Copy remaining elements from left subarray
-        while i < len(left):
-            arr[k] = left[i]
-            i += 1
-            k += 1
+        src, dst = arr, arr[:]
+        while width < n:
+            # Merge each pair of neighbouring runs from src into dst
+            for lo in range(0, n, 2 * width):
+                mid = min(lo + width, n)
+                hi = min(mid + width, n)
+                self._merge(src, dst, lo, mid, hi)
+            src, dst = dst, src
+            width *= 2
         
-        # Copy remaining elements from right subarray
-        while j < len(right):
-            arr[k] = right[j]
-            j += 1
-            k += 1
+        # The last pass may have left the result in the scratch buffer
+        if src is not arr:
+            arr[:] = src
     
-    @property
-    def name(self) -> str:
-        return "MergeSort"
-    
-    @property
-    def time_complexity_best(self) -> str:
-        return "O(n log n)"
-    
-    @property
-    def time_complexity_average(self) -> str:
-        return "O(n log n)"
-    
-    @property
-    def time_complexity_worst(self) -> str:
-        return "O(n log n)"
-    
-    @property
-    def space_complexity(self) -> str:
-        return "O(n)"
\ No newline at end of file
+    def _merge(self, src: List[T], dst: List[T], lo: int, mid: int, hi: int) -> None:
+        """
+        Merge the sorted runs ``src[lo:mid]`` and ``src[mid:hi]`` into ``dst[lo:hi]``.
+        
+        Args:
+            src: Buffer holding the two sorted runs
+            dst: Buffer to store merged result
+            lo: Start of the left run
+            mid: Start of the right run
+            hi: End of the right run (exclusive)
+        """
+        i, j, k = lo, mid, lo
+        
+        # Merge elements from left and right while both have elements,
+        # holding the current head of each run in a local so every element
+        # is read from src only once
+        if i < mid and j < hi:
+            left_value = src[i]
+            right_value = src[j]
+            while True:
+                if left_value <= right_value:
+                    dst[k] = left_value
+                    k += 1
+                    i += 1
+                    if i == mid:
+                        break
+                    left_value = src[i]
+                else:
+                    dst[k] = right_value
+                    k += 1
+                    j += 1
+                    if j == hi:
+                        break
+                    right_value = src[j]
+        
+        # Copy whichever run still has elements with one slice assignment
+        if i < mid:
+            dst[k:hi] = src[i:mid]
+        elif j < hi:
+            dst[k:hi] = src[j:hi]
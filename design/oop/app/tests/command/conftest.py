@@ -0,0 +1,25 @@
+"""Shared fixtures for the command pattern tests."""
+
+from typing import Callable
+
+import pytest
+from app.command.invoker import TextEditorInvoker
+from app.command.text_editor import TextEditor
+
+
+@pytest.fixture(scope="session")
+def invoker_factory() -> Callable[..., TextEditorInvoker]:
+    """Callable building fresh invokers; accepts TextEditorInvoker's arguments."""
+    return TextEditorInvoker
+
+
+@pytest.fixture
+def invoker(invoker_factory: Callable[..., TextEditorInvoker]) -> TextEditorInvoker:
+    """Fresh invoker with an empty history."""
+    return invoker_factory()
+
+
+@pytest.fixture
+def editor() -> TextEditor:
+    """Empty editor for commands to act on."""
+    return TextEditor()
@@ -1,221 +1,206 @@
 """Tests for concrete command implementations."""
 
+import re
 import pytest
 from app.command.commands import DeleteTextCommand, FormatTextCommand, InsertTextCommand, MacroCommand
 from app.command.text_editor import TextEditor, TextFormat
 
+# Formats used throughout, bound once as module globals
+BOLD = TextFormat.BOLD
+ITALIC = TextFormat.ITALIC
+
+# Error messages shared by the parametrized state checks, compiled once
+ALREADY_EXECUTED = re.compile("Command has already been executed")
+NOT_EXECUTED = re.compile("Cannot undo command that hasn't been executed")
+
+# Constructors for each single-step command, run against editor_with_hello
+COMMAND_FACTORIES = [
+    pytest.param(lambda e: InsertTextCommand(e, 0, "Hello"), id="insert"),
+    pytest.param(lambda e: DeleteTextCommand(e, 6, 5), id="delete"),
+    pytest.param(lambda e: FormatTextCommand(e, 0, 5, BOLD), id="format"),
+]
+
+
+@pytest.fixture
+def editor_with_hello(editor: TextEditor) -> TextEditor:
+    """Editor pre-filled with "Hello World"."""
+    editor.insert_text(0, "Hello World")
+    return editor
+
 
 class TestInsertTextCommand:
     """Test cases for InsertTextCommand."""
     
-    def setup_method(self) -> None:
-        """Set up test fixtures."""
-        self.editor = TextEditor()
-    
-    def test_execute_insert_command(self) -> None:
-        """Test executing insert command."""
-        cmd = InsertTextCommand(self.editor, 0, "Hello")
-        cmd.execute()
-        
-        assert self.editor.content == "Hello"
-        assert cmd.get_description() == "Insert 'Hello' at position 0"
-    
-    def test_undo_insert_command(self) -> None:
-        """Test undoing insert command."""
-        cmd = InsertTextCommand(self.editor, 0, "Hello")
-        cmd.execute()
-        cmd.undo()
-        
-        assert self.editor.content == ""
-    
-    def test_execute_already_executed_command(self) -> None:
-        """Test executing already executed command."""
-        cmd = InsertTextCommand(self.editor, 0, "Hello")
-        cmd.execute()
-        
-        with pytest.raises(RuntimeError, match="Command has already been executed"):
-            cmd.execute()
-    
-    def test_undo_unexecuted_command(self) -> None:
-        """Test undoing unexecuted command."""
-        cmd = InsertTextCommand(self.editor, 0, "Hello")
-        
-        with pytest.raises(RuntimeError, match="Cannot undo command that hasn't been executed"):
-            cmd.undo()
-    
-    def test_execute_undo_execute_cycle(self) -> None:
+    def test_execute_undo_execute_cycle(self, editor: TextEditor) -> None:
         """Test execute-undo-execute cycle."""
-        cmd = InsertTextCommand(self.editor, 0, "Hello")
+        cmd = InsertTextCommand(editor, 0, "Hello")
         
         # Execute
         cmd.execute()
-        assert self.editor.content == "Hello"
+        assert editor.content == "Hello"
         
         # Undo
         cmd.undo()
-        assert self.editor.content == ""
+        assert editor.content == ""
         
         # Execute again
         cmd.execute()
-        assert self.editor.content == "Hello"
-
-
-class TestDeleteTextCommand:
-    """Test cases for DeleteTextCommand."""
-    
-    def setup_method(self) -> None:
-        """Set up test fixtures."""
-        self.editor = TextEditor()
-        self.editor.insert_text(0, "Hello World")
-    
-    def test_execute_delete_command(self) -> None:
-        """Test executing delete command."""
-        cmd = DeleteTextCommand(self.editor, 6, 5)
-        cmd.execute()
-        
-        assert self.editor.content == "Hello "
-        assert "Delete 'World' from position 6" in cmd.get_description()
-    
-    def test_undo_delete_command(self) -> None:
-        """Test undoing delete command."""
-        cmd = DeleteTextCommand(self.editor, 6, 5)
-        cmd.execute()
-        cmd.undo()
-        
-        assert self.editor.content == "Hello World"
-    
-    def test_description_before_execution(self) -> None:
-        """Test command description before execution."""
-        cmd = DeleteTextCommand(self.editor, 6, 5)
-        assert cmd.get_description() == "Delete 5 characters from position 6"
-    
-    def test_execute_already_executed_command(self) -> None:
-        """Test executing already executed command."""
-        cmd = DeleteTextCommand(self.editor, 6, 5)
-        cmd.execute()
-        
-        with pytest.raises(RuntimeError, match="Command has already been executed"):
-            cmd.execute()
-    
-    def test_undo_unexecuted_command(self) -> None:
-        """Test undoing unexecuted command."""
-        cmd = DeleteTextCommand(self.editor, 6, 5)
-        
-        with pytest.raises(RuntimeError, match="Cannot undo command that hasn't been executed"):
-            cmd.undo()
+        assert editor.content == "Hello"
 
 
 class TestFormatTextCommand:
     """Test cases for FormatTextCommand."""
     
-    def setup_method(self) -> None:
-        """Set up test fixtures."""
-        self.editor = TextEditor()
-        self.editor.insert_text(0, "Hello World")
-    
-    def test_execute_format_command(self) -> None:
+    def test_execute_format_command(self, editor_with_hello: TextEditor) -> None:
         """Test executing format command."""
-        cmd = FormatTextCommand(self.editor, 0, 5, TextFormat.BOLD)
+        cmd = FormatTextCommand(editor_with_hello, 0, 5, BOLD)
         cmd.execute()
         
-        segments = self.editor.get_formatted_segments()
-        assert len(segments) == 1
-        assert segments[0].format_type == TextFormat.BOLD
-        assert segments[0].start_pos == 0
-        assert segments[0].end_pos == 5
+        segment = editor_with_hello.first_segment
+        assert editor_with_hello.segment_count == 1
+        assert segment.format_type == BOLD
+        assert segment.start_pos == 0
+        assert segment.end_pos == 5
     
-    def test_undo_format_command(self) -> None:
+    def test_undo_format_command(self, editor_with_hello: TextEditor) -> None:
         """Test undoing format command."""
-        cmd = FormatTextCommand(self.editor, 0, 5, TextFormat.BOLD)
+        cmd = FormatTextCommand(editor_with_hello, 0, 5, BOLD)
         cmd.execute()
         cmd.undo()
         
-        segments = self.editor.get_formatted_segments()
-        assert len(segments) == 0
+        assert editor_with_hello.segment_count == 0
+        assert editor_with_hello.first_segment is None
     
-    def test_undo_format_with_previous_formatting(self) -> None:
+    def test_undo_format_with_previous_formatting(self, editor_with_hello: TextEditor) -> None:
         """Test undoing format command that overwrote previous formatting."""
         # Apply initial formatting
-        self.editor.format_text(0, 5, TextFormat.ITALIC)
+        editor_with_hello.format_text(0, 5, ITALIC)
         
         # Apply overlapping formatting via command
-        cmd = FormatTextCommand(self.editor, 0, 5, TextFormat.BOLD)
+        cmd = FormatTextCommand(editor_with_hello, 0, 5, BOLD)
         cmd.execute()
         
         # Should have bold formatting now
-        segments = self.editor.get_formatted_segments()
-        assert len(segments) == 1
-        assert segments[0].format_type == TextFormat.BOLD
+        assert editor_with_hello.segment_count == 1
+        assert editor_with_hello.first_segment.format_type == BOLD
         
         # Undo should restore italic formatting
         cmd.undo()
-        segments = self.editor.get_formatted_segments()
-        assert len(segments) == 1
-        assert segments[0].format_type == TextFormat.ITALIC
+        assert editor_with_hello.segment_count == 1
+        assert editor_with_hello.first_segment.format_type == ITALIC
+
     
-    def test_description(self) -> None:
-        """Test command description."""
-        cmd = FormatTextCommand(self.editor, 0, 5, TextFormat.BOLD)
-        assert cmd.get_description() == "Apply bold formatting to position 0-5"
+    def test_undo_format_inside_wider_segment(self, editor_with_hello: TextEditor) -> None:
+        """Test that undoing a format that split a segment restores it whole."""
+        editor_with_hello.format_text(0, 11, BOLD)
+        
+        cmd = FormatTextCommand(editor_with_hello, 4, 3, ITALIC)
+        cmd.execute()
+        assert editor_with_hello.segment_count == 3
+        
+        cmd.undo()
+        segment = editor_with_hello.first_segment
+        assert editor_with_hello.segment_count == 1
+        assert (segment.start_pos, segment.end_pos, segment.format_type) == (0, 11, BOLD)
+
+class TestCommandRoundTrip:
+    """Test cases for executing and undoing text-changing commands."""
+    
+    @pytest.mark.parametrize("initial,make_cmd,after_exec,description", [
+        pytest.param("", lambda e: InsertTextCommand(e, 0, "Hello"), "Hello",
+                     "Insert 'Hello' at position 0", id="insert"),
+        pytest.param("Hello World", lambda e: DeleteTextCommand(e, 6, 5), "Hello ",
+                     "Delete 'World' from position 6", id="delete"),
+    ])
+    def test_execute_undo_roundtrip(self, editor: TextEditor, initial: str, make_cmd,
+                                    after_exec: str, description: str) -> None:
+        """Test that executing changes the content and undoing restores it."""
+        if initial:
+            editor.insert_text(0, initial)
+        cmd = make_cmd(editor)
+        
+        cmd.execute()
+        assert editor.content == after_exec
+        assert cmd.get_description() == description
+        
+        cmd.undo()
+        assert editor.content == initial
+
+
+class TestCommandDescriptions:
+    """Test cases for command descriptions before execution."""
+    
+    @pytest.mark.parametrize("make_cmd,expected", [
+        pytest.param(lambda e: InsertTextCommand(e, 0, "Hello"), "Insert 'Hello' at position 0", id="insert"),
+        pytest.param(lambda e: DeleteTextCommand(e, 6, 5), "Delete 5 characters from position 6", id="delete"),
+        pytest.param(lambda e: FormatTextCommand(e, 0, 5, BOLD), "Apply bold formatting to position 0-5", id="format"),
+        pytest.param(lambda e: MacroCommand([InsertTextCommand(e, 0, "Hello")], "Test macro"), "Test macro",
+                     id="macro"),
+    ])
+    def test_get_description(self, editor_with_hello: TextEditor, make_cmd, expected: str) -> None:
+        """Test the description each command reports."""
+        assert make_cmd(editor_with_hello).get_description() == expected
+
+
+class TestCommandExecutionState:
+    """Test cases for execute/undo state checks shared by all commands."""
     
-    def test_execute_already_executed_command(self) -> None:
+    @pytest.mark.parametrize("make_cmd", COMMAND_FACTORIES)
+    def test_double_execute_raises(self, editor_with_hello: TextEditor, make_cmd) -> None:
         """Test executing already executed command."""
-        cmd = FormatTextCommand(self.editor, 0, 5, TextFormat.BOLD)
+        cmd = make_cmd(editor_with_hello)
         cmd.execute()
         
-        with pytest.raises(RuntimeError, match="Command has already been executed"):
+        with pytest.raises(RuntimeError, match=ALREADY_EXECUTED):
             cmd.execute()
     
-    def test_undo_unexecuted_command(self) -> None:
+    @pytest.mark.parametrize("make_cmd", COMMAND_FACTORIES)
+    def test_undo_unexecuted_raises(self, editor_with_hello: TextEditor, make_cmd) -> None:
         """Test undoing unexecuted command."""
-        cmd = FormatTextCommand(self.editor, 0, 5, TextFormat.BOLD)
+        cmd = make_cmd(editor_with_hello)
         
-        with pytest.raises(RuntimeError, match="Cannot undo command that hasn't been executed"):
+        with pytest.raises(RuntimeError, match=NOT_EXECUTED):
             cmd.undo()
 
 
 class TestMacroCommand:
     """Test cases for MacroCommand."""
     
-    def setup_method(self) -> None:
-        """Set up test fixtures."""
-        self.editor = TextEditor()
-    
-    def test_execute_macro_command(self) -> None:
+    def test_execute_macro_command(self, editor: TextEditor) -> None:
         """Test executing macro command."""
         commands = [
-            InsertTextCommand(self.editor, 0, "Hello"),
-            InsertTextCommand(self.editor, 5, " World"),
-            FormatTextCommand(self.editor, 0, 5, TextFormat.BOLD)
+            InsertTextCommand(editor, 0, "Hello"),
+            InsertTextCommand(editor, 5, " World"),
+            FormatTextCommand(editor, 0, 5, BOLD)
         ]
         
         macro = MacroCommand(commands, "Add greeting with formatting")
         macro.execute()
         
-        assert self.editor.content == "Hello World"
-        segments = self.editor.get_formatted_segments()
+        assert editor.content == "Hello World"
+        segments = editor.get_formatted_segments()
         assert len(segments) == 1
-        assert segments[0].format_type == TextFormat.BOLD
+        assert segments[0].format_type == BOLD
     
-    def test_undo_macro_command(self) -> None:
+    def test_undo_macro_command(self, editor: TextEditor) -> None:
         """Test undoing macro command."""
         commands = [
-            InsertTextCommand(self.editor, 0, "Hello"),
-            InsertTextCommand(self.editor, 5, " World"),
+            InsertTextCommand(editor, 0, "Hello"),
+            InsertTextCommand(editor, 5, " World"),
         ]
         
         macro = MacroCommand(commands, "Add greeting")
         macro.execute()
         macro.undo()
         
-        assert self.editor.content == ""
+        assert editor.content == ""
     
-    def test_macro_partial_failure(self) -> None:
+    def test_macro_partial_failure(self, editor: TextEditor) -> None:
         """Test macro command with partial failure."""
         # Create commands where the second one will fail
         commands = [
-            InsertTextCommand(self.editor, 0, "Hello"),
-            InsertTextCommand(self.editor, 10, "World"),  # Invalid position
+            InsertTextCommand(editor, 0, "Hello"),
+            InsertTextCommand(editor, 10, "World"),  # Invalid position
         ]
         
         macro = MacroCommand(commands, "Add greeting with error")
@@ -224,31 +209,24 @@ class TestMacroCommand:
             macro.execute()
         
         # Should have undone the first command
-        assert self.editor.content == ""
+        assert editor.content == ""
     
-    def test_add_command_to_unexecuted_macro(self) -> None:
+    def test_add_command_to_unexecuted_macro(self, editor: TextEditor) -> None:
         """Test adding command to unexecuted macro."""
         macro = MacroCommand([], "Empty macro")
-        cmd = InsertTextCommand(self.editor, 0, "Hello")
+        cmd = InsertTextCommand(editor, 0, "Hello")
         
         macro.add_command(cmd)
         macro.execute()
         
-        assert self.editor.content == "Hello"
+        assert editor.content == "Hello"
     
-    def test_add_command_to_executed_macro(self) -> None:
+    def test_add_command_to_executed_macro(self, editor: TextEditor) -> None:
         """Test adding command to executed macro."""
-        cmd1 = InsertTextCommand(self.editor, 0, "Hello")
+        cmd1 = InsertTextCommand(editor, 0, "Hello")
         macro = MacroCommand([cmd1], "Simple macro")
         macro.execute()
         
-        cmd2 = InsertTextCommand(self.editor, 5, " World")
+        cmd2 = InsertTextCommand(editor, 5, " World")
         with pytest.raises(RuntimeError, match="Cannot add commands to a macro that has been executed"):
-            macro.add_command(cmd2)
-    
-    def test_macro_description(self) -> None:
-        """Test macro command description."""
-        commands = [InsertTextCommand(self.editor, 0, "Hello")]
-        macro = MacroCommand(commands, "Test macro")
-        
-        assert macro.get_description() == "Test macro"
\ No newline at end of file
+            macro.add_command(cmd2)
\ No newline at end of file
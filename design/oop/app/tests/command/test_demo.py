@@ -1,5 +1,6 @@
 """Tests for the command pattern demonstration."""
 
+import copy
 import pytest
 from io import StringIO
 import sys
@@ -19,12 +20,54 @@ from app.command.text_editor import TextEditor
 from app.command.invoker import TextEditorInvoker
 
 
+@pytest.fixture(autouse=True)
+def _silence_demo_output(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Discard demo prints in memory; tests asserting on output use capsys instead."""
+    if "capsys" in request.fixturenames:
+        return
+    monkeypatch.setattr(sys, "stdout", StringIO())
+
+
+@pytest.fixture(scope="session")
+def basic_seed() -> tuple[TextEditor, TextEditorInvoker]:
+    """Run the basic operations demo once per session, with its output silenced."""
+    with patch('sys.stdout', new_callable=StringIO):
+        return demonstrate_basic_operations()
+
+
+@pytest.fixture
+def basic_state(basic_seed: tuple[TextEditor, TextEditorInvoker]) -> tuple[TextEditor, TextEditorInvoker]:
+    """Private copy of the basic demo state for tests that mutate it."""
+    # The invoker's commands reference the editor; one deepcopy keeps that link
+    return copy.deepcopy(basic_seed)
+
+
+@pytest.fixture(scope="module")
+def demo_phases(basic_seed: tuple[TextEditor, TextEditorInvoker]) -> dict[str, tuple[TextEditor, TextEditorInvoker]]:
+    """Run the demo chain once from the basic seed, snapshotting the state after each phase."""
+    steps = [
+        ("undo_redo", demonstrate_undo_redo),
+        ("delete", demonstrate_delete_operations),
+        ("format", demonstrate_formatting_operations),
+        ("macro", demonstrate_macro_commands),
+        ("error", demonstrate_error_handling),
+    ]
+    with patch('sys.stdout', new_callable=StringIO):
+        editor, invoker = copy.deepcopy(basic_seed)
+        states = {"basic": basic_seed}
+        for phase, demonstrate in steps:
+            demonstrate(editor, invoker)
+            states[phase] = copy.deepcopy((editor, invoker))
+        demonstrate_command_history()
+    return states
+
+
 class TestDemoFunctions:
     """Test cases for demonstration functions."""
     
-    def test_demonstrate_basic_operations(self) -> None:
+    def test_demonstrate_basic_operations(self, basic_seed: tuple[TextEditor, TextEditorInvoker]) -> None:
         """Test basic operations demonstration."""
-        editor, invoker = demonstrate_basic_operations()
+        editor, invoker = basic_seed
         
         # Should have created editor and invoker with some content
         assert isinstance(editor, TextEditor)
@@ -32,56 +75,35 @@ class TestDemoFunctions:
         assert "Hello Beautiful World!" in editor.content
         assert invoker.get_undo_stack_size() > 0
     
-    def test_demonstrate_undo_redo(self) -> None:
-        """Test undo/redo demonstration."""
-        editor, invoker = demonstrate_basic_operations()
-        initial_stack_size = invoker.get_undo_stack_size()
-        
-        demonstrate_undo_redo(editor, invoker)
-        
-        # Should have performed some undo/redo operations
-        # Final state should have some commands still available
-        assert invoker.get_undo_stack_size() <= initial_stack_size
+    def test_basic_state_is_independent_copy(self, basic_seed: tuple[TextEditor, TextEditorInvoker],
+                                             basic_state: tuple[TextEditor, TextEditorInvoker]) -> None:
+        """Test that undoing on a copied state leaves the shared seed untouched."""
+        seed_snapshot = basic_seed[0].snapshot()
+        editor, invoker = basic_state
+        invoker.undo()
+        
+        assert editor.content == "Hello World!"
+        assert basic_seed[0].snapshot() == seed_snapshot
     
-    def test_demonstrate_delete_operations(self) -> None:
-        """Test delete operations demonstration."""
-        editor, invoker = demonstrate_basic_operations()
-        
-        demonstrate_delete_operations(editor, invoker)
-        
-        # Should have performed delete operations
-        # The exact content depends on the operations, but should be different
-        assert editor.length > 0
-    
-    def test_demonstrate_formatting_operations(self) -> None:
-        """Test formatting operations demonstration."""
-        editor, invoker = demonstrate_basic_operations()
-        
-        demonstrate_formatting_operations(editor, invoker)
-        
-        # Should have some formatting segments
-        segments = editor.get_formatted_segments()
-        assert len(segments) >= 0  # May have been undone
-    
-    def test_demonstrate_macro_commands(self) -> None:
-        """Test macro commands demonstration."""
-        editor, invoker = demonstrate_basic_operations()
-        
-        demonstrate_macro_commands(editor, invoker)
-        
-        # Should have executed macro operations
-        assert editor.length > 0
-    
-    def test_demonstrate_error_handling(self) -> None:
-        """Test error handling demonstration."""
-        editor, invoker = demonstrate_basic_operations()
-        
-        # Should not raise exceptions - errors should be caught
-        demonstrate_error_handling(editor, invoker)
-        
-        # After clearing history, should have no undo/redo available
-        assert not invoker.can_undo()
-        assert not invoker.can_redo()
+    @pytest.mark.parametrize("phase_fn,content,undo_size,redo_size,segment_count", [
+        pytest.param(demonstrate_undo_redo, "Hello Beautiful World!", 3, 0, 0, id="undo_redo"),
+        pytest.param(demonstrate_delete_operations, "Hello Beautiful World!", 3, 2, 0, id="delete"),
+        pytest.param(demonstrate_formatting_operations, "Hello Beautiful World!", 4, 2, 1, id="format"),
+        pytest.param(demonstrate_macro_commands, "Hello Beautiful World!\n\nBest regards,\nJohn Doe", 4, 0, 0,
+                     id="macro"),
+        pytest.param(demonstrate_error_handling, "Hello Beautiful World!", 0, 0, 0, id="error"),
+    ])
+    def test_phase_from_basic_state(self, basic_state: tuple[TextEditor, TextEditorInvoker], phase_fn,
+                                    content: str, undo_size: int, redo_size: int, segment_count: int) -> None:
+        """Test each demo phase on its own copy of the basic state."""
+        editor, invoker = basic_state
+        
+        phase_fn(editor, invoker)
+        
+        assert editor.content == content
+        assert invoker.get_undo_stack_size() == undo_size
+        assert invoker.get_redo_stack_size() == redo_size
+        assert len(editor.get_formatted_segments()) == segment_count
     
     def test_demonstrate_command_history(self) -> None:
         """Test command history demonstration."""
@@ -113,34 +135,23 @@ class TestDemoFunctions:
 class TestIntegrationDemo:
     """Integration tests for the complete demonstration."""
     
-    def test_full_demo_sequence(self) -> None:
-        """Test that the full demo sequence works without errors."""
-        # This tests the complete flow that would be run in main()
-        
-        # Basic operations
-        editor, invoker = demonstrate_basic_operations()
-        assert editor.content != ""
-        
-        # Undo/redo
-        demonstrate_undo_redo(editor, invoker)
-        
-        # Delete operations
-        demonstrate_delete_operations(editor, invoker)
-        
-        # Formatting
-        demonstrate_formatting_operations(editor, invoker)
-        
-        # Macros
-        demonstrate_macro_commands(editor, invoker)
-        
-        # Error handling
-        demonstrate_error_handling(editor, invoker)
-        
-        # Command history
-        demonstrate_command_history()
-        
-        # All demonstrations should complete without exceptions
-        assert True  # If we reach here, all demos passed
+    @pytest.mark.parametrize("phase,content,undo_size,redo_size,segment_count", [
+        ("basic", "Hello Beautiful World!", 3, 0, 0),
+        ("undo_redo", "Hello Beautiful World!", 3, 0, 0),
+        ("delete", "Hello Beautiful World!", 3, 2, 0),
+        ("format", "Hello Beautiful World!", 4, 2, 1),
+        ("macro", "Hello Beautiful World!\n\nBest regards,\nJohn Doe", 5, 0, 1),
+        ("error", "Hello Beautiful World!\n\nBest regards,\nJohn Doe", 0, 0, 1),
+    ])
+    def test_demo_phase(self, demo_phases: dict[str, tuple[TextEditor, TextEditorInvoker]], phase: str,
+                        content: str, undo_size: int, redo_size: int, segment_count: int) -> None:
+        """Test the editor and history state after each phase of the full demo sequence."""
+        editor, invoker = demo_phases[phase]
+        
+        assert editor.content == content
+        assert invoker.get_undo_stack_size() == undo_size
+        assert invoker.get_redo_stack_size() == redo_size
+        assert len(editor.get_formatted_segments()) == segment_count
     
     def test_demo_with_empty_editor(self) -> None:
         """Test demonstrations starting with empty editor."""
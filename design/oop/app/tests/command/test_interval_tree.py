@@ -0,0 +1,131 @@
+"""Tests for the formatting segment interval tree."""
+
+import random
+from dataclasses import dataclass
+
+import pytest
+from app.command.interval_tree import IntervalTree, _push
+
+
+@dataclass(eq=False)
+class Span:
+    """Minimal mutable interval."""
+    start_pos: int
+    end_pos: int
+
+
+def _check_invariants(node) -> int:
+    """Verify AVL balance, ordering and max_end; return the subtree height."""
+    if node is None:
+        return 0
+    _push(node)
+    left_height = _check_invariants(node.left)
+    right_height = _check_invariants(node.right)
+    assert abs(left_height - right_height) <= 1
+    assert node.height == 1 + max(left_height, right_height)
+    
+    ends = [node.item.end_pos] + [child.max_end for child in (node.left, node.right) if child]
+    assert node.max_end == max(ends)
+    key = (node.item.start_pos, node.item.end_pos)
+    if node.left:
+        assert (node.left.item.start_pos, node.left.item.end_pos) <= key
+    if node.right:
+        assert (node.right.item.start_pos, node.right.item.end_pos) >= key
+    return node.height
+
+
+def _bounds(spans):
+    return sorted((span.start_pos, span.end_pos) for span in spans)
+
+
+class TestIntervalTree:
+    """Test cases for IntervalTree."""
+    
+    def test_empty_tree(self) -> None:
+        """Test queries on an empty tree."""
+        tree = IntervalTree()
+        assert len(tree) == 0
+        assert list(tree) == []
+        assert tree.first() is None
+        assert tree.overlapping(0, 10) == []
+    
+    def test_remove_missing_item(self) -> None:
+        """Test that removing an unknown interval raises KeyError."""
+        tree = IntervalTree()
+        tree.add(Span(0, 5))
+        
+        with pytest.raises(KeyError):
+            tree.remove(Span(0, 5))
+    
+    def test_equal_bounds_removed_by_identity(self) -> None:
+        """Test that intervals with equal bounds are told apart by identity."""
+        tree = IntervalTree()
+        spans = [Span(3, 3) for _ in range(20)]
+        for span in spans:
+            tree.add(span)
+        
+        for span in spans[::3]:
+            tree.remove(span)
+        
+        remaining = [span for i, span in enumerate(spans) if i % 3]
+        assert {id(span) for span in tree} == {id(span) for span in remaining}
+        _check_invariants(tree._root)
+    
+    def test_shift_touches_logarithmic_nodes(self) -> None:
+        """Test that shift_from updates O(log n) items eagerly and the rest on read."""
+        tree = IntervalTree()
+        spans = [Span(i, i + 1) for i in range(1024)]
+        for span in spans:
+            tree.add(span)
+        
+        tree.shift_from(512, 10)
+        
+        # Only the search path was updated; deeper items owe a lazy shift
+        eager = sum(span.start_pos == i + 10 for i, span in enumerate(spans[512:], 512))
+        assert eager <= 2 * tree.height
+        
+        assert _bounds(tree) == [(i, i + 1) for i in range(512)] + [(i + 10, i + 11) for i in range(512, 1024)]
+    
+    def test_random_operations_match_list_model(self) -> None:
+        """Test add, remove, shift and overlap queries against a plain list."""
+        rng = random.Random(7)
+        tree = IntervalTree()
+        # Expected bounds per span, tracked independently of the tree's updates
+        spans = []
+        model = {}
+        
+        for step in range(3000):
+            action = rng.random()
+            if action < 0.45 or not spans:
+                start = rng.randint(0, 500)
+                span = Span(start, start + rng.randint(0, 40))
+                tree.add(span)
+                spans.append(span)
+                model[id(span)] = (span.start_pos, span.end_pos)
+            elif action < 0.65:
+                # Iterating brings every span's bounds up to date first
+                span = rng.choice(list(tree))
+                spans.remove(span)
+                tree.remove(span)
+                del model[id(span)]
+            elif action < 0.8:
+                # A positive shift keeps shifted spans after the unshifted ones
+                position = rng.randint(0, 500)
+                delta = rng.randint(1, 30)
+                tree.shift_from(position, delta)
+                for key, (start, end) in model.items():
+                    if start >= position:
+                        model[key] = (start + delta, end + delta)
+            else:
+                start = rng.randint(0, 550)
+                end = start + rng.randint(0, 60)
+                expected = sorted(b for b in model.values() if b[0] < end and b[1] > start)
+                assert _bounds(tree.overlapping(start, end)) == expected
+            
+            assert len(tree) == len(spans)
+            if step % 100 == 0:
+                _check_invariants(tree._root)
+                assert _bounds(tree) == sorted(model.values())
+        
+        first = tree.first()
+        assert (first.start_pos, first.end_pos) == min(model.values())
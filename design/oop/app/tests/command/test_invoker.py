@@ -1,21 +1,27 @@
 """Tests for TextEditorInvoker class."""
 
+import re
 import pytest
-from unittest.mock import Mock
+from dataclasses import dataclass
+from typing import Callable, Optional
 from app.command.invoker import TextEditorInvoker
 from app.command.command_interface import Command
-from app.command.commands import InsertTextCommand, DeleteTextCommand
+from app.command.commands import InsertTextCommand
 from app.command.text_editor import TextEditor
 
+# Failure messages raised by MockCommand, compiled once
+MOCK_EXECUTE_FAILED = re.compile("Mock command execution failed")
+MOCK_UNDO_FAILED = re.compile("Mock command undo failed")
 
+
+@dataclass(slots=True, eq=False)
 class MockCommand(Command):
     """Mock command for testing purposes."""
     
-    def __init__(self, description: str = "Mock command", should_fail: bool = False) -> None:
-        self.description = description
-        self.should_fail = should_fail
-        self.executed = False
-        self.undone = False
+    description: str = "Mock command"
+    should_fail: bool = False
+    executed: bool = False
+    undone: bool = False
     
     def execute(self) -> None:
         if self.should_fail:
@@ -33,178 +39,191 @@ class MockCommand(Command):
         return self.description
 
 
+class _StubCommand(Command):
+    """Plain command stub that counts calls and raises configured errors."""
+    
+    def __init__(
+        self,
+        description: str = "Stub command",
+        execute_error: Optional[BaseException] = None,
+        undo_error: Optional[BaseException] = None,
+    ) -> None:
+        self.description = description
+        self.execute_error = execute_error
+        self.undo_error = undo_error
+        self.execute_calls = 0
+        self.undo_calls = 0
+    
+    def execute(self) -> None:
+        self.execute_calls += 1
+        if self.execute_error is not None:
+            raise self.execute_error
+    
+    def undo(self) -> None:
+        self.undo_calls += 1
+        if self.undo_error is not None:
+            raise self.undo_error
+    
+    def get_description(self) -> str:
+        return self.description
+
+
 class TestTextEditorInvoker:
     """Test cases for TextEditorInvoker."""
     
-    def setup_method(self) -> None:
-        """Set up test fixtures."""
-        self.invoker = TextEditorInvoker()
-    
-    def test_initial_state(self) -> None:
+    def test_initial_state(self, invoker: TextEditorInvoker) -> None:
         """Test invoker initial state."""
-        assert not self.invoker.can_undo()
-        assert not self.invoker.can_redo()
-        assert self.invoker.get_undo_stack_size() == 0
-        assert self.invoker.get_redo_stack_size() == 0
-        assert self.invoker.get_last_command_description() is None
-        assert self.invoker.get_next_redo_description() is None
+        assert not invoker.can_undo()
+        assert not invoker.can_redo()
+        assert invoker.get_undo_stack_size() == 0
+        assert invoker.get_redo_stack_size() == 0
+        assert invoker.get_last_command_description() is None
+        assert invoker.get_next_redo_description() is None
     
-    def test_execute_command(self) -> None:
-        """Test executing a command."""
-        cmd = MockCommand("Test command")
-        self.invoker.execute_command(cmd)
-        
-        assert cmd.executed
-        assert self.invoker.can_undo()
-        assert not self.invoker.can_redo()
-        assert self.invoker.get_undo_stack_size() == 1
-        assert self.invoker.get_last_command_description() == "Test command"
+    @pytest.mark.parametrize("n_cmds", [1, 2, 3])
+    def test_execute_commands(self, invoker: TextEditorInvoker, n_cmds: int) -> None:
+        """Test executing one or more commands."""
+        cmds = [MockCommand(f"Command {i}") for i in range(n_cmds)]
+        for cmd in cmds:
+            invoker.execute_command(cmd)
+        
+        assert all(cmd.executed for cmd in cmds)
+        assert invoker.can_undo()
+        assert not invoker.can_redo()
+        assert invoker.get_undo_stack_size() == n_cmds
+        assert invoker.get_last_command_description() == f"Command {n_cmds - 1}"
     
-    def test_execute_multiple_commands(self) -> None:
-        """Test executing multiple commands."""
-        cmd1 = MockCommand("Command 1")
-        cmd2 = MockCommand("Command 2")
-        
-        self.invoker.execute_command(cmd1)
-        self.invoker.execute_command(cmd2)
-        
-        assert self.invoker.get_undo_stack_size() == 2
-        assert self.invoker.get_last_command_description() == "Command 2"
-    
-    def test_execute_command_failure(self) -> None:
+    def test_execute_command_failure(self, invoker: TextEditorInvoker) -> None:
         """Test executing a failing command."""
         cmd = MockCommand("Failing command", should_fail=True)
         
-        with pytest.raises(RuntimeError, match="Mock command execution failed"):
-            self.invoker.execute_command(cmd)
+        with pytest.raises(RuntimeError, match=MOCK_EXECUTE_FAILED):
+            invoker.execute_command(cmd)
         
         assert not cmd.executed
-        assert self.invoker.get_undo_stack_size() == 0
+        assert invoker.get_undo_stack_size() == 0
     
-    def test_undo_command(self) -> None:
+    def test_undo_command(self, invoker: TextEditorInvoker) -> None:
         """Test undoing a command."""
         cmd = MockCommand("Test command")
-        self.invoker.execute_command(cmd)
+        invoker.execute_command(cmd)
         
-        success = self.invoker.undo()
+        success = invoker.undo()
         
         assert success
         assert cmd.undone
-        assert not self.invoker.can_undo()
-        assert self.invoker.can_redo()
-        assert self.invoker.get_undo_stack_size() == 0
-        assert self.invoker.get_redo_stack_size() == 1
-        assert self.invoker.get_next_redo_description() == "Test command"
+        assert not invoker.can_undo()
+        assert invoker.can_redo()
+        assert invoker.get_undo_stack_size() == 0
+        assert invoker.get_redo_stack_size() == 1
+        assert invoker.get_next_redo_description() == "Test command"
     
-    def test_undo_no_commands(self) -> None:
+    def test_undo_no_commands(self, invoker: TextEditorInvoker) -> None:
         """Test undoing when no commands available."""
-        success = self.invoker.undo()
+        success = invoker.undo()
         assert not success
     
-    def test_undo_failure(self) -> None:
+    def test_undo_failure(self, invoker: TextEditorInvoker) -> None:
         """Test undoing a command that fails to undo."""
         cmd = MockCommand("Test command")
-        self.invoker.execute_command(cmd)
+        invoker.execute_command(cmd)
         
         # Make undo fail
         cmd.should_fail = True
         
-        with pytest.raises(RuntimeError, match="Mock command undo failed"):
-            self.invoker.undo()
+        with pytest.raises(RuntimeError, match=MOCK_UNDO_FAILED):
+            invoker.undo()
         
         # Command should still be in undo stack
-        assert self.invoker.get_undo_stack_size() == 1
-        assert not self.invoker.can_redo()
+        assert invoker.get_undo_stack_size() == 1
+        assert not invoker.can_redo()
     
-    def test_redo_command(self) -> None:
+    def test_redo_command(self, invoker: TextEditorInvoker) -> None:
         """Test redoing a command."""
         cmd = MockCommand("Test command")
-        self.invoker.execute_command(cmd)
-        self.invoker.undo()
+        invoker.execute_command(cmd)
+        invoker.undo()
         
-        success = self.invoker.redo()
+        success = invoker.redo()
         
         assert success
         assert cmd.executed
-        assert self.invoker.can_undo()
-        assert not self.invoker.can_redo()
-        assert self.invoker.get_undo_stack_size() == 1
-        assert self.invoker.get_redo_stack_size() == 0
+        assert invoker.can_undo()
+        assert not invoker.can_redo()
+        assert invoker.get_undo_stack_size() == 1
+        assert invoker.get_redo_stack_size() == 0
     
-    def test_redo_no_commands(self) -> None:
+    def test_redo_no_commands(self, invoker: TextEditorInvoker) -> None:
         """Test redoing when no commands available."""
-        success = self.invoker.redo()
+        success = invoker.redo()
         assert not success
     
-    def test_redo_failure(self) -> None:
+    def test_redo_failure(self, invoker: TextEditorInvoker) -> None:
         """Test redoing a command that fails to execute."""
         cmd = MockCommand("Test command")
-        self.invoker.execute_command(cmd)
-        self.invoker.undo()
+        invoker.execute_command(cmd)
+        invoker.undo()
         
         # Make redo fail
         cmd.should_fail = True
         
-        with pytest.raises(RuntimeError, match="Mock command execution failed"):
-            self.invoker.redo()
+        with pytest.raises(RuntimeError, match=MOCK_EXECUTE_FAILED):
+            invoker.redo()
         
         # Command should still be in redo stack
-        assert self.invoker.get_redo_stack_size() == 1
-        assert not self.invoker.can_undo()
+        assert invoker.get_redo_stack_size() == 1
+        assert not invoker.can_undo()
     
-    def test_new_command_clears_redo_stack(self) -> None:
+    def test_new_command_clears_redo_stack(self, invoker: TextEditorInvoker) -> None:
         """Test that executing new command clears redo stack."""
         cmd1 = MockCommand("Command 1")
         cmd2 = MockCommand("Command 2")
         
-        self.invoker.execute_command(cmd1)
-        self.invoker.undo()
+        invoker.execute_command(cmd1)
+        invoker.undo()
         
-        assert self.invoker.can_redo()
+        assert invoker.can_redo()
         
-        self.invoker.execute_command(cmd2)
+        invoker.execute_command(cmd2)
         
-        assert not self.invoker.can_redo()
-        assert self.invoker.get_redo_stack_size() == 0
+        assert not invoker.can_redo()
+        assert invoker.get_redo_stack_size() == 0
     
-    def test_clear_history(self) -> None:
+    def test_clear_history(self, invoker: TextEditorInvoker) -> None:
         """Test clearing command history."""
         cmd1 = MockCommand("Command 1")
         cmd2 = MockCommand("Command 2")
         
-        self.invoker.execute_command(cmd1)
-        self.invoker.execute_command(cmd2)
-        self.invoker.undo()
+        invoker.execute_multiple_commands([cmd1, cmd2])
+        invoker.undo()
         
-        assert self.invoker.can_undo()
-        assert self.invoker.can_redo()
+        assert invoker.can_undo()
+        assert invoker.can_redo()
         
-        self.invoker.clear_history()
+        invoker.clear_history()
         
-        assert not self.invoker.can_undo()
-        assert not self.invoker.can_redo()
-        assert self.invoker.get_undo_stack_size() == 0
-        assert self.invoker.get_redo_stack_size() == 0
+        assert not invoker.can_undo()
+        assert not invoker.can_redo()
+        assert invoker.get_undo_stack_size() == 0
+        assert invoker.get_redo_stack_size() == 0
     
-    def test_history_summary(self) -> None:
+    def test_history_summary(self, invoker: TextEditorInvoker) -> None:
         """Test getting history summary."""
         cmd1 = MockCommand("Command 1")
         cmd2 = MockCommand("Command 2")
         cmd3 = MockCommand("Command 3")
         
-        self.invoker.execute_command(cmd1)
-        self.invoker.execute_command(cmd2)
-        self.invoker.execute_command(cmd3)
-        self.invoker.undo()  # Move cmd3 to redo stack
+        invoker.execute_multiple_commands([cmd1, cmd2, cmd3])
+        invoker.undo()  # Move cmd3 to redo stack
         
-        history = self.invoker.get_history_summary()
+        history = invoker.get_history_summary()
         
-        assert history['undo'] == ["Command 2", "Command 1"]  # Most recent first
-        assert history['redo'] == ["Command 3"]
+        assert history['undo'] == ("Command 2", "Command 1")  # Most recent first
+        assert history['redo'] == ("Command 3",)
     
-    def test_max_history_limit(self) -> None:
+    def test_max_history_limit(self, invoker_factory: Callable[..., TextEditorInvoker]) -> None:
         """Test that history respects max limit."""
-        invoker = TextEditorInvoker(max_history=2)
+        invoker = invoker_factory(max_history=2)
         
         cmd1 = MockCommand("Command 1")
         cmd2 = MockCommand("Command 2")
@@ -225,53 +244,46 @@ class TestTextEditorInvoker:
         
         assert not success
     
-    def test_execute_multiple_commands_batch(self) -> None:
+    def test_execute_multiple_commands_batch(self, invoker: TextEditorInvoker, editor: TextEditor) -> None:
         """Test executing multiple commands in a batch."""
-        editor = TextEditor()
         commands = [
             InsertTextCommand(editor, 0, "Hello"),
             InsertTextCommand(editor, 5, " World"),
         ]
         
-        self.invoker.execute_multiple_commands(commands)
+        invoker.execute_multiple_commands(commands)
         
         assert editor.content == "Hello World"
-        assert self.invoker.get_undo_stack_size() == 2
+        assert invoker.get_undo_stack_size() == 2
     
-    def test_execute_multiple_commands_batch_failure(self) -> None:
+    def test_execute_multiple_commands_batch_failure(self, invoker: TextEditorInvoker, editor: TextEditor) -> None:
         """Test executing multiple commands batch with failure."""
-        editor = TextEditor()
         commands = [
             InsertTextCommand(editor, 0, "Hello"),
             InsertTextCommand(editor, 10, "World"),  # This will fail
         ]
         
         with pytest.raises(ValueError):
-            self.invoker.execute_multiple_commands(commands)
+            invoker.execute_multiple_commands(commands)
         
         # Should have rolled back the first command
         assert editor.content == ""
-        assert self.invoker.get_undo_stack_size() == 0
+        assert invoker.get_undo_stack_size() == 0
     
-    def test_execute_multiple_commands_rollback_failure(self) -> None:
+    def test_execute_multiple_commands_rollback_failure(self, invoker: TextEditorInvoker) -> None:
         """Test batch execution with rollback failure."""
-        # Create a mock command that fails during undo
-        failing_undo_cmd = Mock(spec=Command)
-        failing_undo_cmd.execute.return_value = None
-        failing_undo_cmd.undo.side_effect = RuntimeError("Undo failed")
-        failing_undo_cmd.get_description.return_value = "Failing undo command"
+        # Create a command that fails during undo
+        failing_undo_cmd = _StubCommand("Failing undo command", undo_error=RuntimeError("Undo failed"))
         
         # Create a command that fails execution
-        failing_exec_cmd = Mock(spec=Command)
-        failing_exec_cmd.execute.side_effect = RuntimeError("Execution failed")
-        failing_exec_cmd.get_description.return_value = "Failing exec command"
+        failing_exec_cmd = _StubCommand("Failing exec command", execute_error=RuntimeError("Execution failed"))
         
         commands = [failing_undo_cmd, failing_exec_cmd]
         
         # Should still raise the original execution error
         with pytest.raises(RuntimeError, match="Execution failed"):
-            self.invoker.execute_multiple_commands(commands)
+            invoker.execute_multiple_commands(commands)
         
         # The failing undo command should have been executed once
-        failing_undo_cmd.execute.assert_called_once()
-        failing_undo_cmd.undo.assert_called_once()
\ No newline at end of file
+        assert failing_undo_cmd.execute_calls == 1
+        assert failing_undo_cmd.undo_calls == 1
\ No newline at end of file
@@ -0,0 +1,83 @@
+"""Tests for the Rope text buffer."""
+
+import random
+
+import pytest
+from app.command.rope import LEAF_SIZE, Rope, _Leaf, _leaves
+
+
+def _assert_balanced(node) -> None:
+    """Check the AVL height invariant and cached lengths on every node."""
+    if type(node) is _Leaf:
+        assert node.length == len(node.text) <= LEAF_SIZE
+        return
+    assert abs(node.left.height - node.right.height) <= 1
+    assert node.length == node.left.length + node.right.length
+    _assert_balanced(node.left)
+    _assert_balanced(node.right)
+
+
+class TestRope:
+    """Test cases for Rope."""
+    
+    def test_empty_rope(self) -> None:
+        """Test an empty rope."""
+        rope = Rope()
+        assert len(rope) == 0
+        assert str(rope) == ""
+        assert rope.substring(0, 5) == ""
+        assert not rope
+    
+    def test_insert_and_delete(self) -> None:
+        """Test basic edits and that they leave the original rope unchanged."""
+        rope = Rope("Hello World")
+        edited = rope.insert(5, ",").delete(6, 6).insert(6, "Rope")
+        
+        assert str(edited) == "Hello,Rope"
+        assert str(rope) == "Hello World"
+    
+    def test_large_text_is_split_into_leaves(self) -> None:
+        """Test that long text is stored as bounded leaves in a balanced tree."""
+        text = "abcdefghij" * (LEAF_SIZE // 2)
+        rope = Rope(text)
+        
+        assert str(rope) == text
+        assert all(len(leaf) <= LEAF_SIZE for leaf in _leaves(rope._root))
+        assert rope.height >= 1
+        _assert_balanced(rope._root)
+    
+    def test_random_edits_match_str_model(self) -> None:
+        """Test random inserts, deletes and slices against plain str operations."""
+        rng = random.Random(42)
+        model = ""
+        rope = Rope()
+        
+        for step in range(2000):
+            if model and rng.random() < 0.4:
+                start = rng.randrange(len(model))
+                length = rng.randint(1, min(len(model) - start, 3 * LEAF_SIZE))
+                rope = rope.delete(start, length)
+                model = model[:start] + model[start + length:]
+            else:
+                position = rng.randint(0, len(model))
+                text = "".join(rng.choice("xyz") for _ in range(rng.choice((1, 30, 700, 2500))))
+                rope = rope.insert(position, text)
+                model = model[:position] + text + model[position:]
+            
+            assert len(rope) == len(model)
+            if step % 50 == 0:
+                start = rng.randint(0, len(model))
+                end = rng.randint(start, len(model))
+                assert rope.substring(start, end) == model[start:end]
+                _assert_balanced(rope._root)
+        
+        assert str(rope) == model
+    
+    @pytest.mark.parametrize("start,end", [(0, 0), (0, 3), (2, 9), (9, 11), (11, 11)])
+    def test_substring(self, start: int, end: int) -> None:
+        """Test substring on both the cached and the tree-walking path."""
+        text = "Hello World"
+        edited = Rope(text[:4]).insert(4, text[4:])
+        
+        assert edited.substring(start, end) == text[start:end]
+        assert Rope(text).substring(start, end) == text[start:end]
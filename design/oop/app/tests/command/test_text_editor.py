@@ -82,7 +82,57 @@ class TestTextEditor:
         assert segments[0].start_pos == 0
         assert segments[0].end_pos == 5
         assert segments[0].format_type == TextFormat.BOLD
-        assert segments[0].text == "Hello"
+        assert self.editor.segment_text(segments[0]) == "Hello"
+    
+    def test_segment_count_and_first_segment(self) -> None:
+        """Test segment accessors that avoid copying the segment list."""
+        assert self.editor.segment_count == 0
+        assert self.editor.first_segment is None
+        
+        self.editor.insert_text(0, "Hello World")
+        self.editor.format_text(0, 5, TextFormat.BOLD)
+        self.editor.format_text(6, 5, TextFormat.ITALIC)
+        
+        assert self.editor.segment_count == 2
+        assert self.editor.first_segment == self.editor.get_formatted_segments()[0]
+    
+    def test_queries_cached_until_next_edit(self) -> None:
+        """Test that segment and string queries are reused until the editor changes."""
+        self.editor.insert_text(0, "Hello World")
+        self.editor.format_text(0, 5, TextFormat.BOLD)
+        
+        segments = self.editor.get_formatted_segments()
+        rendered = str(self.editor)
+        assert self.editor.get_formatted_segments() is segments
+        assert str(self.editor) is rendered
+        
+        version = self.editor.version
+        self.editor._remove_formatting_in_range(0, 5)
+        assert self.editor.version > version
+        assert self.editor.get_formatted_segments() == ()
+        assert "Formatting" not in str(self.editor)
+        
+        self.editor.insert_text(0, "Hi ")
+        assert str(self.editor) == "Content: 'Hi Hello World'"
+    
+    def test_snapshot_and_restore(self) -> None:
+        """Test that restore() brings back content and formatting from a snapshot."""
+        self.editor.insert_text(0, "Hello World")
+        self.editor.format_text(6, 5, TextFormat.BOLD)
+        snapshot = self.editor.snapshot()
+        
+        # Shifting the segment must not alter the snapshot's copy
+        self.editor.insert_text(0, ">> ")
+        self.editor.format_text(0, 2, TextFormat.ITALIC)
+        
+        other = TextEditor()
+        other.restore(snapshot)
+        self.editor.restore(snapshot)
+        
+        for editor in (self.editor, other):
+            assert editor.content == "Hello World"
+            assert editor.get_formatted_segments() == (TextSegment(6, 11, TextFormat.BOLD),)
+        assert self.editor.first_segment is not other.first_segment
     
     def test_format_text_overlapping(self) -> None:
         """Test overlapping text formatting."""
@@ -94,15 +144,24 @@ class TestTextEditor:
         # Apply italic to "lo Wo" (overlapping)
         old_segments = self.editor.format_text(3, 5, TextFormat.ITALIC)
         
-        # Should have removed the overlapping bold formatting
+        # Should have reported the whole overlapping bold segment
         assert len(old_segments) == 1
         assert old_segments[0].format_type == TextFormat.BOLD
+        assert (old_segments[0].start_pos, old_segments[0].end_pos) == (0, 5)
         
-        segments = self.editor.get_formatted_segments()
-        assert len(segments) == 1
-        assert segments[0].format_type == TextFormat.ITALIC
-        assert segments[0].start_pos == 3
-        assert segments[0].end_pos == 8
+        # Bold is clipped to "Hel" rather than dropped
+        positions = [(s.start_pos, s.end_pos, s.format_type) for s in self.editor.get_formatted_segments()]
+        assert positions == [(0, 3, TextFormat.BOLD), (3, 8, TextFormat.ITALIC)]
+    
+    def test_format_text_inside_segment_splits_it(self) -> None:
+        """Test that formatting inside a wider segment keeps it on both sides."""
+        self.editor.insert_text(0, "Hello World")
+        self.editor.format_text(0, 11, TextFormat.BOLD)
+        
+        self.editor.format_text(4, 3, TextFormat.ITALIC)  # Format "o W"
+        
+        positions = [(s.start_pos, s.end_pos, s.format_type) for s in self.editor.get_formatted_segments()]
+        assert positions == [(0, 4, TextFormat.BOLD), (4, 7, TextFormat.ITALIC), (7, 11, TextFormat.BOLD)]
     
     def test_format_text_invalid_position(self) -> None:
         """Test formatting text at invalid positions."""
@@ -162,6 +221,17 @@ class TestTextEditor:
         assert segments[0].end_pos == 11    # 21 - 10 = 11
         assert segments[0].format_type == TextFormat.BOLD
     
+    def test_segment_text_follows_edits(self) -> None:
+        """Test that a segment's text is read from the current content."""
+        self.editor.insert_text(0, "Hello World")
+        self.editor.format_text(6, 5, TextFormat.BOLD)  # Format "World"
+        
+        # Insert inside the formatted range
+        self.editor.insert_text(8, "--")
+        
+        segment = self.editor.first_segment
+        assert self.editor.segment_text(segment) == "Wo--rld"
+    
     def test_segment_removal_after_delete(self) -> None:
         """Test that formatting segments are removed when text is deleted."""
         self.editor.insert_text(0, "Hello World")
@@ -173,6 +243,29 @@ class TestTextEditor:
         segments = self.editor.get_formatted_segments()
         assert len(segments) == 0
     
+    def test_replace_content_rebases_segments(self) -> None:
+        """Test that replacing the content keeps formatting on the unchanged text."""
+        self.editor.insert_text(0, "Hello Beautiful World")
+        self.editor.format_text(0, 5, TextFormat.ITALIC)  # Format "Hello"
+        self.editor.format_text(16, 5, TextFormat.BOLD)  # Format "World"
+        
+        # Prepend "Hi ", drop "Beautiful " and append "!" in one edit
+        self.editor.replace_content("Hi Hello World!")
+        
+        assert self.editor.content == "Hi Hello World!"
+        positions = [(s.start_pos, s.end_pos, s.format_type) for s in self.editor.get_formatted_segments()]
+        assert positions == [(3, 8, TextFormat.ITALIC), (9, 14, TextFormat.BOLD)]
+    
+    def test_replace_content_drops_replaced_formatting(self) -> None:
+        """Test that formatting on replaced text shrinks with it."""
+        self.editor.insert_text(0, "Hello World")
+        self.editor.format_text(6, 5, TextFormat.BOLD)  # Format "World"
+        
+        self.editor.replace_content("Hello")
+        
+        assert self.editor.content == "Hello"
+        assert self.editor.segment_count == 0
+    
     def test_str_representation_empty(self) -> None:
         """Test string representation of empty editor."""
         assert str(self.editor) == "[Empty]"
@@ -97,6 +97,16 @@ class TestComputerBuilder:
         config = builder.get_current_configuration()
         assert config["power_supply"] == "Corsair RM850x (850W)"
     
+    def test_configuration_view_is_live_and_read_only(self, builder):
+        """Test that the configuration view tracks the builder and rejects writes."""
+        config = builder.get_current_configuration()
+        
+        builder.with_name("Test PC")
+        assert config["name"] == "Test PC"
+        
+        with pytest.raises(TypeError):
+            config["name"] = "Other PC"
+    
     def test_incompatible_components_validation(self, builder):
         """Test that incompatible components are caught during build."""
         with pytest.raises(ValueError, match="CPU socket AM5 incompatible"):
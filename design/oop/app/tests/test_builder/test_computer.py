@@ -1,5 +1,7 @@
 """Tests for the Computer class."""
 
+from dataclasses import FrozenInstanceError
+
 import pytest
 
 from app.builder.computer import Computer
@@ -102,6 +104,35 @@ class TestComputer:
                 gpu=valid_components['gpu']
             )
     
+    def test_all_incompatibilities_reported(self, valid_components):
+        """Test that every failed compatibility check appears in one error."""
+        ddr4_board = Motherboard("Budget Board", "AM5", "DDR4", 16, 2)
+        
+        with pytest.raises(ValueError) as exc_info:
+            Computer(
+                cpu=valid_components['cpu'],
+                motherboard=ddr4_board,
+                ram=valid_components['ram'],
+                power_supply=valid_components['power_supply']
+            )
+        
+        message = str(exc_info.value)
+        assert "CPU socket LGA1700 incompatible" in message
+        assert "RAM type DDR5 incompatible" in message
+        assert "RAM capacity 32GB exceeds" in message
+    
+    def test_computer_is_immutable(self, valid_components):
+        """Test that a validated computer cannot be altered afterwards."""
+        computer = Computer(
+            cpu=valid_components['cpu'],
+            motherboard=valid_components['motherboard'],
+            ram=valid_components['ram'],
+            power_supply=valid_components['power_supply']
+        )
+        
+        with pytest.raises(FrozenInstanceError):
+            computer.ram = RAM(256, 5600, "DDR5", 8)
+    
     def test_power_calculation_without_gpu(self, valid_components):
         """Test power calculation without GPU."""
         computer = Computer(
@@ -160,4 +191,9 @@ class TestComputer:
         assert "Computer:" not in summary  # No name line
         assert "GPU:" not in summary  # No GPU line
         assert "CPU: Intel i7-13700K (16 cores, 3.4GHz)" in summary
-        assert "Estimated Power: 125W" in summary
\ No newline at end of file
+        assert "Estimated Power: 125W" in summary
+        
+        # Later calls reuse the cached summary
+        assert computer.get_summary() is summary
+        assert computer.summary is summary
+        assert str(computer) is summary
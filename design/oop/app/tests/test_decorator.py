@@ -13,23 +13,37 @@ from app.decorator import (
 )
 
 
+# PlainText is read-only, so shared samples are built once per module
+@pytest.fixture(scope="module")
+def plain_hello():
+    """Plain "Hello, World!" text."""
+    return PlainText("Hello, World!")
+
+
+@pytest.fixture(scope="module")
+def plain_empty():
+    """Plain empty text."""
+    return PlainText("")
+
+
+@pytest.fixture(scope="module")
+def plain_test():
+    """Plain "Test" text."""
+    return PlainText("Test")
+
+
 class TestPlainText:
     """Test cases for the PlainText class."""
     
-    def test_plain_text_creation(self):
+    def test_plain_text_creation(self, plain_hello):
         """Test creating a plain text object."""
-        content = "Hello, World!"
-        text = PlainText(content)
-        
-        assert text.render() == content
-        assert text.get_content() == content
+        assert plain_hello.render() == "Hello, World!"
+        assert plain_hello.get_content() == "Hello, World!"
     
-    def test_plain_text_empty_content(self):
+    def test_plain_text_empty_content(self, plain_empty):
         """Test plain text with empty content."""
-        text = PlainText("")
-        
-        assert text.render() == ""
-        assert text.get_content() == ""
+        assert plain_empty.render() == ""
+        assert plain_empty.get_content() == ""
     
     def test_plain_text_special_characters(self):
         """Test plain text with special characters."""
@@ -40,72 +54,24 @@ class TestPlainText:
         assert text.get_content() == content
 
 
-class TestBoldDecorator:
-    """Test cases for the BoldDecorator class."""
-    
-    def test_bold_decorator_single(self):
-        """Test bold decorator on plain text."""
-        plain_text = PlainText("Bold text")
-        bold_text = BoldDecorator(plain_text)
-        
-        assert bold_text.render() == "<b>Bold text</b>"
-        assert bold_text.get_content() == "Bold text"
-    
-    def test_bold_decorator_empty_text(self):
-        """Test bold decorator with empty text."""
-        plain_text = PlainText("")
-        bold_text = BoldDecorator(plain_text)
-        
-        assert bold_text.render() == "<b></b>"
-        assert bold_text.get_content() == ""
-    
-    def test_bold_decorator_preserves_content(self):
-        """Test that bold decorator preserves original content."""
-        original_content = "Test content"
-        plain_text = PlainText(original_content)
-        bold_text = BoldDecorator(plain_text)
-        
-        assert bold_text.get_content() == original_content
-
-
-class TestItalicDecorator:
-    """Test cases for the ItalicDecorator class."""
-    
-    def test_italic_decorator_single(self):
-        """Test italic decorator on plain text."""
-        plain_text = PlainText("Italic text")
-        italic_text = ItalicDecorator(plain_text)
-        
-        assert italic_text.render() == "<i>Italic text</i>"
-        assert italic_text.get_content() == "Italic text"
-    
-    def test_italic_decorator_empty_text(self):
-        """Test italic decorator with empty text."""
-        plain_text = PlainText("")
-        italic_text = ItalicDecorator(plain_text)
-        
-        assert italic_text.render() == "<i></i>"
-        assert italic_text.get_content() == ""
-
-
-class TestUnderlineDecorator:
-    """Test cases for the UnderlineDecorator class."""
-    
-    def test_underline_decorator_single(self):
-        """Test underline decorator on plain text."""
-        plain_text = PlainText("Underlined text")
-        underline_text = UnderlineDecorator(plain_text)
-        
-        assert underline_text.render() == "<u>Underlined text</u>"
-        assert underline_text.get_content() == "Underlined text"
+class TestSingleDecorator:
+    """Test cases for each decorator applied on its own."""
     
-    def test_underline_decorator_empty_text(self):
-        """Test underline decorator with empty text."""
-        plain_text = PlainText("")
-        underline_text = UnderlineDecorator(plain_text)
+    @pytest.mark.parametrize("decorator_class,tag", [
+        pytest.param(BoldDecorator, "b", id="bold"),
+        pytest.param(ItalicDecorator, "i", id="italic"),
+        pytest.param(UnderlineDecorator, "u", id="underline"),
+    ])
+    @pytest.mark.parametrize("content", [
+        pytest.param("Styled text", id="text"),
+        pytest.param("", id="empty"),
+    ])
+    def test_single_decorator(self, decorator_class, tag, content):
+        """Test that a decorator wraps the text in its tag and preserves content."""
+        decorated_text = decorator_class(PlainText(content))
         
-        assert underline_text.render() == "<u></u>"
-        assert underline_text.get_content() == ""
+        assert decorated_text.render() == f"<{tag}>{content}</{tag}>"
+        assert decorated_text.get_content() == content
 
 
 class TestDecoratorComposition:
@@ -153,75 +119,46 @@ class TestDecoratorComposition:
         assert decorated_text.render() == expected
         assert decorated_text.get_content() == "Different Order"
     
-    @pytest.mark.parametrize("decorators,expected_tags", [
-        ([BoldDecorator], ["<b>", "</b>"]),
-        ([ItalicDecorator], ["<i>", "</i>"]),
-        ([UnderlineDecorator], ["<u>", "</u>"]),
-        ([BoldDecorator, ItalicDecorator], ["<i>", "<b>", "</b>", "</i>"]),
-        ([ItalicDecorator, BoldDecorator], ["<b>", "<i>", "</i>", "</b>"]),
-        ([BoldDecorator, ItalicDecorator, UnderlineDecorator], 
-         ["<u>", "<i>", "<b>", "</b>", "</i>", "</u>"])
+    @pytest.mark.parametrize("decorators,expected", [
+        ([BoldDecorator], "<b>Test</b>"),
+        ([ItalicDecorator], "<i>Test</i>"),
+        ([UnderlineDecorator], "<u>Test</u>"),
+        ([BoldDecorator, ItalicDecorator], "<i><b>Test</b></i>"),
+        ([ItalicDecorator, BoldDecorator], "<b><i>Test</i></b>"),
+        ([BoldDecorator, ItalicDecorator, UnderlineDecorator], "<u><i><b>Test</b></i></u>"),
     ])
-    def test_decorator_combinations(self, decorators, expected_tags):
-        """Test various decorator combinations produce expected tags."""
-        content = "Test"
-        text_component = PlainText(content)
+    def test_decorator_combinations(self, plain_test, decorators, expected):
+        """Test various decorator combinations render exactly the expected nesting."""
+        text_component = plain_test
         
         # Apply decorators in sequence
         for decorator_class in decorators:
             text_component = decorator_class(text_component)
         
-        rendered = text_component.render()
-        
-        # Check that all expected tags are present
-        for tag in expected_tags:
-            assert tag in rendered
+        assert text_component.render() == expected
         
         # Check that content is preserved
-        assert text_component.get_content() == content
+        assert text_component.get_content() == "Test"
 
 
 class TestDecoratorInterface:
     """Test cases for the decorator interface and polymorphism."""
     
-    def test_decorator_is_text_component(self):
-        """Test that decorators implement TextComponent interface."""
-        plain_text = PlainText("Test")
-        bold_text = BoldDecorator(plain_text)
-        
-        assert isinstance(bold_text, TextComponent)
-        assert hasattr(bold_text, 'render')
-        assert hasattr(bold_text, 'get_content')
+    @pytest.mark.parametrize("component_class", [PlainText, BoldDecorator, ItalicDecorator, UnderlineDecorator])
+    def test_implements_text_component(self, component_class):
+        """Test that every component class implements the TextComponent interface."""
+        assert issubclass(component_class, TextComponent)
+        assert callable(getattr(component_class, 'render', None))
+        assert callable(getattr(component_class, 'get_content', None))
     
-    def test_decorator_chain_is_text_component(self):
-        """Test that decorator chains maintain TextComponent interface."""
-        plain_text = PlainText("Test")
-        decorated_text = UnderlineDecorator(
-            ItalicDecorator(
-                BoldDecorator(plain_text)
-            )
-        )
-        
-        assert isinstance(decorated_text, TextComponent)
-        assert hasattr(decorated_text, 'render')
-        assert hasattr(decorated_text, 'get_content')
-    
-    def test_decorators_can_decorate_other_decorators(self):
-        """Test that decorators can wrap other decorators seamlessly."""
-        base = PlainText("Base")
-        first_decorator = BoldDecorator(base)
-        second_decorator = ItalicDecorator(first_decorator)
-        third_decorator = UnderlineDecorator(second_decorator)
+    def test_decorator_requires_tag(self, plain_test):
+        """Test that the base and a decorator without a tag cannot be instantiated."""
+        class UntaggedDecorator(TextDecorator):
+            pass
         
-        # Each level should be a valid TextComponent
-        assert isinstance(first_decorator, TextComponent)
-        assert isinstance(second_decorator, TextComponent)
-        assert isinstance(third_decorator, TextComponent)
-        
-        # Content should be preserved at all levels
-        assert first_decorator.get_content() == "Base"
-        assert second_decorator.get_content() == "Base"
-        assert third_decorator.get_content() == "Base"
+        for decorator_class in (TextDecorator, UntaggedDecorator):
+            with pytest.raises(TypeError, match="tag"):
+                decorator_class(plain_test)
 
 
 class TestEdgeCases:
@@ -256,6 +193,27 @@ class TestEdgeCases:
         assert decorated.render() == f"<b>{special_content}</b>"
         assert decorated.get_content() == special_content
 
+    
+    def test_deep_decorator_chain(self):
+        """Test that a chain deeper than the recursion limit still renders."""
+        decorated = PlainText("Deep")
+        for _ in range(5000):
+            decorated = ItalicDecorator(decorated)
+        
+        assert decorated.render() == "<i>" * 5000 + "Deep" + "</i>" * 5000
+    
+    def test_custom_render_in_chain(self):
+        """Test that a decorator overriding render() is not flattened into tags."""
+        class ShoutDecorator(TextDecorator):
+            tag = "shout"
+            
+            def render(self):
+                return self._component.render().upper()
+        
+        decorated = BoldDecorator(ShoutDecorator(ItalicDecorator(PlainText("hi"))))
+        
+        assert decorated.render() == "<b><I>HI</I></b>"
+
 
 class TestDynamicComposition:
     """Test dynamic composition scenarios."""
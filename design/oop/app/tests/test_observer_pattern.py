@@ -1,30 +1,68 @@
 """Comprehensive tests for the Observer pattern implementation."""
 
+import gc
+import importlib
+import sys
 import threading
 import time
+from collections import deque
+from datetime import datetime
 from decimal import Decimal
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 import pytest
 
 from app.observer import Observer, Subject, StockMarket, Trader, Analyst
+from app.observer import support
+from app.observer.demo import run_threaded_demo
 from app.observer.stock_market import Stock
 
+# Prices and cash reused across tests; Decimals are immutable, so parse once
+PRICE_100 = Decimal("100.00")
+PRICE_150 = Decimal("150.00")
+PRICE_151 = Decimal("151.00")
+PRICE_155 = Decimal("155.00")
+PRICE_2500 = Decimal("2500.00")
+STARTING_CASH = Decimal("10000")
+
+# Prices pushed by every worker in test_concurrent_notifications
+CONCURRENT_PRICES = tuple(Decimal(100 + i) for i in range(20))
+
+
+def _drive_prices(market: StockMarket, symbol: str, prices) -> None:
+    """Push each price to the market in turn, notifying observers synchronously."""
+    for price in prices:
+        market.update_stock_price(symbol, price, 1000)
+
 
 class MockObserver(Observer):
-    """Mock observer for testing purposes."""
+    """Mock observer for testing purposes.
     
-    def __init__(self, name: str) -> None:
+    Pass record=False where only update_count matters, so high-volume
+    notification tests skip storing every event.
+    """
+    
+    def __init__(self, name: str, record: bool = True) -> None:
         self._name = name
-        self.updates_received = []
+        self._record = record
+        self.updates_received = deque()
         self.update_count = 0
     
     @property
     def name(self) -> str:
         return self._name
     
-    def update(self, subject, *args, **kwargs) -> None:
+    def update(self, subject, event) -> None:
         self.update_count += 1
-        self.updates_received.append((args, kwargs))
+        if self._record:
+            self.updates_received.append(event)
+
+
+
+class _FailingObserver(MockObserver):
+    """Observer whose update always raises."""
+    
+    def update(self, subject, event) -> None:
+        raise Exception("Observer error")
 
 
 class TestObserverInterface:
@@ -57,6 +95,33 @@ class TestSubject:
         assert self.subject.get_observer_count() == 0
         assert self.subject.get_observer_names() == []
     
+    def test_subjects_with_same_name_share_logger(self) -> None:
+        """Test that loggers are looked up once per name and reused."""
+        assert Subject("TestSubject")._logger is self.subject._logger
+        assert self.subject._logger.name.endswith(".TestSubject")
+    
+    def test_fastrlock_backs_subject_when_installed(self) -> None:
+        """Test the FastRLock path: Subject uses it and it is reentrant."""
+        fastrlock = pytest.importorskip("fastrlock.rlock")
+        assert support.HAS_FASTRLOCK
+        assert isinstance(self.subject._write_lock, fastrlock.FastRLock)
+        
+        # attach/detach re-acquire the write lock while it is already held
+        with self.subject._write_lock:
+            self.subject.attach(self.observer1)
+            self.subject.detach(self.observer1)
+        assert self.subject.get_observer_count() == 0
+    
+    def test_threading_rlock_fallback(self) -> None:
+        """Test that the helpers fall back to threading.RLock without fastrlock."""
+        try:
+            with patch.dict(sys.modules, {"fastrlock": None, "fastrlock.rlock": None}):
+                importlib.reload(support)
+                assert not support.HAS_FASTRLOCK
+                assert support.RLock is threading.RLock
+        finally:
+            importlib.reload(support)
+    
     def test_attach_observer(self) -> None:
         """Test attaching observers."""
         self.subject.attach(self.observer1)
@@ -84,6 +149,17 @@ class TestSubject:
         assert "Observer1" not in self.subject.get_observer_names()
         assert "Observer2" in self.subject.get_observer_names()
     
+    def test_has_observer(self) -> None:
+        """Test membership checks for attached and detached observers."""
+        assert not self.subject.has_observer(self.observer1)
+        
+        self.subject.attach(self.observer1)
+        assert self.subject.has_observer(self.observer1)
+        assert not self.subject.has_observer(self.observer2)
+        
+        self.subject.detach(self.observer1)
+        assert not self.subject.has_observer(self.observer1)
+    
     def test_detach_nonexistent_observer(self) -> None:
         """Test detaching an observer that wasn't attached."""
         self.subject.detach(self.observer1)  # Should not raise exception
@@ -94,26 +170,59 @@ class TestSubject:
         self.subject.attach(self.observer1)
         self.subject.attach(self.observer2)
         
-        self.subject.notify("test_arg", test_kwarg="test_value")
+        event = {"test_key": "test_value"}
+        self.subject.notify(event)
         
         assert self.observer1.update_count == 1
         assert self.observer2.update_count == 1
-        assert self.observer1.updates_received[0] == (("test_arg",), {"test_kwarg": "test_value"})
+        assert self.observer1.updates_received[0] == {"test_key": "test_value"}
+        # Every observer receives the same event object, not a per-observer copy
+        assert self.observer1.updates_received[0] is self.observer2.updates_received[0]
+    
+    def test_attach_during_notify_uses_snapshot(self) -> None:
+        """Test that observers attached mid-notification only see later notifications."""
+        subject = self.subject
+        late_observer = self.observer2
+
+        class AttachingObserver(MockObserver):
+            def update(self, subject_, event) -> None:
+                super().update(subject_, event)
+                subject.attach(late_observer)
+
+        attacher = AttachingObserver("Attacher")
+        subject.attach(attacher)
+        subject.notify({})
+        assert late_observer.update_count == 0
+
+        subject.notify({})
+        assert late_observer.update_count == 1
+
+    def test_unreferenced_observer_is_dropped(self) -> None:
+        """Test that observers are held weakly and vanish once collected."""
+        self.subject.attach(self.observer1)
+        self.subject.attach(self.observer2)
+        
+        del self.observer2
+        gc.collect()
+        
+        assert self.subject.get_observer_names() == ["Observer1"]
+        self.subject.notify({})
+        assert self.observer1.update_count == 1
     
     def test_notify_no_observers(self) -> None:
         """Test notifying when no observers are attached."""
-        self.subject.notify()  # Should not raise exception
+        with patch.object(self.subject, "_live_observers") as live_observers:
+            self.subject.notify({})  # Should not raise exception
+        live_observers.assert_not_called()
     
     def test_notify_with_observer_exception(self) -> None:
         """Test that observer exceptions don't crash the notification process."""
-        failing_observer = Mock(spec=Observer)
-        failing_observer.name = "FailingObserver"
-        failing_observer.update.side_effect = Exception("Observer error")
+        failing_observer = _FailingObserver("FailingObserver")
         
         self.subject.attach(self.observer1)
         self.subject.attach(failing_observer)
         
-        self.subject.notify()  # Should not raise exception
+        self.subject.notify({})  # Should not raise exception
         assert self.observer1.update_count == 1
 
 
@@ -122,9 +231,9 @@ class TestStock:
     
     def test_stock_initialization(self) -> None:
         """Test stock initialization."""
-        stock = Stock("AAPL", Decimal("150.00"), 1000)
+        stock = Stock("AAPL", PRICE_150, 1000)
         assert stock.symbol == "AAPL"
-        assert stock.price == Decimal("150.00")
+        assert stock.price == PRICE_150
         assert stock.volume == 1000
         assert stock.previous_price is None
         assert stock.price_change is None
@@ -132,194 +241,285 @@ class TestStock:
     
     def test_stock_price_update(self) -> None:
         """Test stock price updates."""
-        stock = Stock("AAPL", Decimal("150.00"))
+        stock = Stock("AAPL", PRICE_150)
         
-        changed = stock.update_price(Decimal("155.00"), 2000)
+        changed = stock.update_price(PRICE_155, 2000)
         assert changed is True
-        assert stock.price == Decimal("155.00")
-        assert stock.previous_price == Decimal("150.00")
+        assert stock.price == PRICE_155
+        assert stock.previous_price == PRICE_150
         assert stock.volume == 2000
         assert stock.price_change == Decimal("5.00")
         assert abs(stock.price_change_percent - Decimal("3.33")) < Decimal("0.01")
     
     def test_stock_no_price_change(self) -> None:
         """Test when stock price doesn't change."""
-        stock = Stock("AAPL", Decimal("150.00"))
+        stock = Stock("AAPL", PRICE_150)
         
-        changed = stock.update_price(Decimal("150.00"), 2000)
+        changed = stock.update_price(PRICE_150, 2000)
         assert changed is False
-        assert stock.price == Decimal("150.00")
+        assert stock.price == PRICE_150
         assert stock.previous_price is None
+    
+    def test_stock_uses_slots(self) -> None:
+        """Test that Stock instances carry no per-instance __dict__."""
+        stock = Stock("AAPL", PRICE_150)
+        assert not hasattr(stock, "__dict__")
+        with pytest.raises(AttributeError):
+            stock.unknown_attribute = 1
+    
+    def test_stock_float_prices(self) -> None:
+        """Test that float prices stay floats through the change calculations."""
+        stock = Stock("AAPL", 150.0)
+        
+        assert stock.update_price(153.0, 2000) is True
+        assert stock.price_change == pytest.approx(3.0)
+        assert isinstance(stock.price_change_percent, float)
+        assert stock.price_change_percent == pytest.approx(2.0)
+
+
+@pytest.fixture
+def market() -> StockMarket:
+    """Empty market for each test."""
+    return StockMarket("TestMarket")
+
+
+@pytest.fixture
+def aapl_market(market: StockMarket) -> StockMarket:
+    """Market listing AAPL at 100.00."""
+    market.add_stock("AAPL", PRICE_100)
+    return market
 
 
 class TestStockMarket:
     """Test the StockMarket class functionality."""
     
-    def setup_method(self) -> None:
-        """Set up test fixtures."""
-        self.market = StockMarket("TestMarket")
-        self.observer = MockObserver("TestObserver")
-        self.market.attach(self.observer)
+    @pytest.fixture
+    def observer(self, market: StockMarket) -> MockObserver:
+        """Observer attached to the market, recording its notifications."""
+        observer = MockObserver("TestObserver")
+        market.attach(observer)
+        return observer
     
-    def test_stock_market_initialization(self) -> None:
+    def test_stock_market_initialization(self, market: StockMarket) -> None:
         """Test stock market initialization."""
-        assert self.market.name == "TestMarket"
-        assert self.market.stock_count == 0
-        assert not self.market.is_market_open
+        assert market.name == "TestMarket"
+        assert market.stock_count == 0
+        assert not market.is_market_open
     
-    def test_add_stock(self) -> None:
+    def test_add_stock(self, market: StockMarket) -> None:
         """Test adding stocks to the market."""
-        self.market.add_stock("AAPL", Decimal("150.00"), 1000)
+        market.add_stock("AAPL", PRICE_150, 1000)
         
-        assert self.market.stock_count == 1
-        assert self.market.get_stock_price("AAPL") == Decimal("150.00")
+        assert market.stock_count == 1
+        assert market.get_stock_price("AAPL") == PRICE_150
         
-        stock_info = self.market.get_stock_info("AAPL")
+        stock_info = market.get_stock_info("AAPL")
         assert stock_info.symbol == "AAPL"
         assert stock_info.volume == 1000
     
-    def test_add_duplicate_stock(self) -> None:
+    def test_add_duplicate_stock(self, market: StockMarket) -> None:
         """Test adding duplicate stock raises ValueError."""
-        self.market.add_stock("AAPL", Decimal("150.00"))
+        market.add_stock("AAPL", PRICE_150)
         
         with pytest.raises(ValueError, match="Stock AAPL already exists"):
-            self.market.add_stock("AAPL", Decimal("160.00"))
+            market.add_stock("AAPL", Decimal("160.00"))
     
-    def test_remove_stock(self) -> None:
+    def test_remove_stock(self, market: StockMarket) -> None:
         """Test removing stocks from the market."""
-        self.market.add_stock("AAPL", Decimal("150.00"))
-        self.market.remove_stock("AAPL")
+        market.add_stock("AAPL", PRICE_150)
+        market.remove_stock("AAPL")
         
-        assert self.market.stock_count == 0
+        assert market.stock_count == 0
         with pytest.raises(KeyError):
-            self.market.get_stock_price("AAPL")
+            market.get_stock_price("AAPL")
     
-    def test_remove_nonexistent_stock(self) -> None:
+    def test_remove_nonexistent_stock(self, market: StockMarket) -> None:
         """Test removing non-existent stock raises KeyError."""
         with pytest.raises(KeyError, match="Stock AAPL not found"):
-            self.market.remove_stock("AAPL")
+            market.remove_stock("AAPL")
     
-    def test_update_stock_price_with_notification(self) -> None:
+    def test_update_stock_price_with_notification(self, market: StockMarket, observer: MockObserver) -> None:
         """Test that price updates trigger notifications."""
-        self.market.add_stock("AAPL", Decimal("150.00"))
+        market.add_stock("AAPL", PRICE_150)
         
-        self.market.update_stock_price("AAPL", Decimal("155.00"), 2000)
+        market.update_stock_price("AAPL", PRICE_155, 2000)
         
-        assert self.observer.update_count == 1
-        args, kwargs = self.observer.updates_received[0]
-        assert kwargs["event_type"] == "price_change"
-        assert kwargs["symbol"] == "AAPL"
-        assert kwargs["new_price"] == Decimal("155.00")
-        assert kwargs["previous_price"] == Decimal("150.00")
+        assert observer.update_count == 1
+        event = observer.updates_received[0]
+        assert event["event_type"] == "price_change"
+        assert event["symbol"] == "AAPL"
+        assert event["new_price"] == PRICE_155
+        assert event["previous_price"] == PRICE_150
+        assert event["price_change"] == Decimal("5.00")
+        assert event["price_change_percent"] == event["stock"].price_change_percent
     
-    def test_update_stock_price_no_change(self) -> None:
+    def test_update_stock_price_no_change(self, market: StockMarket, observer: MockObserver) -> None:
         """Test that unchanged prices don't trigger notifications."""
-        self.market.add_stock("AAPL", Decimal("150.00"))
+        market.add_stock("AAPL", PRICE_150)
+        
+        market.update_stock_price("AAPL", PRICE_150, 2000)
+        
+        assert observer.update_count == 0
+    
+    def test_update_stock_price_with_timestamp(self, market: StockMarket, observer: MockObserver) -> None:
+        """Test that a caller-supplied timestamp is recorded and broadcast."""
+        market.add_stock("AAPL", PRICE_150)
+        stamp = datetime(2024, 1, 2, 9, 30)
+        
+        market.update_stock_price("AAPL", PRICE_151, 100, timestamp=stamp)
+        
+        assert market.get_stock_info("AAPL").last_updated == stamp
+        assert observer.updates_received[0]["timestamp"] == stamp
+    
+    def test_update_batch_shares_timestamp(self, market: StockMarket, observer: MockObserver) -> None:
+        """Test that a batch notifies each change with one shared timestamp."""
+        market.add_stock("AAPL", PRICE_150)
+        market.add_stock("GOOGL", PRICE_2500)
         
-        self.market.update_stock_price("AAPL", Decimal("150.00"), 2000)
+        market.update_batch([
+            ("AAPL", PRICE_151, 100),
+            ("GOOGL", PRICE_2500, 200),  # unchanged, no notification
+            ("AAPL", Decimal("152.00"), 300),
+        ])
         
-        assert self.observer.update_count == 0
+        assert observer.update_count == 2
+        first, second = observer.updates_received
+        assert first["new_price"] == PRICE_151
+        assert second["previous_price"] == PRICE_151
+        assert first["timestamp"] == second["timestamp"]
     
-    def test_update_nonexistent_stock(self) -> None:
+    def test_update_batch_unknown_stock_applies_nothing(self, market: StockMarket, observer: MockObserver) -> None:
+        """Test that a batch with an unknown symbol raises before updating."""
+        market.add_stock("AAPL", PRICE_150)
+        
+        with pytest.raises(KeyError, match="Stock MSFT not found"):
+            market.update_batch([("AAPL", PRICE_151, 100), ("MSFT", Decimal("1"), 1)])
+        
+        assert market.get_stock_price("AAPL") == PRICE_150
+        assert observer.update_count == 0
+    
+    def test_mixed_price_types_follow_listed_type(self, market: StockMarket, observer: MockObserver) -> None:
+        """Test that float updates to a Decimal stock (and vice versa) are converted."""
+        market.add_stock("AAPL", Decimal("100"))
+        market.add_stock("GOOGL", 2500.0)
+        
+        market.update_batch([("AAPL", 101.5, 100), ("GOOGL", Decimal("2525"), 200)])
+        
+        assert observer.update_count == 2
+        aapl, googl = observer.updates_received
+        assert aapl["new_price"] == Decimal("101.5")
+        assert aapl["price_change"] == Decimal("1.5")
+        assert isinstance(market.get_stock_price("AAPL"), Decimal)
+        assert googl["new_price"] == 2525.0
+        assert isinstance(googl["price_change_percent"], float)
+    
+    def test_update_nonexistent_stock(self, market: StockMarket) -> None:
         """Test updating non-existent stock raises KeyError."""
         with pytest.raises(KeyError, match="Stock AAPL not found"):
-            self.market.update_stock_price("AAPL", Decimal("155.00"))
+            market.update_stock_price("AAPL", PRICE_155)
     
-    def test_market_open_close(self) -> None:
+    def test_market_open_close(self, market: StockMarket, observer: MockObserver) -> None:
         """Test market open/close operations."""
-        self.market.open_market()
-        assert self.market.is_market_open
-        assert self.observer.update_count == 1
+        market.open_market()
+        assert market.is_market_open
+        assert observer.update_count == 1
         
-        self.market.close_market()
-        assert not self.market.is_market_open
-        assert self.observer.update_count == 2
+        market.close_market()
+        assert not market.is_market_open
+        assert observer.update_count == 2
         
         # Check notification content
-        _, open_kwargs = self.observer.updates_received[0]
-        assert open_kwargs["event_type"] == "market_opened"
+        open_event = observer.updates_received[0]
+        assert open_event["event_type"] == "market_opened"
         
-        _, close_kwargs = self.observer.updates_received[1]
-        assert close_kwargs["event_type"] == "market_closed"
+        close_event = observer.updates_received[1]
+        assert close_event["event_type"] == "market_closed"
     
-    def test_get_all_stocks(self) -> None:
+    def test_get_all_stocks(self, market: StockMarket) -> None:
         """Test getting all stocks information."""
-        self.market.add_stock("AAPL", Decimal("150.00"))
-        self.market.add_stock("GOOGL", Decimal("2500.00"))
+        market.add_stock("AAPL", PRICE_150)
+        market.add_stock("GOOGL", PRICE_2500)
         
-        all_stocks = self.market.get_all_stocks()
+        all_stocks = market.get_all_stocks()
         assert len(all_stocks) == 2
         assert "AAPL" in all_stocks
         assert "GOOGL" in all_stocks
-        assert all_stocks["AAPL"].price == Decimal("150.00")
+        assert all_stocks["AAPL"].price == PRICE_150
 
 
 class TestTrader:
     """Test the Trader observer implementation."""
     
-    def setup_method(self) -> None:
-        """Set up test fixtures."""
-        self.trader = Trader("TestTrader", Decimal("10000"))
-        self.market = StockMarket("TestMarket")
-        self.market.attach(self.trader)
-        self.market.add_stock("AAPL", Decimal("100.00"))
+    @pytest.fixture
+    def trader(self, aapl_market: StockMarket) -> Trader:
+        """Trader with 10000 cash watching the AAPL market."""
+        trader = Trader("TestTrader", STARTING_CASH)
+        aapl_market.attach(trader)
+        return trader
     
-    def test_trader_initialization(self) -> None:
+    def test_trader_initialization(self, trader: Trader) -> None:
         """Test trader initialization."""
-        assert self.trader.name == "TestTrader"
-        assert self.trader.cash == Decimal("10000")
-        assert self.trader.portfolio == {}
-        assert self.trader.trade_history == []
+        assert trader.name == "TestTrader"
+        assert trader.cash == STARTING_CASH
+        assert trader.portfolio == {}
+        assert trader.trade_history == []
     
-    def test_trader_buy_trigger(self) -> None:
+    def test_trader_buy_trigger(self, trader: Trader, aapl_market: StockMarket) -> None:
         """Test that price drops trigger buy orders."""
         # Simulate 3% price drop (should trigger buy)
-        self.market.update_stock_price("AAPL", Decimal("97.00"), 1000)
+        aapl_market.update_stock_price("AAPL", Decimal("97.00"), 1000)
         
-        # Give some time for processing
-        time.sleep(0.1)
-        
-        assert len(self.trader.trade_history) > 0
-        assert self.trader.trade_history[0]["action"] == "BUY"
-        assert self.trader.portfolio.get("AAPL", 0) > 0
-        assert self.trader.cash < Decimal("10000")
+        assert len(trader.trade_history) > 0
+        assert trader.trade_history[0]["action"] == "BUY"
+        assert trader.portfolio.get("AAPL", 0) > 0
+        assert trader.cash < STARTING_CASH
     
-    def test_trader_sell_trigger(self) -> None:
+    def test_trader_sell_trigger(self, trader: Trader, aapl_market: StockMarket) -> None:
         """Test that significant price increases trigger sell orders."""
         # First, give trader some shares
-        self.market.update_stock_price("AAPL", Decimal("95.00"), 1000)  # Buy trigger
-        time.sleep(0.1)
+        aapl_market.update_stock_price("AAPL", Decimal("95.00"), 1000)  # Buy trigger
         
-        initial_shares = self.trader.portfolio.get("AAPL", 0)
-        initial_cash = self.trader.cash
+        initial_shares = trader.portfolio.get("AAPL", 0)
+        initial_cash = trader.cash
         
         # Now trigger a sell with price increase
-        self.market.update_stock_price("AAPL", Decimal("110.00"), 2000)  # +15.8% increase
-        time.sleep(0.1)
+        aapl_market.update_stock_price("AAPL", Decimal("110.00"), 2000)  # +15.8% increase
         
         # Should have sold some shares
-        final_shares = self.trader.portfolio.get("AAPL", 0)
-        final_cash = self.trader.cash
+        final_shares = trader.portfolio.get("AAPL", 0)
+        final_cash = trader.cash
         
         assert final_shares < initial_shares
         assert final_cash > initial_cash
     
-    def test_trader_portfolio_value(self) -> None:
+    def test_trader_buys_on_float_prices(self, trader: Trader) -> None:
+        """Test that float market prices keep the trader's cash exact."""
+        market = StockMarket("FloatMarket")
+        market.attach(trader)
+        market.add_stock("MSFT", 100.0)
+        
+        market.update_stock_price("MSFT", 97.5, 1000)
+        
+        assert trader.trade_history[0]["price"] == Decimal("97.5")
+        assert isinstance(trader.cash, Decimal)
+        assert trader.cash < STARTING_CASH
+    
+    def test_trader_portfolio_value(self, trader: Trader) -> None:
         """Test portfolio value calculation."""
         # Give trader some positions
-        self.trader._portfolio["AAPL"] = 10
-        self.trader._cash = Decimal("5000")
+        trader._portfolio["AAPL"] = 10
+        trader._cash = Decimal("5000")
         
-        market_prices = {"AAPL": Decimal("150.00")}
-        portfolio_value = self.trader.get_portfolio_value(market_prices)
+        market_prices = {"AAPL": PRICE_150}
+        portfolio_value = trader.get_portfolio_value(market_prices)
         
-        expected_value = Decimal("5000") + (10 * Decimal("150.00"))  # Cash + stock value
+        expected_value = Decimal("5000") + (10 * PRICE_150)  # Cash + stock value
         assert portfolio_value == expected_value
     
-    def test_trader_market_events(self) -> None:
+    def test_trader_market_events(self, trader: Trader, aapl_market: StockMarket) -> None:
         """Test trader response to market open/close events."""
-        self.market.open_market()
-        self.market.close_market()
+        aapl_market.open_market()
+        aapl_market.close_market()
         
         # Trader should process these events without error
         # (specific behavior depends on implementation)
@@ -328,49 +528,47 @@ class TestTrader:
 class TestAnalyst:
     """Test the Analyst observer implementation."""
     
-    def setup_method(self) -> None:
-        """Set up test fixtures."""
-        self.analyst = Analyst("TestAnalyst", "Technology")
-        self.market = StockMarket("TestMarket")
-        self.market.attach(self.analyst)
-        self.market.add_stock("AAPL", Decimal("100.00"))
+    @pytest.fixture
+    def analyst(self, aapl_market: StockMarket) -> Analyst:
+        """Technology analyst watching the AAPL market."""
+        analyst = Analyst("TestAnalyst", "Technology")
+        aapl_market.attach(analyst)
+        return analyst
     
-    def test_analyst_initialization(self) -> None:
+    def test_analyst_initialization(self, analyst: Analyst) -> None:
         """Test analyst initialization."""
-        assert self.analyst.name == "TestAnalyst"
-        assert self.analyst.specialization == "Technology"
-        assert self.analyst.stocks_tracked == []
+        assert analyst.name == "TestAnalyst"
+        assert analyst.specialization == "Technology"
+        assert analyst.stocks_tracked == []
     
-    def test_analyst_tracks_price_changes(self) -> None:
+    def test_analyst_tracks_price_changes(self, analyst: Analyst, aapl_market: StockMarket) -> None:
         """Test that analyst tracks price changes."""
-        self.market.update_stock_price("AAPL", Decimal("105.00"), 1000)
+        aapl_market.update_stock_price("AAPL", Decimal("105.00"), 1000)
         
-        time.sleep(0.1)  # Allow processing
-        
-        assert "AAPL" in self.analyst.stocks_tracked
-        stats = self.analyst.get_stock_statistics("AAPL")
+        assert "AAPL" in analyst.stocks_tracked
+        stats = analyst.get_stock_statistics("AAPL")
         assert stats is not None
         assert stats["symbol"] == "AAPL"
         assert stats["data_points"] == 1
         assert stats["current_price"] == Decimal("105.00")
     
-    def test_analyst_statistics(self) -> None:
-        """Test analyst statistical calculations."""
-        # Generate several price updates
-        prices = [Decimal("100.00"), Decimal("105.00"), Decimal("95.00"), Decimal("110.00")]
-        
-        for price in prices[1:]:  # Skip first as it's the initial price
-            self.market.update_stock_price("AAPL", price, 1000)
-            time.sleep(0.05)
-        
-        stats = self.analyst.get_stock_statistics("AAPL")
-        assert stats["data_points"] == 3  # 3 updates after initial
-        assert stats["price_range"][0] <= stats["price_range"][1]  # min <= max
+    @pytest.mark.parametrize("prices", [
+        pytest.param((Decimal("105.00"), Decimal("95.00"), Decimal("110.00")), id="swinging"),
+        pytest.param((Decimal("98.00"), Decimal("96.00"), Decimal("94.00")), id="falling"),
+    ])
+    def test_analyst_statistics(self, analyst: Analyst, aapl_market: StockMarket, prices) -> None:
+        """Test analyst statistical calculations over updates from the 100.00 listing."""
+        _drive_prices(aapl_market, "AAPL", prices)
+        
+        stats = analyst.get_stock_statistics("AAPL")
+        assert stats["data_points"] == len(prices)
+        assert stats["price_range"] == (min(prices), max(prices))
+        assert stats["current_price"] == prices[-1]
         assert stats["volatility"] > Decimal("0")  # Should have some volatility
     
-    def test_analyst_nonexistent_stock(self) -> None:
+    def test_analyst_nonexistent_stock(self, analyst: Analyst) -> None:
         """Test getting statistics for non-tracked stock."""
-        stats = self.analyst.get_stock_statistics("NONEXISTENT")
+        stats = analyst.get_stock_statistics("NONEXISTENT")
         assert stats is None
 
 
@@ -380,7 +578,7 @@ class TestThreadSafety:
     def test_concurrent_attach_detach(self) -> None:
         """Test concurrent attach/detach operations."""
         subject = Subject("ThreadTest")
-        observers = [MockObserver(f"Observer{i}") for i in range(10)]
+        observers = [MockObserver(f"Observer{i}", record=False) for i in range(10)]
         
         def attach_detach_worker():
             for _ in range(50):
@@ -406,17 +604,16 @@ class TestThreadSafety:
     def test_concurrent_notifications(self) -> None:
         """Test concurrent notification operations."""
         market = StockMarket("ConcurrentTest")
-        observers = [MockObserver(f"Observer{i}") for i in range(10)]
+        observers = [MockObserver(f"Observer{i}", record=False) for i in range(10)]
         
         for observer in observers:
             market.attach(observer)
         
-        market.add_stock("TEST", Decimal("100.00"))
+        market.add_stock("TEST", PRICE_100)
         
         def notification_worker():
-            for i in range(20):
+            for price in CONCURRENT_PRICES:
                 try:
-                    price = Decimal(str(100 + i))
                     market.update_stock_price("TEST", price, 1000)
                     time.sleep(0.001)
                 except Exception:
@@ -454,8 +651,8 @@ class TestIntegration:
         
         # Add stocks
         stocks = {
-            "AAPL": Decimal("150.00"),
-            "GOOGL": Decimal("2500.00"),
+            "AAPL": PRICE_150,
+            "GOOGL": PRICE_2500,
             "MSFT": Decimal("300.00")
         }
         
@@ -467,13 +664,8 @@ class TestIntegration:
         
         # Simulate market activity
         market.update_stock_price("AAPL", Decimal("147.00"), 10000)  # -2% drop
-        time.sleep(0.1)
-        
         market.update_stock_price("GOOGL", Decimal("2575.00"), 5000)  # +3% rise
-        time.sleep(0.1)
-        
         market.update_stock_price("MSFT", Decimal("285.00"), 8000)  # -5% drop
-        time.sleep(0.1)
         
         # Close market
         market.close_market()
@@ -492,4 +684,14 @@ class TestIntegration:
         portfolio_value2 = trader2.get_portfolio_value(market_prices)
         
         assert portfolio_value1 > Decimal("0")
-        assert portfolio_value2 > Decimal("0")
\ No newline at end of file
+        assert portfolio_value2 > Decimal("0")
+    
+    def test_threaded_demo_reports_attached_observer_stats(self, capsys) -> None:
+        """Test that the threaded demo prints stats for observers still attached."""
+        run_threaded_demo(demo_duration=0)
+        
+        output = capsys.readouterr().out
+        for name in ("Trader_1", "Trader_2", "Trader_3"):
+            assert f"{name}: Portfolio Value=$" in output
+        assert "TechAnalyst (Technology): Tracking 0 stocks" in output
+        assert "EnergyAnalyst (Energy): Tracking 0 stocks" in output
@@ -4,15 +4,22 @@ Comprehensive tests for the Strategy pattern implementation of sorting algorithm
 Tests include functionality, performance with large datasets, and strategy switching.
 """
 
+import copy
+import json
 import pytest
 import random
 import time
+from array import array
+from enum import IntEnum
 from typing import List
+from unittest.mock import patch
 from app.strategy import (
     DataSorter,
     QuickSortStrategy,
     MergeSortStrategy,
     HeapSortStrategy,
+    InsertionSortStrategy,
+    BitonicSortStrategy,
     SortingStrategy
 )
 
@@ -67,6 +74,7 @@ class TestSortingStrategies:
         """All sorting strategies to test."""
         return [
             QuickSortStrategy(),
+            QuickSortStrategy(classical=True),
             MergeSortStrategy(),
             HeapSortStrategy()
         ]
@@ -142,6 +150,17 @@ class TestSortingStrategies:
             assert result == expected, f"{strategy.name} failed on very large dataset"
             print(f"{strategy.name}: {execution_time * 1000:.2f}ms for 100K elements")
     
+    def test_default_quicksort_describes_builtin_sort(self):
+        """Test that the list.sort-backed QuickSort reports TimSort's figures."""
+        info = QuickSortStrategy().algorithm_info
+        classical_info = QuickSortStrategy(classical=True).algorithm_info
+        
+        assert info['name'] == "TimSort"
+        assert info['time_complexity_worst'] == "O(n log n)"
+        assert info['space_complexity'] == "O(n)"
+        assert classical_info['name'] == "QuickSort"
+        assert classical_info['time_complexity_worst'] == "O(n²)"
+    
     def test_strategy_properties(self, strategies: List[SortingStrategy]):
         """Test that all strategies have required properties."""
         for strategy in strategies:
@@ -156,6 +175,160 @@ class TestSortingStrategies:
             assert "O(" in strategy.time_complexity_average
             assert "O(" in strategy.time_complexity_worst
             assert "O(" in strategy.space_complexity
+    
+    def test_strategy_missing_class_attributes(self):
+        """Test that a concrete strategy must define its descriptive class attributes."""
+        with pytest.raises(TypeError, match="space_complexity"):
+            class IncompleteSort(SortingStrategy[int]):
+                name = "Incomplete"
+                time_complexity_best = "O(n)"
+                time_complexity_average = "O(n)"
+                time_complexity_worst = "O(n)"
+                
+                def sort(self, data: List[int]) -> List[int]:
+                    return sorted(data)
+    
+    def test_sizes_around_insertion_cutoff(self, strategies: List[SortingStrategy]):
+        """Test lengths either side of the small-subarray insertion sort cutoff."""
+        random.seed(42)
+        for size in range(2, 40):
+            data = [random.randint(0, 10) for _ in range(size)]
+            for strategy in strategies:
+                assert strategy.sort(data) == sorted(data), f"{strategy.name} failed on {size} elements"
+    
+    def test_duplicate_heavy_data(self, strategies: List[SortingStrategy]):
+        """Test inputs dominated by equal keys, including a single repeated value."""
+        random.seed(42)
+        few_keys = [random.randint(1, 3) for _ in range(5000)]
+        all_equal = [7] * 5000
+        
+        for strategy in strategies:
+            assert strategy.sort(few_keys) == sorted(few_keys), f"{strategy.name} failed on few keys"
+            assert strategy.sort(all_equal) == all_equal, f"{strategy.name} failed on equal keys"
+    
+    def test_insertion_sort_strategy(self, sample_data: List[int], duplicates: List[int]):
+        """Test the insertion sort strategy on small inputs only (it is O(n²))."""
+        strategy = InsertionSortStrategy()
+        
+        assert strategy.sort(sample_data) == sorted(sample_data)
+        assert strategy.sort(duplicates) == sorted(duplicates)
+        assert strategy.sort([]) == []
+        assert sample_data == [64, 34, 25, 12, 22, 11, 90]
+    
+    def test_mergesort_is_stable(self):
+        """Test that MergeSort keeps equal elements in their original order."""
+        
+        class Keyed:
+            def __init__(self, key: int, tag: int):
+                self.key = key
+                self.tag = tag
+            
+            def __le__(self, other: "Keyed") -> bool:
+                return self.key <= other.key
+            
+            def __lt__(self, other: "Keyed") -> bool:
+                return self.key < other.key
+        
+        random.seed(42)
+        data = [Keyed(random.randint(0, 20), tag) for tag in range(500)]
+        result = MergeSortStrategy().sort(data)
+        
+        expected = sorted(data, key=lambda item: item.key)
+        assert [(item.key, item.tag) for item in result] == [(item.key, item.tag) for item in expected]
+
+
+class TestNumericFastPath:
+    """Test the optional Numba/NumPy strategy paths for numeric lists."""
+    
+    @pytest.fixture
+    def compiled_strategies(self) -> List[SortingStrategy]:
+        """Strategies that have a compiled numeric fast path."""
+        return [QuickSortStrategy(classical=True), MergeSortStrategy(), HeapSortStrategy()]
+    
+    def test_numeric_lists_keep_element_types(self, compiled_strategies: List[SortingStrategy]):
+        """Test that int and float lists come back sorted with their own types."""
+        pytest.importorskip("numpy")
+        random.seed(42)
+        ints = [random.randint(-10**6, 10**6) for _ in range(5000)]
+        floats = [random.uniform(-1.0, 1.0) for _ in range(5000)]
+        
+        for strategy in compiled_strategies:
+            for data in (ints, floats):
+                result = strategy.sort(data)
+                assert result == sorted(data), f"{strategy.name} failed on numeric data"
+                assert type(result[0]) is type(data[0])
+    
+    @pytest.mark.parametrize("strategy,python_sort", [
+        (QuickSortStrategy(classical=True), '_quicksort3'),
+        (MergeSortStrategy(), '_mergesort'),
+        (HeapSortStrategy(), '_heapsort'),
+    ])
+    def test_numpy_used_without_numba(self, strategy: SortingStrategy, python_sort: str):
+        """Test that numeric lists fall back to NumPy's sort when Numba is missing."""
+        pytest.importorskip("numpy")
+        random.seed(42)
+        data = [random.randint(-10**6, 10**6) for _ in range(5000)]
+        
+        with patch('app.strategy.quicksort_strategy.HAS_NUMBA', False), \
+                patch('app.strategy.heapsort_strategy.HAS_NUMBA', False), \
+                patch.object(strategy, python_sort) as mock_python_sort:
+            assert strategy.sort(data) == sorted(data)
+        
+        mock_python_sort.assert_not_called()
+    
+    def test_mixed_types_use_python_path(self, compiled_strategies: List[SortingStrategy]):
+        """Test that mixed int/float data is not coerced to a single type."""
+        data = [3, 1.5] * 500
+        
+        for strategy in compiled_strategies:
+            result = strategy.sort(data)
+            assert result == sorted(data)
+            assert {type(x) for x in result} == {int, float}
+    
+    def test_oversized_ints_use_python_path(self, compiled_strategies: List[SortingStrategy]):
+        """Test that integers beyond 64 bits still sort correctly."""
+        data = [2**70 - i for i in range(1000)]
+        
+        for strategy in compiled_strategies:
+            assert strategy.sort(data) == sorted(data)
+    
+    def test_mixed_sign_oversized_ints_keep_exact_values(self, compiled_strategies: List[SortingStrategy]):
+        """Test that ints NumPy would infer as float64 are not rounded."""
+        data = [-1] + [2**63 + 2 * i + 1 for i in range(1000)]
+        
+        for strategy in compiled_strategies:
+            result = strategy.sort(data)
+            assert result == sorted(data), f"{strategy.name} changed values"
+            assert all(type(x) is int for x in result)
+
+
+class TestBitonicSort:
+    """Test the bitonic sorting network strategy."""
+    
+    @pytest.mark.parametrize("size", [2, 3, 7, 8, 9, 33, 64])
+    def test_lengths_are_padded_to_power_of_two(self, size: int):
+        """Test power-of-two and non-power-of-two lengths sort correctly."""
+        random.seed(size)
+        data = [random.randint(0, 10) for _ in range(size)]
+        
+        assert BitonicSortStrategy().sort(data) == sorted(data)
+    
+    def test_non_numeric_data(self):
+        """Test that non-numeric comparables go through the Python network."""
+        data = ["pear", "apple", "fig", "kiwi", "banana"]
+        assert BitonicSortStrategy().sort(data) == sorted(data)
+    
+    def test_numeric_data_keeps_element_types(self):
+        """Test the vectorized NumPy path on int and float lists."""
+        pytest.importorskip("numpy")
+        random.seed(42)
+        ints = [random.randint(-10**9, 10**9) for _ in range(1000)]
+        floats = [random.uniform(-1.0, 1.0) for _ in range(1000)]
+        
+        for data in (ints, floats):
+            result = BitonicSortStrategy().sort(data)
+            assert result == sorted(data)
+            assert type(result[0]) is type(data[0])
 
 
 class TestDataSorter:
@@ -174,16 +347,17 @@ class TestDataSorter:
     def test_default_strategy(self, sorter: DataSorter):
         """Test that DataSorter has a default strategy."""
         assert sorter.get_strategy() is not None
-        assert sorter.get_strategy().name == "QuickSort"
+        assert isinstance(sorter.get_strategy(), QuickSortStrategy)
+        assert sorter.get_strategy().name == "TimSort"
     
     def test_strategy_switching(self, sorter: DataSorter, sample_data: List[int]):
         """Test that strategies can be switched at runtime."""
         expected = sorted(sample_data)
         
-        # Test with QuickSort (default)
+        # Test with QuickSort (default, backed by the built-in TimSort)
         result1 = sorter.sort(sample_data)
         assert result1 == expected
-        assert sorter.get_strategy().name == "QuickSort"
+        assert sorter.get_strategy().name == "TimSort"
         
         # Switch to MergeSort
         sorter.set_strategy(MergeSortStrategy())
@@ -215,8 +389,55 @@ class TestDataSorter:
             assert key in info
             assert info[key] is not None
     
-    def test_sort_history_tracking(self, sorter: DataSorter, sample_data: List[int]):
+    @pytest.fixture
+    def tracking_sorter(self) -> DataSorter:
+        """DataSorter instance that records its sort history."""
+        return DataSorter(track_history=True)
+    
+    def test_algorithm_info_is_memoized(self, sorter: DataSorter):
+        """Test that the strategy memoizes a read-only mapping and sorters hand out copies."""
+        strategy_info = sorter.get_strategy().algorithm_info
+        info = sorter.get_algorithm_info()
+        
+        assert sorter.get_strategy().algorithm_info is strategy_info
+        with pytest.raises(TypeError):
+            strategy_info['name'] = 'Other'
+        
+        assert type(info) is dict and info == strategy_info
+        info['name'] = 'Other'
+        assert sorter.get_algorithm_info()['name'] == 'TimSort'
+    
+    def test_algorithm_info_is_serializable(self, sorter: DataSorter, sample_data: List[int]):
+        """Test that algorithm info in benchmark results can be deep-copied and JSON-encoded."""
+        info = sorter.benchmark_current_strategy(sample_data, runs=1)['complexity_info']
+        
+        assert copy.deepcopy(info) == info
+        assert json.loads(json.dumps(info)) == info
+    
+    def test_algorithm_info_shared_through_strategy_instances(self):
+        """Test that sorters using a shared strategy instance share its info mapping."""
+        first = DataSorter(MergeSortStrategy.instance()).get_strategy().algorithm_info
+        second = DataSorter(MergeSortStrategy.instance()).get_strategy().algorithm_info
+        
+        assert first is second
+        assert (DataSorter(QuickSortStrategy()).get_algorithm_info()['name']
+                != DataSorter(QuickSortStrategy(classical=True)).get_algorithm_info()['name'])
+    
+    def test_sort_history_disabled_by_default(self, sorter: DataSorter, sample_data: List[int]):
+        """Test that no history is recorded unless tracking is enabled."""
+        sorter.sort(sample_data)
+        assert sorter.get_sort_history() == []
+    
+    def test_sort_history_is_bounded(self, sample_data: List[int]):
+        """Test that only the most recent history entries are kept."""
+        sorter = DataSorter(track_history=True, history_size=2)
+        for _ in range(3):
+            sorter.sort(sample_data)
+        assert len(sorter.get_sort_history()) == 2
+    
+    def test_sort_history_tracking(self, tracking_sorter: DataSorter, sample_data: List[int]):
         """Test that sort history is tracked correctly."""
+        sorter = tracking_sorter
         assert len(sorter.get_sort_history()) == 0
         
         # Perform some sorts
@@ -228,17 +449,20 @@ class TestDataSorter:
         assert len(history) == 2
         
         # Check first entry
-        assert history[0]['algorithm'] == 'QuickSort'
+        assert history[0]['algorithm'] == 'TimSort'
         assert history[0]['input_size'] == len(sample_data)
         assert 'execution_time_seconds' in history[0]
         assert 'execution_time_ms' in history[0]
+        assert isinstance(history[0]['execution_time_ns'], int)
+        assert history[0]['execution_time_ms'] == history[0]['execution_time_ns'] / 1e6
         
         # Check second entry
         assert history[1]['algorithm'] == 'MergeSort'
         assert history[1]['input_size'] == len(sample_data)
     
-    def test_clear_history(self, sorter: DataSorter, sample_data: List[int]):
+    def test_clear_history(self, tracking_sorter: DataSorter, sample_data: List[int]):
         """Test that sort history can be cleared."""
+        sorter = tracking_sorter
         sorter.sort(sample_data)
         assert len(sorter.get_sort_history()) == 1
         
@@ -249,7 +473,7 @@ class TestDataSorter:
         """Test the benchmark functionality."""
         benchmark = sorter.benchmark_current_strategy(sample_data, runs=3)
         
-        assert benchmark['algorithm'] == 'QuickSort'
+        assert benchmark['algorithm'] == 'TimSort'
         assert benchmark['input_size'] == len(sample_data)
         assert benchmark['runs'] == 3
         assert 'average_time_ms' in benchmark
@@ -263,10 +487,195 @@ class TestDataSorter:
         result = sorter.benchmark_current_strategy([], runs=3)
         assert 'error' in result
     
+    def test_result_cache_reuses_sorted_result(self, sample_data: List[int]):
+        """Test that re-sorting identical data skips the strategy when caching."""
+        strategy = MergeSortStrategy()
+        sorter = DataSorter(strategy, cache_results=True)
+        first = sorter.sort(sample_data)
+        
+        with patch.object(strategy, 'sort', wraps=strategy.sort) as mock_sort:
+            second = sorter.sort(sample_data)
+            first.append(0)  # Cached results are handed out as copies
+            assert sorter.sort(sample_data) == sorted(sample_data)
+            
+            sample_data[0] = 100  # Edited input must miss the cache
+            assert sorter.sort(sample_data) == sorted(sample_data)
+        
+        assert second == sorted([64, 34, 25, 12, 22, 11, 90])
+        assert mock_sort.call_count == 1
+    
+    def test_result_cache_cleared_on_strategy_switch(self, sample_data: List[int]):
+        """Test that switching strategy invalidates the cached result."""
+        sorter = DataSorter(cache_results=True)
+        sorter.sort(sample_data)
+        
+        strategy = HeapSortStrategy()
+        sorter.set_strategy(strategy)
+        with patch.object(strategy, 'sort', wraps=strategy.sort) as mock_sort:
+            sorter.sort(sample_data)
+        
+        mock_sort.assert_called_once()
+    
+    def test_result_cache_with_history_tracking(self, sample_data: List[int]):
+        """Test that caching also applies when history is tracked, recording only real sorts."""
+        strategy = MergeSortStrategy()
+        sorter = DataSorter(strategy, track_history=True, cache_results=True)
+        sorter.sort(sample_data)
+        
+        with patch.object(strategy, 'sort', wraps=strategy.sort) as mock_sort:
+            assert sorter.sort(sample_data) == sorted(sample_data)
+        
+        mock_sort.assert_not_called()
+        assert len(sorter.get_sort_history()) == 1
+        
+        sorter.sort(sample_data[::-1])
+        assert len(sorter.get_sort_history()) == 2
+    
+    def test_benchmark_times_every_run_and_caches_result(self, sample_data: List[int]):
+        """Test that benchmark runs are never served from the cache."""
+        strategy = QuickSortStrategy()
+        sorter = DataSorter(strategy, cache_results=True)
+        sorter.sort(sample_data)
+        
+        run_inputs = []
+        sort_inplace = strategy._sort_inplace
+        
+        def record_input(arr: List[int]) -> None:
+            run_inputs.append(list(arr))
+            sort_inplace(arr)
+        
+        with patch.object(strategy, '_sort_inplace', side_effect=record_input):
+            sorter.benchmark_current_strategy(sample_data, runs=3)
+            assert sorter.sort(sample_data) == sorted(sample_data)
+        
+        # Each run starts from the original, unsorted input
+        assert run_inputs == [sample_data] * 3
+    
+    def test_benchmark_leaves_input_untouched(self, sorter: DataSorter, sample_data: List[int]):
+        """Test that benchmarking sorts a private buffer, not the caller's list."""
+        sorter.benchmark_current_strategy(sample_data, runs=3)
+        assert sample_data == [64, 34, 25, 12, 22, 11, 90]
+    
+    @pytest.mark.parametrize("strategy", [
+        QuickSortStrategy(),
+        QuickSortStrategy(classical=True),
+        MergeSortStrategy(),
+        HeapSortStrategy(),
+        InsertionSortStrategy(),
+        BitonicSortStrategy(),
+    ])
+    def test_array_buffer_sorts_ints(self, strategy: SortingStrategy):
+        """Test that every strategy sorts a packed array.array buffer."""
+        random.seed(42)
+        for size in (7, 300):
+            data = [random.randint(-2**40, 2**40) for _ in range(size)]
+            sorter = DataSorter(strategy, buffer_type='array')
+            
+            with patch('app.strategy.data_sorter.array', wraps=array) as mock_array:
+                result = sorter.sort(data)
+            
+            assert result == sorted(data), f"{strategy.name} failed on array buffer"
+            assert type(result) is list and all(type(x) is int for x in result)
+            mock_array.assert_called_once_with('q', data)
+    
+    @pytest.mark.parametrize("data", [
+        [3.5, 1.25, 2.0],
+        ["pear", "apple", "fig"],
+        [2**70, -1, 5],
+    ])
+    def test_array_buffer_falls_back_to_list(self, data: List):
+        """Test that data that does not fit a signed 64-bit array still sorts."""
+        sorter = DataSorter(HeapSortStrategy(), buffer_type='array')
+        assert sorter.sort(data) == sorted(data)
+    
+    def test_array_buffer_keeps_int_subclasses(self):
+        """Test that bools and IntEnum members come back as themselves, not plain ints."""
+        class Priority(IntEnum):
+            LOW = 1
+            HIGH = 2
+        
+        sorter = DataSorter(HeapSortStrategy(), cache_results=True, buffer_type='array')
+        
+        flags = sorter.sort([True, False, True])
+        assert flags == [False, True, True]
+        assert all(type(flag) is bool for flag in flags)
+        
+        priorities = [Priority.HIGH, Priority.LOW, 3]
+        result = sorter.sort(priorities)
+        assert result == [Priority.LOW, Priority.HIGH, 3]
+        assert result[0] is Priority.LOW and result[1] is Priority.HIGH
+        
+        sorter.benchmark_current_strategy(priorities, runs=2)
+        assert sorter._result_cache[1][0] is Priority.LOW
+    
+    def test_array_buffer_benchmark(self, sample_data: List[int]):
+        """Test that benchmarking in array mode sorts and caches a list result."""
+        sorter = DataSorter(MergeSortStrategy(), cache_results=True, buffer_type='array')
+        benchmark = sorter.benchmark_current_strategy(sample_data, runs=3)
+        
+        assert benchmark['runs'] == 3
+        assert sorter._result_cache[1] == sorted(sample_data)
+        assert sample_data == [64, 34, 25, 12, 22, 11, 90]
+    
+    def test_shared_strategy_instances(self):
+        """Test that instance() returns one object per class and options."""
+        assert HeapSortStrategy.instance() is HeapSortStrategy.instance()
+        assert MergeSortStrategy.instance() is not HeapSortStrategy.instance()
+        assert isinstance(MergeSortStrategy.instance(), MergeSortStrategy)
+        
+        classical = QuickSortStrategy.instance(classical=True)
+        assert classical is QuickSortStrategy.instance(classical=True)
+        assert classical is not QuickSortStrategy.instance()
+        assert classical.name == "QuickSort"
+        assert DataSorter().get_strategy() is QuickSortStrategy.instance()
+    
+    def test_invalid_buffer_type(self):
+        """Test that an unknown buffer type is rejected."""
+        with pytest.raises(ValueError, match="buffer_type"):
+            DataSorter(buffer_type='tuple')
+    
+    @pytest.mark.parametrize("data,memory_budget,expected", [
+        ([5, 3, 1], None, "InsertionSort"),
+        (list(range(1000)), None, "MergeSort"),
+        (list(range(1000, 0, -1)), None, "MergeSort"),
+        (list(range(1000)), 'tight', "MergeSort"),
+        ([(i * 7919) % 1000 for i in range(1000)], 'tight', "HeapSort"),
+        ([(i * 7919) % 1000 for i in range(1000)], None, "QuickSort"),
+    ])
+    def test_sort_auto_dispatch(self, sorter: DataSorter, data: List[int],
+                                memory_budget, expected: str):
+        """Test that sort_auto picks a strategy from the input's size and order."""
+        assert sorter.sort_auto(data, memory_budget) == sorted(data)
+        assert sorter.get_strategy().name == expected
+    
+    def test_sort_auto_reuses_strategy_instances(self, sorter: DataSorter):
+        """Test that repeated auto sorts keep the same strategy object."""
+        sorter.sort_auto(list(range(100)))
+        chosen = sorter.get_strategy()
+        sorter.sort_auto(list(range(200)))
+        
+        assert sorter.get_strategy() is chosen
+    
+    def test_sort_auto_caches_decision_by_length(self, sorter: DataSorter):
+        """Test that a same-length input reuses the cached choice without rescanning."""
+        sorter.sort_auto(list(range(100)))
+        shuffled = [(i * 37) % 100 for i in range(100)]
+        
+        with patch('app.strategy.data_sorter._longest_run_fraction') as mock_scan:
+            assert sorter.sort_auto(shuffled) == sorted(shuffled)
+        
+        mock_scan.assert_not_called()
+        assert sorter.get_strategy().name == "MergeSort"
+    
+    def test_sort_auto_with_none_data(self, sorter: DataSorter):
+        """Test that sort_auto rejects None like sort does."""
+        with pytest.raises(ValueError, match="Data cannot be None"):
+            sorter.sort_auto(None)
+    
     def test_string_representations(self, sorter: DataSorter):
         """Test string representations of DataSorter."""
         str_repr = str(sorter)
-        assert "QuickSort" in str_repr
+        assert "TimSort" in str_repr
         
         detailed_repr = repr(sorter)
         assert "DataSorter" in detailed_repr
@@ -332,7 +741,12 @@ class TestPerformanceComparison:
                   f"Worst: {info['time_complexity_worst']}")
             print(f"  Space Complexity: {info['space_complexity']}")
     
-    @pytest.mark.parametrize("strategy_class", [QuickSortStrategy, MergeSortStrategy, HeapSortStrategy])
+    @pytest.mark.parametrize("strategy_class", [
+        QuickSortStrategy,
+        lambda: QuickSortStrategy(classical=True),
+        MergeSortStrategy,
+        HeapSortStrategy
+    ])
     def test_sorting_correctness_with_various_inputs(self, strategy_class):
         """Test sorting correctness with various edge cases for each strategy."""
         strategy = strategy_class()